@@ -0,0 +1,62 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "./EasyTrack.sol";
+
+/// @author psirex
+/// @notice EasyTrack which logs only the hash of EVMScript on motion creation instead of
+/// the full EVMScript. EVMScript can be recreated off-chain from the EVMScript factory
+/// call data and verified against the logged hash
+contract CompactEasyTrack is EasyTrack {
+    // -------------
+    // EVENTS
+    // -------------
+    event MotionCreatedCompact(
+        uint256 indexed _motionId,
+        address _creator,
+        address indexed _evmScriptFactory,
+        bytes _evmScriptCallData,
+        bytes32 _evmScriptHash
+    );
+
+    // ------------
+    // CONSTRUCTOR
+    // ------------
+    constructor(
+        address _governanceToken,
+        address _admin,
+        uint256 _motionDuration,
+        uint256 _motionsCountLimit,
+        uint256 _objectionsThreshold
+    )
+        EasyTrack(
+            _governanceToken,
+            _admin,
+            _motionDuration,
+            _motionsCountLimit,
+            _objectionsThreshold
+        )
+    {}
+
+    // -------
+    // INTERNAL METHODS
+    // -------
+
+    function _emitMotionCreated(
+        uint256 _motionId,
+        address _evmScriptFactory,
+        bytes memory _evmScriptCallData,
+        bytes memory,
+        bytes32 _evmScriptHash
+    ) internal override {
+        emit MotionCreatedCompact(
+            _motionId,
+            msg.sender,
+            _evmScriptFactory,
+            _evmScriptCallData,
+            _evmScriptHash
+        );
+    }
+}
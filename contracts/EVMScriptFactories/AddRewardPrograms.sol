@@ -0,0 +1,108 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../TrustedCaller.sol";
+import "../RewardProgramsRegistry.sol";
+import "../libraries/EVMScriptCreator.sol";
+import "../interfaces/IEVMScriptFactory.sol";
+
+/// @author psirex
+/// @notice Creates EVMScript to add many reward program addresses to RewardProgramsRegistry at once
+contract AddRewardPrograms is TrustedCaller, IEVMScriptFactory {
+    // -------------
+    // ERRORS
+    // -------------
+    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
+    string private constant ERROR_EMPTY_DATA = "EMPTY_DATA";
+    string private constant ERROR_DUPLICATE_REWARD_PROGRAM = "DUPLICATE_REWARD_PROGRAM";
+    string private constant ERROR_REWARD_PROGRAM_ALREADY_ADDED = "REWARD_PROGRAM_ALREADY_ADDED";
+
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of RewardsProgramsRegistry
+    RewardProgramsRegistry public immutable rewardProgramsRegistry;
+
+    // -------------
+    // CONSTRUCTOR
+    // -------------
+
+    constructor(address _trustedCaller, address _rewardProgramsRegistry)
+        TrustedCaller(_trustedCaller)
+    {
+        rewardProgramsRegistry = RewardProgramsRegistry(_rewardProgramsRegistry);
+    }
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Creates EVMScript to add new reward programs addresses to RewardProgramsRegistry
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address[] _rewardPrograms, string[] _titles) where
+    /// _rewardPrograms - addresses of new reward programs
+    /// _titles - titles of corresponding reward programs
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        (address[] memory rewardPrograms, string[] memory titles) =
+            _decodeEVMScriptCallData(_evmScriptCallData);
+
+        _validateEVMScriptCallData(rewardPrograms, titles);
+
+        return
+            EVMScriptCreator.createEVMScript(
+                address(rewardProgramsRegistry),
+                rewardProgramsRegistry.addRewardPrograms.selector,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address[] _rewardPrograms, string[] _titles) where
+    /// _rewardPrograms - addresses of new reward programs
+    /// _titles - titles of corresponding reward programs
+    /// @return _rewardPrograms Addresses of new reward programs
+    /// @return _titles Titles of new reward programs
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (address[] memory _rewardPrograms, string[] memory _titles)
+    {
+        return _decodeEVMScriptCallData(_evmScriptCallData);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _validateEVMScriptCallData(address[] memory _rewardPrograms, string[] memory _titles)
+        private
+        view
+    {
+        require(_rewardPrograms.length == _titles.length, ERROR_LENGTH_MISMATCH);
+        require(_rewardPrograms.length > 0, ERROR_EMPTY_DATA);
+        bool[] memory areRewardPrograms = rewardProgramsRegistry.areRewardPrograms(_rewardPrograms);
+        for (uint256 i = 0; i < _rewardPrograms.length; ++i) {
+            require(!areRewardPrograms[i], ERROR_REWARD_PROGRAM_ALREADY_ADDED);
+            for (uint256 j = 0; j < i; ++j) {
+                require(_rewardPrograms[i] != _rewardPrograms[j], ERROR_DUPLICATE_REWARD_PROGRAM);
+            }
+        }
+    }
+
+    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        private
+        pure
+        returns (address[] memory _rewardPrograms, string[] memory _titles)
+    {
+        return abi.decode(_evmScriptCallData, (address[], string[]));
+    }
+}
@@ -0,0 +1,120 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../TrustedCaller.sol";
+import "../libraries/EVMScriptCreator.sol";
+import "../interfaces/IEVMScriptFactory.sol";
+import "./IncreaseNodeOperatorStakingLimit.sol";
+
+/// @author psirex
+/// @notice Creates EVMScript to increase staking limits of many node operators at once
+contract IncreaseNodeOperatorsStakingLimits is TrustedCaller, IEVMScriptFactory {
+    // -------------
+    // ERRORS
+    // -------------
+
+    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
+    string private constant ERROR_EMPTY_DATA = "EMPTY_DATA";
+    string private constant ERROR_NODE_OPERATORS_IDS_NOT_SORTED = "NODE_OPERATORS_IDS_NOT_SORTED";
+    string private constant ERROR_NODE_OPERATOR_DISABLED = "NODE_OPERATOR_DISABLED";
+    string private constant ERROR_STAKING_LIMIT_TOO_LOW = "STAKING_LIMIT_TOO_LOW";
+    string private constant ERROR_NOT_ENOUGH_SIGNING_KEYS = "NOT_ENOUGH_SIGNING_KEYS";
+
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of NodeOperatorsRegistry contract
+    INodeOperatorsRegistry public immutable nodeOperatorsRegistry;
+
+    // -------------
+    // CONSTRUCTOR
+    // -------------
+
+    constructor(address _trustedCaller, address _nodeOperatorsRegistry)
+        TrustedCaller(_trustedCaller)
+    {
+        nodeOperatorsRegistry = INodeOperatorsRegistry(_nodeOperatorsRegistry);
+    }
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Creates EVMScript to increase staking limits of node operators
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (uint256[] _nodeOperatorIds, uint256[] _stakingLimits) where
+    /// _nodeOperatorIds - ids of node operators in NodeOperatorsRegistry in strictly ascending order
+    /// _stakingLimits - new staking limits of corresponding node operators
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        (uint256[] memory nodeOperatorIds, uint256[] memory stakingLimits) =
+            _decodeEVMScriptCallData(_evmScriptCallData);
+
+        _validateEVMScriptCallData(nodeOperatorIds, stakingLimits);
+
+        bytes[] memory evmScriptsCalldata = new bytes[](nodeOperatorIds.length);
+        for (uint256 i = 0; i < nodeOperatorIds.length; ++i) {
+            evmScriptsCalldata[i] = abi.encode(nodeOperatorIds[i], stakingLimits[i]);
+        }
+        return
+            EVMScriptCreator.createEVMScript(
+                address(nodeOperatorsRegistry),
+                nodeOperatorsRegistry.setNodeOperatorStakingLimit.selector,
+                evmScriptsCalldata
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (uint256[] _nodeOperatorIds, uint256[] _stakingLimits) where
+    /// _nodeOperatorIds - ids of node operators in NodeOperatorsRegistry in strictly ascending order
+    /// _stakingLimits - new staking limits of corresponding node operators
+    /// @return _nodeOperatorIds Ids of node operators in NodeOperatorsRegistry
+    /// @return _stakingLimits New staking limits
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (uint256[] memory _nodeOperatorIds, uint256[] memory _stakingLimits)
+    {
+        return _decodeEVMScriptCallData(_evmScriptCallData);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        private
+        pure
+        returns (uint256[] memory _nodeOperatorIds, uint256[] memory _stakingLimits)
+    {
+        return abi.decode(_evmScriptCallData, (uint256[], uint256[]));
+    }
+
+    function _validateEVMScriptCallData(
+        uint256[] memory _nodeOperatorIds,
+        uint256[] memory _stakingLimits
+    ) private view {
+        require(_nodeOperatorIds.length == _stakingLimits.length, ERROR_LENGTH_MISMATCH);
+        require(_nodeOperatorIds.length > 0, ERROR_EMPTY_DATA);
+        for (uint256 i = 0; i < _nodeOperatorIds.length; ++i) {
+            require(
+                i == 0 || _nodeOperatorIds[i] > _nodeOperatorIds[i - 1],
+                ERROR_NODE_OPERATORS_IDS_NOT_SORTED
+            );
+            // _fullInfo == false skips copying of the node operator's name
+            (bool active, , , uint64 stakingLimit, , uint64 totalSigningKeys, ) =
+                nodeOperatorsRegistry.getNodeOperator(_nodeOperatorIds[i], false);
+            require(active, ERROR_NODE_OPERATOR_DISABLED);
+            require(stakingLimit < _stakingLimits[i], ERROR_STAKING_LIMIT_TOO_LOW);
+            require(totalSigningKeys >= _stakingLimits[i], ERROR_NOT_ENOUGH_SIGNING_KEYS);
+        }
+    }
+}
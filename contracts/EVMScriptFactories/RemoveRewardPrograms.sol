@@ -0,0 +1,94 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "../TrustedCaller.sol";
+import "../RewardProgramsRegistry.sol";
+import "../libraries/EVMScriptCreator.sol";
+import "../interfaces/IEVMScriptFactory.sol";
+
+/// @author psirex
+/// @notice Creates EVMScript to remove many reward programs from RewardProgramsRegistry at once
+contract RemoveRewardPrograms is TrustedCaller, IEVMScriptFactory {
+    // -------------
+    // ERRORS
+    // -------------
+    string private constant ERROR_EMPTY_DATA = "EMPTY_DATA";
+    string private constant ERROR_DUPLICATE_REWARD_PROGRAM = "DUPLICATE_REWARD_PROGRAM";
+    string private constant ERROR_REWARD_PROGRAM_NOT_FOUND = "REWARD_PROGRAM_NOT_FOUND";
+
+    // -------------
+    // VARIABLES
+    // -------------
+
+    /// @notice Address of RewardsProgramsRegistry
+    RewardProgramsRegistry public immutable rewardProgramsRegistry;
+
+    // -------------
+    // CONSTRUCTOR
+    // -------------
+
+    constructor(address _trustedCaller, address _rewardProgramsRegistry)
+        TrustedCaller(_trustedCaller)
+    {
+        rewardProgramsRegistry = RewardProgramsRegistry(_rewardProgramsRegistry);
+    }
+
+    // -------------
+    // EXTERNAL METHODS
+    // -------------
+
+    /// @notice Creates EVMScript to remove reward programs from RewardProgramsRegistry
+    /// @param _creator Address who creates EVMScript
+    /// @param _evmScriptCallData Encoded tuple: (address[] _rewardPrograms)
+    function createEVMScript(address _creator, bytes memory _evmScriptCallData)
+        external
+        view
+        override
+        onlyTrustedCaller(_creator)
+        returns (bytes memory)
+    {
+        _validateEVMScriptCallData(_decodeEVMScriptCallData(_evmScriptCallData));
+        return
+            EVMScriptCreator.createEVMScript(
+                address(rewardProgramsRegistry),
+                rewardProgramsRegistry.removeRewardPrograms.selector,
+                _evmScriptCallData
+            );
+    }
+
+    /// @notice Decodes call data used by createEVMScript method
+    /// @param _evmScriptCallData Encoded tuple: (address[] _rewardPrograms)
+    /// @return _rewardPrograms Addresses of reward programs to remove
+    function decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        external
+        pure
+        returns (address[] memory _rewardPrograms)
+    {
+        return _decodeEVMScriptCallData(_evmScriptCallData);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _validateEVMScriptCallData(address[] memory _rewardPrograms) private view {
+        require(_rewardPrograms.length > 0, ERROR_EMPTY_DATA);
+        bool[] memory areRewardPrograms = rewardProgramsRegistry.areRewardPrograms(_rewardPrograms);
+        for (uint256 i = 0; i < _rewardPrograms.length; ++i) {
+            require(areRewardPrograms[i], ERROR_REWARD_PROGRAM_NOT_FOUND);
+            for (uint256 j = 0; j < i; ++j) {
+                require(_rewardPrograms[i] != _rewardPrograms[j], ERROR_DUPLICATE_REWARD_PROGRAM);
+            }
+        }
+    }
+
+    function _decodeEVMScriptCallData(bytes memory _evmScriptCallData)
+        private
+        pure
+        returns (address[] memory)
+    {
+        return abi.decode(_evmScriptCallData, (address[]));
+    }
+}
@@ -110,12 +110,29 @@ contract TopUpRewardPrograms is TrustedCaller, IEVMScriptFactory {
     {
         require(_rewardPrograms.length == _amounts.length, ERROR_LENGTH_MISMATCH);
         require(_rewardPrograms.length > 0, ERROR_EMPTY_DATA);
+        bool[] memory areRewardPrograms = _areRewardPrograms(_rewardPrograms);
         for (uint256 i = 0; i < _rewardPrograms.length; ++i) {
             require(_amounts[i] > 0, ERROR_ZERO_AMOUNT);
-            require(
-                rewardProgramsRegistry.isRewardProgram(_rewardPrograms[i]),
-                ERROR_REWARD_PROGRAM_NOT_ALLOWED
-            );
+            require(areRewardPrograms[i], ERROR_REWARD_PROGRAM_NOT_ALLOWED);
+        }
+    }
+
+    /// @dev RewardProgramsRegistry deployed before areRewardPrograms method was added
+    /// has only isRewardProgram method, so reward programs are checked one by one in that case
+    function _areRewardPrograms(address[] memory _rewardPrograms)
+        private
+        view
+        returns (bool[] memory _areRewardPrograms)
+    {
+        try rewardProgramsRegistry.areRewardPrograms(_rewardPrograms) returns (
+            bool[] memory areRewardPrograms
+        ) {
+            return areRewardPrograms;
+        } catch {
+            _areRewardPrograms = new bool[](_rewardPrograms.length);
+            for (uint256 i = 0; i < _rewardPrograms.length; ++i) {
+                _areRewardPrograms[i] = rewardProgramsRegistry.isRewardProgram(_rewardPrograms[i]);
+            }
         }
     }
 
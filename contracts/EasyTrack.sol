@@ -9,6 +9,7 @@ import "./interfaces/IEVMScriptExecutor.sol";
 
 import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/security/Pausable.sol";
 import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/access/AccessControl.sol";
+import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/utils/math/SafeCast.sol";
 
 interface IMiniMeToken {
     function balanceOfAt(address _owner, uint256 _blockNumber) external pure returns (uint256);
@@ -31,6 +32,23 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         bytes32 evmScriptHash;
     }
 
+    // Representation of the motion in the storage. Packed into 4 slots:
+    // 1. evmScriptFactory, startDate, duration
+    // 2. creator, snapshotBlock, objectionsThreshold
+    // 3. id, objectionsAmount
+    // 4. evmScriptHash
+    struct PackedMotion {
+        address evmScriptFactory;
+        uint64 startDate;
+        uint32 duration;
+        address creator;
+        uint64 snapshotBlock;
+        uint16 objectionsThreshold;
+        uint64 id;
+        uint128 objectionsAmount;
+        bytes32 evmScriptHash;
+    }
+
     // -------------
     // EVENTS
     // -------------
@@ -82,8 +100,8 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     // STORAGE VARIABLES
     // ------------
 
-    /// @notice List of active motions
-    Motion[] public motions;
+    // List of active motions
+    PackedMotion[] internal packedMotions;
 
     // Id of the lastly created motion
     uint256 internal lastMotionId;
@@ -94,7 +112,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     /// @notice Address of current EVMScriptExecutor
     IEVMScriptExecutor public evmScriptExecutor;
 
-    // Position of the motion in the `motions` array, plus 1
+    // Position of the motion in the `packedMotions` array, plus 1
     // because index 0 means a value is not in the set.
     mapping(uint256 => uint256) internal motionIndicesByMotionId;
 
@@ -135,30 +153,36 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         whenNotPaused
         returns (uint256 _newMotionId)
     {
-        require(motions.length < motionsCountLimit, ERROR_MOTIONS_LIMIT_REACHED);
+        require(packedMotions.length < motionsCountLimit, ERROR_MOTIONS_LIMIT_REACHED);
 
-        Motion storage newMotion = motions.push();
         _newMotionId = ++lastMotionId;
-
-        newMotion.id = _newMotionId;
-        newMotion.creator = msg.sender;
-        newMotion.startDate = block.timestamp;
-        newMotion.snapshotBlock = block.number;
-        newMotion.duration = motionDuration;
-        newMotion.objectionsThreshold = objectionsThreshold;
-        newMotion.evmScriptFactory = _evmScriptFactory;
-        motionIndicesByMotionId[_newMotionId] = motions.length;
+        packedMotions.push(
+            PackedMotion({
+                evmScriptFactory: _evmScriptFactory,
+                startDate: SafeCast.toUint64(block.timestamp),
+                duration: SafeCast.toUint32(motionDuration),
+                creator: msg.sender,
+                snapshotBlock: SafeCast.toUint64(block.number),
+                objectionsThreshold: SafeCast.toUint16(objectionsThreshold),
+                id: SafeCast.toUint64(_newMotionId),
+                objectionsAmount: 0,
+                evmScriptHash: bytes32(0)
+            })
+        );
+        PackedMotion storage newMotion = packedMotions[packedMotions.length - 1];
+        motionIndicesByMotionId[_newMotionId] = packedMotions.length;
 
         bytes memory evmScript =
             _createEVMScript(_evmScriptFactory, msg.sender, _evmScriptCallData);
-        newMotion.evmScriptHash = keccak256(evmScript);
+        bytes32 evmScriptHash = keccak256(evmScript);
+        newMotion.evmScriptHash = evmScriptHash;
 
-        emit MotionCreated(
+        _emitMotionCreated(
             _newMotionId,
-            msg.sender,
             _evmScriptFactory,
             _evmScriptCallData,
-            evmScript
+            evmScript,
+            evmScriptHash
         );
     }
 
@@ -170,7 +194,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
         external
         whenNotPaused
     {
-        Motion storage motion = _getMotion(_motionId);
+        PackedMotion storage motion = _getMotion(_motionId);
         require(motion.startDate + motion.duration <= block.timestamp, ERROR_MOTION_NOT_PASSED);
 
         address creator = motion.creator;
@@ -189,31 +213,38 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     /// @notice Submits an objection from `governanceToken` holder.
     /// @param _motionId Id of motion to object
     function objectToMotion(uint256 _motionId) external {
-        Motion storage motion = _getMotion(_motionId);
-        require(!objections[_motionId][msg.sender], ERROR_ALREADY_OBJECTED);
-        objections[_motionId][msg.sender] = true;
+        PackedMotion storage motion = _getMotion(_motionId);
+        _setObjected(_motionId);
 
         uint256 snapshotBlock = motion.snapshotBlock;
         uint256 objectorBalance = governanceToken.balanceOfAt(msg.sender, snapshotBlock);
         require(objectorBalance > 0, ERROR_NOT_ENOUGH_BALANCE);
 
-        uint256 totalSupply = governanceToken.totalSupplyAt(snapshotBlock);
-        uint256 newObjectionsAmount = motion.objectionsAmount + objectorBalance;
-        uint256 newObjectionsAmountPct = (HUNDRED_PERCENT * newObjectionsAmount) / totalSupply;
-
-        emit MotionObjected(
+        _objectToMotion(
             _motionId,
-            msg.sender,
+            motion,
             objectorBalance,
-            newObjectionsAmount,
-            newObjectionsAmountPct
+            governanceToken.totalSupplyAt(snapshotBlock)
         );
+    }
 
-        if (newObjectionsAmountPct < motion.objectionsThreshold) {
-            motion.objectionsAmount = newObjectionsAmount;
-        } else {
-            _deleteMotion(_motionId);
-            emit MotionRejected(_motionId);
+    /// @notice Submits objections from `governanceToken` holder to all motions with given ids.
+    /// Balance of the objector and total supply are requested once for motions with the same snapshot block
+    /// @param _motionIds Ids of motions to object
+    function objectToMotions(uint256[] memory _motionIds) external {
+        uint256 snapshotBlock;
+        uint256 objectorBalance;
+        uint256 totalSupply;
+        for (uint256 i = 0; i < _motionIds.length; ++i) {
+            PackedMotion storage motion = _getMotion(_motionIds[i]);
+            _setObjected(_motionIds[i]);
+            if (i == 0 || motion.snapshotBlock != snapshotBlock) {
+                snapshotBlock = motion.snapshotBlock;
+                objectorBalance = governanceToken.balanceOfAt(msg.sender, snapshotBlock);
+                totalSupply = governanceToken.totalSupplyAt(snapshotBlock);
+            }
+            require(objectorBalance > 0, ERROR_NOT_ENOUGH_BALANCE);
+            _objectToMotion(_motionIds[i], motion, objectorBalance, totalSupply);
         }
     }
 
@@ -221,7 +252,7 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     /// @param _motionId Id of motion to cancel
     /// @dev Method reverts if it is called with not existed _motionId
     function cancelMotion(uint256 _motionId) external {
-        Motion storage motion = _getMotion(_motionId);
+        PackedMotion storage motion = _getMotion(_motionId);
         require(motion.creator == msg.sender, ERROR_NOT_CREATOR);
         _deleteMotion(_motionId);
         emit MotionCanceled(_motionId);
@@ -240,10 +271,10 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
 
     /// @notice Cancels all active motions
     function cancelAllMotions() external onlyRole(CANCEL_ROLE) {
-        uint256 motionsCount = motions.length;
+        uint256 motionsCount = packedMotions.length;
         while (motionsCount > 0) {
             motionsCount -= 1;
-            uint256 motionId = motions[motionsCount].id;
+            uint256 motionId = packedMotions[motionsCount].id;
             _deleteMotion(motionId);
             emit MotionCanceled(motionId);
         }
@@ -274,20 +305,75 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     /// @param _motionId Id of motion to check opportunity to object
     /// @param _objector Address of objector
     function canObjectToMotion(uint256 _motionId, address _objector) external view returns (bool) {
-        Motion storage motion = _getMotion(_motionId);
+        PackedMotion storage motion = _getMotion(_motionId);
         uint256 balance = governanceToken.balanceOfAt(_objector, motion.snapshotBlock);
         return balance > 0 && !objections[_motionId][_objector];
     }
 
     /// @notice Returns list of active motions
-    function getMotions() external view returns (Motion[] memory) {
-        return motions;
+    function getMotions() external view returns (Motion[] memory _motions) {
+        _motions = new Motion[](packedMotions.length);
+        for (uint256 i = 0; i < _motions.length; ++i) {
+            _motions[i] = _unpackMotion(packedMotions[i]);
+        }
     }
 
     /// @notice Returns motion with the given id
     /// @param _motionId Id of motion to retrieve
     function getMotion(uint256 _motionId) external view returns (Motion memory) {
-        return _getMotion(_motionId);
+        return _unpackMotion(_getMotion(_motionId));
+    }
+
+    /// @notice Returns active motion by its index in the list of active motions
+    /// @dev Has the same ABI as the getter of the public array of Motion structs
+    function motions(uint256 _index)
+        external
+        view
+        returns (
+            uint256 id,
+            address evmScriptFactory,
+            address creator,
+            uint256 duration,
+            uint256 startDate,
+            uint256 snapshotBlock,
+            uint256 objectionsThreshold,
+            uint256 objectionsAmount,
+            bytes32 evmScriptHash
+        )
+    {
+        PackedMotion storage motion = packedMotions[_index];
+        return (
+            motion.id,
+            motion.evmScriptFactory,
+            motion.creator,
+            motion.duration,
+            motion.startDate,
+            motion.snapshotBlock,
+            motion.objectionsThreshold,
+            motion.objectionsAmount,
+            motion.evmScriptHash
+        );
+    }
+
+    // -------
+    // INTERNAL METHODS
+    // -------
+
+    /// @dev Emits event about created motion. Might be overridden to log less data
+    function _emitMotionCreated(
+        uint256 _motionId,
+        address _evmScriptFactory,
+        bytes memory _evmScriptCallData,
+        bytes memory _evmScript,
+        bytes32
+    ) internal virtual {
+        emit MotionCreated(
+            _motionId,
+            msg.sender,
+            _evmScriptFactory,
+            _evmScriptCallData,
+            _evmScript
+        );
     }
 
     // -------
@@ -299,22 +385,75 @@ contract EasyTrack is Pausable, AccessControl, MotionSettings, EVMScriptFactorie
     // the array, and then remove the last element (sometimes called as 'swap and pop').
     function _deleteMotion(uint256 _motionId) private {
         uint256 index = motionIndicesByMotionId[_motionId] - 1;
-        uint256 lastIndex = motions.length - 1;
+        uint256 lastIndex = packedMotions.length - 1;
 
         if (index != lastIndex) {
-            Motion storage lastMotion = motions[lastIndex];
-            motions[index] = lastMotion;
+            PackedMotion storage lastMotion = packedMotions[lastIndex];
+            packedMotions[index] = lastMotion;
             motionIndicesByMotionId[lastMotion.id] = index + 1;
         }
 
-        motions.pop();
+        packedMotions.pop();
         delete motionIndicesByMotionId[_motionId];
     }
 
+    // Records the objection of msg.sender to motion with given id if it wasn't submitted yet
+    function _setObjected(uint256 _motionId) private {
+        require(!objections[_motionId][msg.sender], ERROR_ALREADY_OBJECTED);
+        objections[_motionId][msg.sender] = true;
+    }
+
+    // Adds balance of the objector to objections of the motion and rejects the motion
+    // when objections reach the threshold
+    function _objectToMotion(
+        uint256 _motionId,
+        PackedMotion storage _motion,
+        uint256 _objectorBalance,
+        uint256 _totalSupply
+    ) private {
+        uint256 newObjectionsAmount = _motion.objectionsAmount + _objectorBalance;
+        uint256 newObjectionsAmountPct = (HUNDRED_PERCENT * newObjectionsAmount) / _totalSupply;
+
+        emit MotionObjected(
+            _motionId,
+            msg.sender,
+            _objectorBalance,
+            newObjectionsAmount,
+            newObjectionsAmountPct
+        );
+
+        if (newObjectionsAmountPct < _motion.objectionsThreshold) {
+            _motion.objectionsAmount = SafeCast.toUint128(newObjectionsAmount);
+        } else {
+            _deleteMotion(_motionId);
+            emit MotionRejected(_motionId);
+        }
+    }
+
     // Returns motion with given id if it exists
-    function _getMotion(uint256 _motionId) private view returns (Motion storage) {
+    function _getMotion(uint256 _motionId) private view returns (PackedMotion storage) {
         uint256 _motionIndex = motionIndicesByMotionId[_motionId];
         require(_motionIndex > 0, ERROR_MOTION_NOT_FOUND);
-        return motions[_motionIndex - 1];
+        return packedMotions[_motionIndex - 1];
+    }
+
+    // Converts motion from the storage representation into the Motion struct
+    function _unpackMotion(PackedMotion storage _motion)
+        private
+        view
+        returns (Motion memory)
+    {
+        return
+            Motion({
+                id: _motion.id,
+                evmScriptFactory: _motion.evmScriptFactory,
+                creator: _motion.creator,
+                duration: _motion.duration,
+                startDate: _motion.startDate,
+                snapshotBlock: _motion.snapshotBlock,
+                objectionsThreshold: _motion.objectionsThreshold,
+                objectionsAmount: _motion.objectionsAmount,
+                evmScriptHash: _motion.evmScriptHash
+            });
     }
 }
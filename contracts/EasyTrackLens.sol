@@ -0,0 +1,112 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "./EasyTrack.sol";
+
+/// @author psirex
+/// @notice Stateless view-only contract which aggregates state of EasyTrack in a single call.
+/// Doesn't require deployment to be used: its runtime bytecode might be injected
+/// at any address with the state override of eth_call
+contract EasyTrackLens {
+    struct EVMScriptFactoryState {
+        address evmScriptFactory;
+        bytes permissions;
+    }
+
+    struct MotionState {
+        EasyTrack.Motion motion;
+        uint256 totalSupply;
+        uint256 objectionsAmountPct;
+        bool[] objections;
+        bool[] canObject;
+    }
+
+    struct EasyTrackState {
+        bool paused;
+        address governanceToken;
+        address evmScriptExecutor;
+        uint256 motionDuration;
+        uint256 motionsCountLimit;
+        uint256 objectionsThreshold;
+        EVMScriptFactoryState[] evmScriptFactories;
+        MotionState[] motions;
+    }
+
+    // -------------
+    // CONSTANTS
+    // -------------
+
+    // Stores 100% in basis points
+    uint256 internal constant HUNDRED_PERCENT = 10000;
+
+    // ------------------
+    // EXTERNAL METHODS
+    // ------------------
+
+    /// @notice Returns settings, pause state, EVMScript factories with permissions and active motions
+    /// of the EasyTrack. Objections flags of motions are returned for each of passed accounts
+    /// @param _easyTrack Address of EasyTrack contract
+    /// @param _accounts List of accounts to collect objections flags for
+    function getEasyTrackState(EasyTrack _easyTrack, address[] memory _accounts)
+        external
+        view
+        returns (EasyTrackState memory _state)
+    {
+        _state.paused = _easyTrack.paused();
+        _state.governanceToken = address(_easyTrack.governanceToken());
+        _state.evmScriptExecutor = address(_easyTrack.evmScriptExecutor());
+        _state.motionDuration = _easyTrack.motionDuration();
+        _state.motionsCountLimit = _easyTrack.motionsCountLimit();
+        _state.objectionsThreshold = _easyTrack.objectionsThreshold();
+        _state.evmScriptFactories = _getEVMScriptFactories(_easyTrack);
+        _state.motions = _getMotions(_easyTrack, _accounts);
+    }
+
+    // ------------------
+    // PRIVATE METHODS
+    // ------------------
+
+    function _getEVMScriptFactories(EasyTrack _easyTrack)
+        private
+        view
+        returns (EVMScriptFactoryState[] memory _factories)
+    {
+        address[] memory evmScriptFactories = _easyTrack.getEVMScriptFactories();
+        _factories = new EVMScriptFactoryState[](evmScriptFactories.length);
+        for (uint256 i = 0; i < evmScriptFactories.length; ++i) {
+            _factories[i].evmScriptFactory = evmScriptFactories[i];
+            _factories[i].permissions = _easyTrack.evmScriptFactoryPermissions(
+                evmScriptFactories[i]
+            );
+        }
+    }
+
+    function _getMotions(EasyTrack _easyTrack, address[] memory _accounts)
+        private
+        view
+        returns (MotionState[] memory _motions)
+    {
+        IMiniMeToken governanceToken = _easyTrack.governanceToken();
+        EasyTrack.Motion[] memory motions = _easyTrack.getMotions();
+        _motions = new MotionState[](motions.length);
+        for (uint256 i = 0; i < motions.length; ++i) {
+            MotionState memory motionState = _motions[i];
+            motionState.motion = motions[i];
+            motionState.totalSupply = governanceToken.totalSupplyAt(motions[i].snapshotBlock);
+            motionState.objectionsAmountPct = motionState.totalSupply == 0
+                ? 0
+                : (HUNDRED_PERCENT * motions[i].objectionsAmount) / motionState.totalSupply;
+            motionState.objections = new bool[](_accounts.length);
+            motionState.canObject = new bool[](_accounts.length);
+            for (uint256 j = 0; j < _accounts.length; ++j) {
+                bool objected = _easyTrack.objections(motions[i].id, _accounts[j]);
+                motionState.objections[j] = objected;
+                motionState.canObject[j] =
+                    !objected &&
+                    governanceToken.balanceOfAt(_accounts[j], motions[i].snapshotBlock) > 0;
+            }
+        }
+    }
+}
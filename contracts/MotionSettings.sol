@@ -35,6 +35,10 @@ contract MotionSettings is AccessControl {
     /// @notice Lower bound for motionDuration variable
     uint256 public constant MIN_MOTION_DURATION = 48 hours;
 
+    /// @notice Upper bound for motionDuration variable
+    /// @dev Duration of motion is stored in uint32 field
+    uint256 public constant MAX_MOTION_DURATION = type(uint32).max;
+
     /// ------------------
     /// STORAGE VARIABLES
     /// ------------------
@@ -91,6 +95,7 @@ contract MotionSettings is AccessControl {
 
     function _setMotionDuration(uint256 _motionDuration) internal {
         require(_motionDuration >= MIN_MOTION_DURATION, ERROR_VALUE_TOO_SMALL);
+        require(_motionDuration <= MAX_MOTION_DURATION, ERROR_VALUE_TOO_LARGE);
         motionDuration = _motionDuration;
         emit MotionDurationChanged(_motionDuration);
     }
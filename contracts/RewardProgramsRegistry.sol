@@ -26,6 +26,7 @@ contract RewardProgramsRegistry is AccessControl {
     // -------------
     string private constant ERROR_REWARD_PROGRAM_ALREADY_ADDED = "REWARD_PROGRAM_ALREADY_ADDED";
     string private constant ERROR_REWARD_PROGRAM_NOT_FOUND = "REWARD_PROGRAM_NOT_FOUND";
+    string private constant ERROR_LENGTH_MISMATCH = "LENGTH_MISMATCH";
 
     // -------------
     // VARIABLES
@@ -70,11 +71,20 @@ contract RewardProgramsRegistry is AccessControl {
         external
         onlyRole(ADD_REWARD_PROGRAM_ROLE)
     {
-        require(rewardProgramIndices[_rewardProgram] == 0, ERROR_REWARD_PROGRAM_ALREADY_ADDED);
+        _addRewardProgram(_rewardProgram, _title);
+    }
 
-        rewardPrograms.push(_rewardProgram);
-        rewardProgramIndices[_rewardProgram] = rewardPrograms.length;
-        emit RewardProgramAdded(_rewardProgram, _title);
+    /// @notice Adds addresses to list of allowed reward programs
+    /// @param _rewardPrograms Addresses of reward programs to add
+    /// @param _titles Titles of corresponding reward programs
+    function addRewardPrograms(address[] memory _rewardPrograms, string[] memory _titles)
+        external
+        onlyRole(ADD_REWARD_PROGRAM_ROLE)
+    {
+        require(_rewardPrograms.length == _titles.length, ERROR_LENGTH_MISMATCH);
+        for (uint256 i = 0; i < _rewardPrograms.length; ++i) {
+            _addRewardProgram(_rewardPrograms[i], _titles[i]);
+        }
     }
 
     /// @notice Removes address from list of allowed reward programs
@@ -84,18 +94,18 @@ contract RewardProgramsRegistry is AccessControl {
         external
         onlyRole(REMOVE_REWARD_PROGRAM_ROLE)
     {
-        uint256 index = _getRewardProgramIndex(_rewardProgram);
-        uint256 lastIndex = rewardPrograms.length - 1;
+        _removeRewardProgram(_rewardProgram);
+    }
 
-        if (index != lastIndex) {
-            address lastRewardProgram = rewardPrograms[lastIndex];
-            rewardPrograms[index] = lastRewardProgram;
-            rewardProgramIndices[lastRewardProgram] = index + 1;
+    /// @notice Removes addresses from list of allowed reward programs
+    /// @param _rewardPrograms Addresses of reward programs to remove
+    function removeRewardPrograms(address[] memory _rewardPrograms)
+        external
+        onlyRole(REMOVE_REWARD_PROGRAM_ROLE)
+    {
+        for (uint256 i = 0; i < _rewardPrograms.length; ++i) {
+            _removeRewardProgram(_rewardPrograms[i]);
         }
-
-        rewardPrograms.pop();
-        delete rewardProgramIndices[_rewardProgram];
-        emit RewardProgramRemoved(_rewardProgram);
     }
 
     /// @notice Returns if passed address are listed as reward program in the registry
@@ -103,6 +113,18 @@ contract RewardProgramsRegistry is AccessControl {
         return rewardProgramIndices[_maybeRewardProgram] > 0;
     }
 
+    /// @notice Returns if each of passed addresses is listed as reward program in the registry
+    function areRewardPrograms(address[] memory _maybeRewardPrograms)
+        external
+        view
+        returns (bool[] memory _areRewardPrograms)
+    {
+        _areRewardPrograms = new bool[](_maybeRewardPrograms.length);
+        for (uint256 i = 0; i < _maybeRewardPrograms.length; ++i) {
+            _areRewardPrograms[i] = rewardProgramIndices[_maybeRewardPrograms[i]] > 0;
+        }
+    }
+
     /// @notice Returns current list of reward programs
     function getRewardPrograms() external view returns (address[] memory) {
         return rewardPrograms;
@@ -112,6 +134,29 @@ contract RewardProgramsRegistry is AccessControl {
     // PRIVATE METHODS
     // ------------------
 
+    function _addRewardProgram(address _rewardProgram, string memory _title) private {
+        require(rewardProgramIndices[_rewardProgram] == 0, ERROR_REWARD_PROGRAM_ALREADY_ADDED);
+
+        rewardPrograms.push(_rewardProgram);
+        rewardProgramIndices[_rewardProgram] = rewardPrograms.length;
+        emit RewardProgramAdded(_rewardProgram, _title);
+    }
+
+    function _removeRewardProgram(address _rewardProgram) private {
+        uint256 index = _getRewardProgramIndex(_rewardProgram);
+        uint256 lastIndex = rewardPrograms.length - 1;
+
+        if (index != lastIndex) {
+            address lastRewardProgram = rewardPrograms[lastIndex];
+            rewardPrograms[index] = lastRewardProgram;
+            rewardProgramIndices[lastRewardProgram] = index + 1;
+        }
+
+        rewardPrograms.pop();
+        delete rewardProgramIndices[_rewardProgram];
+        emit RewardProgramRemoved(_rewardProgram);
+    }
+
     function _getRewardProgramIndex(address _evmScriptFactory)
         private
         view
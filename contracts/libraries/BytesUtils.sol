@@ -5,32 +5,27 @@ pragma solidity ^0.8.4;
 
 /// @author psirex
 /// @notice Contains methods to extract primitive types from bytes
+/// @dev Each method reads a single 32 bytes word starting from the given location.
+/// Bounds of the data aren't checked
 library BytesUtils {
     function bytes24At(bytes memory data, uint256 location) internal pure returns (bytes24 result) {
-        uint256 word = uint256At(data, location);
         assembly {
-            result := word
+            result := and(
+                mload(add(data, add(0x20, location))),
+                0xffffffffffffffffffffffffffffffffffffffffffffffff0000000000000000
+            )
         }
     }
 
     function addressAt(bytes memory data, uint256 location) internal pure returns (address result) {
-        uint256 word = uint256At(data, location);
         assembly {
-            result := shr(
-                96,
-                and(word, 0xffffffffffffffffffffffffffffffffffffffff000000000000000000000000)
-            )
+            result := shr(96, mload(add(data, add(0x20, location))))
         }
     }
 
     function uint32At(bytes memory _data, uint256 _location) internal pure returns (uint32 result) {
-        uint256 word = uint256At(_data, _location);
-
         assembly {
-            result := shr(
-                224,
-                and(word, 0xffffffff00000000000000000000000000000000000000000000000000000000)
-            )
+            result := shr(224, mload(add(_data, add(0x20, _location))))
         }
     }
 
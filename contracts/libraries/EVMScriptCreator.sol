@@ -10,6 +10,12 @@ library EVMScriptCreator {
     // Id of default CallsScript Aragon's executor.
     bytes4 private constant SPEC_ID = hex"00000001";
 
+    // Bytes size of SPEC_ID in EVMScript
+    uint256 private constant SPEC_ID_SIZE = 4;
+
+    // Bytes size of call's address, calldata length and method id in EVMScript
+    uint256 private constant CALL_HEADER_SIZE = 28;
+
     /// @notice Encodes one method call as EVMScript
     function createEVMScript(
         address _to,
@@ -32,18 +38,11 @@ library EVMScriptCreator {
         bytes4 _methodId,
         bytes[] memory _evmScriptCallData
     ) internal pure returns (bytes memory _evmScript) {
+        _evmScript = _allocateEVMScript(_evmScriptCallData);
+        uint256 location = SPEC_ID_SIZE;
         for (uint256 i = 0; i < _evmScriptCallData.length; ++i) {
-            _evmScript = bytes.concat(
-                _evmScript,
-                abi.encodePacked(
-                    _to,
-                    uint32(_evmScriptCallData[i].length) + 4,
-                    _methodId,
-                    _evmScriptCallData[i]
-                )
-            );
+            location = _writeCall(_evmScript, location, _to, _methodId, _evmScriptCallData[i]);
         }
-        _evmScript = bytes.concat(SPEC_ID, _evmScript);
     }
 
     /// @notice Encodes multiple calls to different methods within the same contract as EVMScript
@@ -54,18 +53,17 @@ library EVMScriptCreator {
     ) internal pure returns (bytes memory _evmScript) {
         require(_methodIds.length == _evmScriptCallData.length, "LENGTH_MISMATCH");
 
+        _evmScript = _allocateEVMScript(_evmScriptCallData);
+        uint256 location = SPEC_ID_SIZE;
         for (uint256 i = 0; i < _methodIds.length; ++i) {
-            _evmScript = bytes.concat(
+            location = _writeCall(
                 _evmScript,
-                abi.encodePacked(
-                    _to,
-                    uint32(_evmScriptCallData[i].length) + 4,
-                    _methodIds[i],
-                    _evmScriptCallData[i]
-                )
+                location,
+                _to,
+                _methodIds[i],
+                _evmScriptCallData[i]
             );
         }
-        _evmScript = bytes.concat(SPEC_ID, _evmScript);
     }
 
     /// @notice Encodes multiple calls to different contracts as EVMScript
@@ -77,17 +75,68 @@ library EVMScriptCreator {
         require(_to.length == _methodIds.length, "LENGTH_MISMATCH");
         require(_to.length == _evmScriptCallData.length, "LENGTH_MISMATCH");
 
+        _evmScript = _allocateEVMScript(_evmScriptCallData);
+        uint256 location = SPEC_ID_SIZE;
         for (uint256 i = 0; i < _to.length; ++i) {
-            _evmScript = bytes.concat(
+            location = _writeCall(
                 _evmScript,
-                abi.encodePacked(
-                    _to[i],
-                    uint32(_evmScriptCallData[i].length) + 4,
-                    _methodIds[i],
-                    _evmScriptCallData[i]
-                )
+                location,
+                _to[i],
+                _methodIds[i],
+                _evmScriptCallData[i]
             );
         }
-        _evmScript = bytes.concat(SPEC_ID, _evmScript);
+    }
+
+    // Allocates bytes of the total length of EVMScript with given calls
+    // and writes SPEC_ID into the first 4 bytes
+    function _allocateEVMScript(bytes[] memory _evmScriptCallData)
+        private
+        pure
+        returns (bytes memory _evmScript)
+    {
+        uint256 evmScriptLength = SPEC_ID_SIZE;
+        for (uint256 i = 0; i < _evmScriptCallData.length; ++i) {
+            evmScriptLength += CALL_HEADER_SIZE + _evmScriptCallData[i].length;
+        }
+        _evmScript = new bytes(evmScriptLength);
+        bytes4 specId = SPEC_ID;
+        assembly {
+            mstore(add(_evmScript, 0x20), specId)
+        }
+    }
+
+    // Writes the call (address, uint32 calldata length, bytes4 method id, calldata)
+    // into the _evmScript starting from _location. Returns location of the next call.
+    // Memory is written by whole words, so up to 31 bytes after the call might be overwritten.
+    // It's safe because calls are written in ascending order and _evmScript is the lastly allocated
+    // memory, but this method must not be used to write calls into an already filled EVMScript.
+    function _writeCall(
+        bytes memory _evmScript,
+        uint256 _location,
+        address _to,
+        bytes4 _methodId,
+        bytes memory _callData
+    ) private pure returns (uint256) {
+        uint256 callHeader =
+            (uint256(uint160(_to)) << 96) |
+                (uint256(uint32(_callData.length) + 4) << 64) |
+                (uint256(uint32(_methodId)) << 32);
+        assembly {
+            let dst := add(add(_evmScript, 0x20), _location)
+            mstore(dst, callHeader)
+            dst := add(dst, 28)
+            let src := add(_callData, 0x20)
+            let srcEnd := add(src, mload(_callData))
+            for {
+
+            } lt(src, srcEnd) {
+                src := add(src, 0x20)
+                dst := add(dst, 0x20)
+            } {
+                mstore(dst, mload(src))
+            }
+        }
+        return _location + CALL_HEADER_SIZE + _callData.length;
     }
 }
@@ -8,7 +8,9 @@ import "./BytesUtils.sol";
 /// @author psirex
 /// @notice Provides methods to convinient work with permissions bytes
 /// @dev Permissions - is a list of tuples (address, bytes4) encoded into a bytes representation.
-/// Each tuple (address, bytes4) describes a method allowed to be called by EVMScript
+/// Each tuple (address, bytes4) describes a method allowed to be called by EVMScript.
+/// When tuples are sorted in strictly ascending order, permissions are looked up with
+/// binary search. Unsorted permissions are looked up with linear search.
 library EVMScriptPermissions {
     using BytesUtils for bytes;
 
@@ -47,9 +49,14 @@ library EVMScriptPermissions {
             return false;
         }
 
+        bool isSorted = isSortedPermissions(_permissions);
         while (location < _evmScript.length) {
             (bytes24 methodToCall, uint32 callDataLength) = _getNextMethodId(_evmScript, location);
-            if (!_hasPermission(_permissions, methodToCall)) {
+            bool hasPermission =
+                isSorted
+                    ? _hasPermissionSorted(_permissions, methodToCall)
+                    : _hasPermission(_permissions, methodToCall);
+            if (!hasPermission) {
                 return false;
             }
             location += ADDRESS_SIZE + CALLDATA_LENGTH_SIZE + callDataLength;
@@ -62,17 +69,35 @@ library EVMScriptPermissions {
         return _permissions.length > 0 && _permissions.length % PERMISSION_SIZE == 0;
     }
 
+    /// @notice Returns if items of permissions are sorted in strictly ascending order.
+    /// Such permissions are looked up with binary search
+    function isSortedPermissions(bytes memory _permissions) internal pure returns (bool) {
+        uint256 location = PERMISSION_SIZE;
+        while (location < _permissions.length) {
+            if (
+                _permissions.bytes24At(location - PERMISSION_SIZE) >=
+                _permissions.bytes24At(location)
+            ) {
+                return false;
+            }
+            location += PERMISSION_SIZE;
+        }
+        return true;
+    }
+
     // Retrieves bytes24 which describes tuple (address, bytes4)
-    // from EVMScript starting from _location position
+    // from EVMScript starting from _location position.
+    // Address, calldata length and method selector take 28 bytes,
+    // so all of them are extracted from a single 32 bytes word
     function _getNextMethodId(bytes memory _evmScript, uint256 _location)
         private
         pure
         returns (bytes24, uint32)
     {
-        address recipient = _evmScript.addressAt(_location);
-        uint32 callDataLength = _evmScript.uint32At(_location + ADDRESS_SIZE);
-        uint32 functionSelector =
-            _evmScript.uint32At(_location + ADDRESS_SIZE + CALLDATA_LENGTH_SIZE);
+        uint256 word = _evmScript.uint256At(_location);
+        address recipient = address(uint160(word >> 96));
+        uint32 callDataLength = uint32(word >> 64);
+        uint32 functionSelector = uint32(word >> 32);
         return (bytes24(uint192(functionSelector)) | bytes20(recipient), callDataLength);
     }
 
@@ -92,4 +117,27 @@ library EVMScriptPermissions {
         }
         return false;
     }
+
+    // Validates that passed _methodToCall contained in permissions sorted in ascending order
+    function _hasPermissionSorted(bytes memory _permissions, bytes24 _methodToCall)
+        private
+        pure
+        returns (bool)
+    {
+        uint256 low = 0;
+        uint256 high = _permissions.length / PERMISSION_SIZE;
+        while (low < high) {
+            uint256 middle = (low + high) / 2;
+            bytes24 permission = _permissions.bytes24At(middle * PERMISSION_SIZE);
+            if (permission == _methodToCall) {
+                return true;
+            }
+            if (permission < _methodToCall) {
+                low = middle + 1;
+            } else {
+                high = middle;
+            }
+        }
+        return false;
+    }
 }
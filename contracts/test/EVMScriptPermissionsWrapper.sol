@@ -19,4 +19,8 @@ contract EVMScriptPermissionsWrapper {
     function isValidPermissions(bytes memory _permissions) external pure returns (bool) {
         return EVMScriptPermissions.isValidPermissions(_permissions);
     }
+
+    function isSortedPermissions(bytes memory _permissions) external pure returns (bool) {
+        return EVMScriptPermissions.isSortedPermissions(_permissions);
+    }
 }
@@ -0,0 +1,120 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+import "OpenZeppelin/openzeppelin-contracts@4.3.2/contracts/utils/math/SafeCast.sol";
+
+/// @author psirex
+/// @notice Helper contract storing motions in the layout used by EasyTrack before packing.
+///     Used to compare gas used by storage of motions with the packed layout
+contract UnpackedMotionsStorageHarness {
+    struct Motion {
+        uint256 id;
+        address evmScriptFactory;
+        address creator;
+        uint256 duration;
+        uint256 startDate;
+        uint256 snapshotBlock;
+        uint256 objectionsThreshold;
+        uint256 objectionsAmount;
+        bytes32 evmScriptHash;
+    }
+
+    Motion[] public motions;
+    uint256 public lastMotionId;
+    mapping(uint256 => uint256) internal motionIndicesByMotionId;
+
+    function createMotion(address _evmScriptFactory, bytes32 _evmScriptHash) external {
+        Motion storage newMotion = motions.push();
+        uint256 newMotionId = ++lastMotionId;
+
+        newMotion.id = newMotionId;
+        newMotion.creator = msg.sender;
+        newMotion.startDate = block.timestamp;
+        newMotion.snapshotBlock = block.number;
+        newMotion.duration = 48 hours;
+        newMotion.objectionsThreshold = 50;
+        newMotion.evmScriptFactory = _evmScriptFactory;
+        motionIndicesByMotionId[newMotionId] = motions.length;
+        newMotion.evmScriptHash = _evmScriptHash;
+    }
+
+    function objectToMotion(uint256 _motionId, uint256 _amount) external {
+        Motion storage motion = motions[motionIndicesByMotionId[_motionId] - 1];
+        motion.objectionsAmount += _amount;
+    }
+
+    function deleteMotion(uint256 _motionId) external {
+        uint256 index = motionIndicesByMotionId[_motionId] - 1;
+        uint256 lastIndex = motions.length - 1;
+
+        if (index != lastIndex) {
+            Motion storage lastMotion = motions[lastIndex];
+            motions[index] = lastMotion;
+            motionIndicesByMotionId[lastMotion.id] = index + 1;
+        }
+
+        motions.pop();
+        delete motionIndicesByMotionId[_motionId];
+    }
+}
+
+/// @author psirex
+/// @notice Helper contract storing motions in the packed layout of EasyTrack
+contract PackedMotionsStorageHarness {
+    struct PackedMotion {
+        address evmScriptFactory;
+        uint64 startDate;
+        uint32 duration;
+        address creator;
+        uint64 snapshotBlock;
+        uint16 objectionsThreshold;
+        uint64 id;
+        uint128 objectionsAmount;
+        bytes32 evmScriptHash;
+    }
+
+    PackedMotion[] public motions;
+    uint256 public lastMotionId;
+    mapping(uint256 => uint256) internal motionIndicesByMotionId;
+
+    function createMotion(address _evmScriptFactory, bytes32 _evmScriptHash) external {
+        uint256 newMotionId = ++lastMotionId;
+        motions.push(
+            PackedMotion({
+                evmScriptFactory: _evmScriptFactory,
+                startDate: SafeCast.toUint64(block.timestamp),
+                duration: SafeCast.toUint32(48 hours),
+                creator: msg.sender,
+                snapshotBlock: SafeCast.toUint64(block.number),
+                objectionsThreshold: SafeCast.toUint16(50),
+                id: SafeCast.toUint64(newMotionId),
+                objectionsAmount: 0,
+                evmScriptHash: bytes32(0)
+            })
+        );
+        PackedMotion storage newMotion = motions[motions.length - 1];
+        motionIndicesByMotionId[newMotionId] = motions.length;
+        newMotion.evmScriptHash = _evmScriptHash;
+    }
+
+    function objectToMotion(uint256 _motionId, uint256 _amount) external {
+        PackedMotion storage motion = motions[motionIndicesByMotionId[_motionId] - 1];
+        motion.objectionsAmount = SafeCast.toUint128(motion.objectionsAmount + _amount);
+    }
+
+    function deleteMotion(uint256 _motionId) external {
+        uint256 index = motionIndicesByMotionId[_motionId] - 1;
+        uint256 lastIndex = motions.length - 1;
+
+        if (index != lastIndex) {
+            PackedMotion storage lastMotion = motions[lastIndex];
+            motions[index] = lastMotion;
+            motionIndicesByMotionId[lastMotion.id] = index + 1;
+        }
+
+        motions.pop();
+        delete motionIndicesByMotionId[_motionId];
+    }
+}
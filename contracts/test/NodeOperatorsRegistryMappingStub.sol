@@ -0,0 +1,44 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+/// @notice Helper contract with stub implementation of NodeOperatorsRegistry which keeps
+/// staking limits of node operators in separate slots, like NodeOperatorsRegistry does
+contract NodeOperatorsRegistryMappingStub {
+    uint64 public constant INITIAL_STAKING_LIMIT = 200;
+    uint64 public constant TOTAL_SIGNING_KEYS = 400;
+
+    address public rewardAddress;
+    mapping(uint256 => uint64) public stakingLimits;
+
+    constructor(address _rewardAddress, uint256 _nodeOperatorsCount) {
+        rewardAddress = _rewardAddress;
+        for (uint256 i = 0; i < _nodeOperatorsCount; ++i) {
+            stakingLimits[i] = INITIAL_STAKING_LIMIT;
+        }
+    }
+
+    function getNodeOperator(uint256 _id, bool _fullInfo)
+        external
+        view
+        returns (
+            bool _active,
+            string memory _name,
+            address _rewardAddress,
+            uint64 _stakingLimit,
+            uint64 _stoppedValidators,
+            uint64 _totalSigningKeys,
+            uint64 _usedSigningKeys
+        )
+    {
+        _active = true;
+        _rewardAddress = rewardAddress;
+        _stakingLimit = stakingLimits[_id];
+        _totalSigningKeys = TOTAL_SIGNING_KEYS;
+    }
+
+    function setNodeOperatorStakingLimit(uint256 _id, uint64 _stakingLimit) external {
+        stakingLimits[_id] = _stakingLimit;
+    }
+}
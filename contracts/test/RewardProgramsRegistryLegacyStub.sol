@@ -0,0 +1,15 @@
+// SPDX-FileCopyrightText: 2021 Lido <info@lido.fi>
+// SPDX-License-Identifier: GPL-3.0
+
+pragma solidity ^0.8.4;
+
+/// @author psirex
+/// @notice Helper contract with the interface of RewardProgramsRegistry deployed
+///     before areRewardPrograms method was added
+contract RewardProgramsRegistryLegacyStub {
+    mapping(address => bool) public isRewardProgram;
+
+    function addRewardProgram(address _rewardProgram) external {
+        isRewardProgram[_rewardProgram] = true;
+    }
+}
@@ -20,6 +20,8 @@ def main():
     reward_programs_multisig = get_env("REWARD_PROGRAMS_MULTISIG")
     # address to grant PAUSE_ROLE (optional)
     pause_address = get_env("PAUSE_ADDRESS")
+    # log only hash of EVMScript in the event about created motion (optional)
+    compact_motion_created_event = get_env("COMPACT_MOTION_CREATED_EVENT", "false") == "true"
 
     print(f"Current network: {network.show_active()} (chain id: {chain.id})")
     print(f"Deployer: {deployer}")
@@ -35,6 +37,7 @@ def main():
     print(f"LEGO Committee Multisig: {lego_committee_multisig}")
     print(f"Reward Programs Multisig: {reward_programs_multisig}")
     print(f"Pause address: {pause_address}")
+    print(f"Compact MotionCreated event: {compact_motion_created_event}")
 
     print("Proceed? [y/n]: ")
 
@@ -55,6 +58,7 @@ def main():
         reward_programs_multisig=reward_programs_multisig,
         pause_address=pause_address,
         tx_params=tx_params,
+        compact_motion_created_event=compact_motion_created_event,
     )
 
 
@@ -65,6 +69,7 @@ def deploy_easy_tracks(
     reward_programs_multisig,
     pause_address,
     tx_params,
+    compact_motion_created_event=False,
 ):
     easy_track = deployment.deploy_easy_track(
         admin=tx_params["from"],
@@ -73,6 +78,7 @@ def deploy_easy_tracks(
         motions_count_limit=INITIAL_MOTIONS_COUNT_LIMIT,
         objections_threshold=INITIAL_OBJECTIONS_THRESHOLD,
         tx_params=tx_params,
+        compact_motion_created_event=compact_motion_created_event,
     )
     evm_script_executor = deployment.deploy_evm_script_executor(
         aragon_voting=lido_contracts.aragon.voting,
@@ -107,6 +113,16 @@ def deploy_easy_tracks(
         reward_programs_multisig=reward_programs_multisig,
         tx_params=tx_params,
     )
+    add_reward_programs = deployment.deploy_add_reward_programs(
+        reward_programs_registry=reward_programs_registry,
+        reward_programs_multisig=reward_programs_multisig,
+        tx_params=tx_params,
+    )
+    remove_reward_programs = deployment.deploy_remove_reward_programs(
+        reward_programs_registry=reward_programs_registry,
+        reward_programs_multisig=reward_programs_multisig,
+        tx_params=tx_params,
+    )
     top_up_reward_programs = deployment.deploy_top_up_reward_programs(
         finance=lido_contracts.aragon.finance,
         governance_token=lido_contracts.ldo,
@@ -125,6 +141,8 @@ def deploy_easy_tracks(
         increase_node_operator_staking_limit=increase_node_operators_staking_limit,
         lido_contracts=lido_contracts,
         tx_params=tx_params,
+        add_reward_programs=add_reward_programs,
+        remove_reward_programs=remove_reward_programs,
     )
 
     deployment.grant_roles(
@@ -149,4 +167,6 @@ def deploy_easy_tracks(
         add_reward_program,
         remove_reward_program,
         top_up_reward_programs,
+        add_reward_programs,
+        remove_reward_programs,
     )
@@ -0,0 +1,35 @@
+from brownie import accounts, network
+
+from utils import deployed_easy_track, log
+from utils.config import get_env, get_is_live, network_name
+from utils.motion_enactor import MotionEnactor
+
+
+def main():
+    netname = "goerli" if network_name().split("-")[0] == "goerli" else "mainnet"
+    easy_track = deployed_easy_track.contracts(network=netname).easy_track
+    enactor = accounts.load(get_env("ENACTOR")) if get_is_live() else accounts[0]
+
+    tx_params = {}
+    if get_is_live():
+        tx_params["priority_fee"] = get_env("PRIORITY_FEE", "2 gwei")
+        tx_params["max_fee"] = get_env("MAX_FEE", "300 gwei")
+
+    log.nb("Current network", network.show_active(), color_hl=log.color_magenta)
+    log.ok("EasyTrack", easy_track)
+    log.ok("Enactor", enactor)
+
+    start_block = get_env("START_BLOCK", "")
+    if start_block:
+        start_block = int(start_block)
+    else:
+        start_block = deployed_easy_track.deployment_block(easy_track.address)
+    log.ok("Start block", start_block)
+
+    motion_enactor = MotionEnactor(
+        easy_track=easy_track,
+        sender=enactor,
+        start_block=start_block,
+        tx_params=tx_params,
+    )
+    motion_enactor.run(poll_interval=float(get_env("POLL_INTERVAL", "1")))
@@ -0,0 +1,51 @@
+import time
+
+from brownie import accounts, EasyTrack, EVMScriptExecutorStub, EVMScriptFactoryStub
+
+from utils import lido, log
+from utils.config import get_env, get_is_live
+from utils.easy_track_fuzzer import EasyTrackFuzzer
+
+MIN_MOTION_DURATION = 48 * 60 * 60
+MAX_MOTIONS_LIMIT = 24
+DEFAULT_OBJECTIONS_THRESHOLD = 50
+
+
+def main():
+    if get_is_live():
+        raise EnvironmentError("Fuzzing must be run on the development network")
+
+    seed = int(get_env("FUZZ_SEED", "0"))
+    duration = float(get_env("FUZZ_DURATION", "3600"))
+    blocks_count = int(get_env("FUZZ_BLOCKS", "50"))
+    block_size = int(get_env("FUZZ_BLOCK_SIZE", "16"))
+
+    owner, creators, objectors = accounts[0], accounts[1:4], accounts[4:8]
+    contracts = lido.contracts()
+    ldo = contracts.ldo
+    for objector in objectors[:-1]:
+        ldo.transfer(objector, ldo.totalSupply() // 500, {"from": contracts.aragon.agent})
+
+    evm_script_factory_stub = owner.deploy(EVMScriptFactoryStub)
+    easy_track = owner.deploy(
+        EasyTrack,
+        ldo,
+        owner,
+        MIN_MOTION_DURATION,
+        MAX_MOTIONS_LIMIT,
+        DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    easy_track.setEVMScriptExecutor(owner.deploy(EVMScriptExecutorStub), {"from": owner})
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub, evm_script_factory_stub.DEFAULT_PERMISSIONS(), {"from": owner}
+    )
+    fuzzer = EasyTrackFuzzer(
+        easy_track, evm_script_factory_stub, ldo, owner, creators, objectors
+    )
+
+    started_at = time.time()
+    while time.time() - started_at < duration:
+        stats = fuzzer.run(seed, blocks_count=blocks_count, block_size=block_size)
+        rate = stats.transactions / (time.time() - started_at)
+        log.ok(f"Seed {seed}", f"{stats.transactions} transactions ({rate:.0f} tx/s)")
+        seed += 1
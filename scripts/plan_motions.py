@@ -0,0 +1,19 @@
+import json
+
+from utils import deployed_easy_track
+from utils.config import get_env, network_name
+from utils.evm_script_factories import factory_names
+from utils.motions_scheduler import MotionsScheduler, PendingOperation
+
+
+def main():
+    netname = "goerli" if network_name().split("-")[0] == "goerli" else "mainnet"
+    easy_track = deployed_easy_track.contracts(network=netname).easy_track
+
+    with open(get_env("BACKLOG_FILE")) as file:
+        backlog = json.load(file)
+    operations = [PendingOperation(item["factory"], tuple(item["args"])) for item in backlog]
+
+    scheduler = MotionsScheduler(factory_names(netname))
+    schedule = scheduler.plan_live(easy_track, operations)
+    print(json.dumps(schedule.as_dict(), indent=2))
@@ -0,0 +1,49 @@
+import json
+
+from brownie import accounts, TopUpRewardPrograms
+
+from utils import deployed_easy_track
+from utils.config import get_env, get_is_live
+from utils.top_up_planner import (
+    DEFAULT_MEASURED_SIZES,
+    measure_top_up_gas,
+    plan_top_up_motions,
+    read_payouts_csv,
+)
+
+
+def main():
+    if get_is_live():
+        raise EnvironmentError("Gas must be measured on the development network")
+
+    payouts = read_payouts_csv(get_env("PAYOUTS_CSV"))
+    gas_ceiling = int(get_env("GAS_CEILING", "5000000"))
+    contracts = deployed_easy_track.contracts()
+    top_up_factory = TopUpRewardPrograms.at(
+        get_env("TOP_UP_FACTORY", contracts.reward_programs.top_up_reward_programs.address)
+    )
+    trusted_caller = accounts.at(top_up_factory.trustedCaller(), force=True)
+
+    # payouts are measured with the max amount to not underestimate the cost of call data
+    sizes = sorted({min(size, len(payouts)) for size in DEFAULT_MEASURED_SIZES})
+    gas_model = measure_top_up_gas(
+        contracts.easy_track,
+        top_up_factory,
+        trusted_caller,
+        [recipient for recipient, _ in payouts],
+        sizes,
+        amount=max(amount for _, amount in payouts),
+    )
+    planned = plan_top_up_motions(payouts, gas_model, gas_ceiling)
+    print(
+        json.dumps(
+            {
+                "gas_model": {
+                    "create_motion": gas_model.create_motion._asdict(),
+                    "enact_motion": gas_model.enact_motion._asdict(),
+                },
+                "motions": [motion._asdict() for motion in planned],
+            },
+            indent=2,
+        )
+    )
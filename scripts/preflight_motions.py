@@ -0,0 +1,23 @@
+import json
+import time
+
+from utils import deployed_easy_track, log
+from utils.config import get_env, get_is_live
+from utils.motions_preflight import CandidateMotion, preflight_motions
+
+
+def main():
+    if get_is_live():
+        raise EnvironmentError("Motions must be simulated on the development network")
+
+    with open(get_env("MOTIONS_FILE")) as file:
+        candidates = [
+            CandidateMotion(item["factory"], item["evm_script_call_data"], item["creator"])
+            for item in json.load(file)
+        ]
+    easy_track = deployed_easy_track.contracts().easy_track
+
+    started_at = time.time()
+    results = preflight_motions(easy_track, candidates)
+    log.ok(f"Simulated {len(results)} motions", f"{time.time() - started_at:.1f} s")
+    print(json.dumps([result.as_dict() for result in results], indent=2))
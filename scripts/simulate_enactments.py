@@ -0,0 +1,36 @@
+import json
+
+from brownie import accounts
+
+from utils import deployed_easy_track, lido
+from utils.config import get_env, get_is_live
+from utils.enactment_simulator import EnactmentSimulator
+
+
+def main():
+    if get_is_live():
+        raise EnvironmentError("Enactments must be simulated on the development network")
+
+    easy_track = deployed_easy_track.contracts().easy_track
+    contracts = lido.contracts()
+    labels = {
+        contract.address.lower(): name
+        for name, contract in [
+            ("EasyTrack", easy_track),
+            ("Aragon Voting", contracts.aragon.voting),
+            ("Aragon Agent", contracts.aragon.agent),
+            ("Aragon Finance", contracts.aragon.finance),
+            ("LDO", contracts.ldo),
+            ("NodeOperatorsRegistry", contracts.node_operators_registry),
+        ]
+    }
+
+    start_block = get_env("START_BLOCK", "")
+    if start_block:
+        start_block = int(start_block)
+    else:
+        start_block = deployed_easy_track.deployment_block(easy_track.address)
+
+    simulator = EnactmentSimulator(easy_track, accounts[0], start_block=start_block)
+    effects = simulator.simulate()
+    print(json.dumps([motion_effects.as_dict(labels) for motion_effects in effects], indent=2))
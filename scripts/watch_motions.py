@@ -0,0 +1,55 @@
+import asyncio
+
+from web3 import Web3
+
+from utils import deployed_easy_track
+from utils.config import get_env
+from utils.evm_script_factories import factory_names
+from utils.motion_watcher import (
+    FileSink,
+    MotionWatcher,
+    NetworkWatcher,
+    StdoutSink,
+    WebhookSink,
+)
+
+
+def parse_networks(networks):
+    result = {}
+    for item in networks.split(";"):
+        name, rpc_url = item.split("=", 1)
+        result[name.strip()] = rpc_url.strip()
+    return result
+
+
+def create_motion_watcher(networks, alerts_file=None, webhook_url=None):
+    network_watchers = [
+        NetworkWatcher(
+            network=name,
+            web3=Web3(Web3.HTTPProvider(rpc_url)),
+            easy_track_address=deployed_easy_track.addresses(name).easy_track,
+            factory_names=factory_names(name),
+        )
+        for name, rpc_url in networks.items()
+    ]
+    sinks = [StdoutSink()]
+    if alerts_file:
+        sinks.append(FileSink(alerts_file))
+    if webhook_url:
+        sinks.append(WebhookSink(webhook_url))
+    return MotionWatcher(
+        network_watchers,
+        sinks,
+        poll_interval=int(get_env("POLL_INTERVAL", "12")),
+        metrics_interval=int(get_env("METRICS_INTERVAL", "60")),
+    )
+
+
+def main():
+    networks = parse_networks(get_env("WATCH_NETWORKS"))
+    motion_watcher = create_motion_watcher(
+        networks,
+        alerts_file=get_env("ALERTS_FILE", ""),
+        webhook_url=get_env("WEBHOOK_URL", ""),
+    )
+    asyncio.run(motion_watcher.run())
@@ -0,0 +1,32 @@
+import os
+
+import pytest
+
+from utils.config import get_env
+from utils.gas_benchmark import DEFAULT_TOLERANCE, GasBaseline
+
+
+@pytest.fixture(scope="session")
+def gas_baseline():
+    baseline = GasBaseline(
+        get_env("GAS_BASELINE_FILE", os.path.join(os.path.dirname(__file__), "gas_baseline.json")),
+        tolerance=float(get_env("GAS_REGRESSION_TOLERANCE", str(DEFAULT_TOLERANCE))),
+        update=get_env("GAS_BASELINE_UPDATE", "false") == "true",
+    )
+    yield baseline
+    baseline.save()
+
+
+@pytest.fixture
+def record_gas(gas_baseline):
+    if not gas_baseline.exists and not gas_baseline.update:
+        pytest.skip(
+            f"Gas baseline {gas_baseline.path} doesn't exist. "
+            "Run benchmarks with GAS_BASELINE_UPDATE=true to generate it"
+        )
+
+    def method(name, tx):
+        regression = gas_baseline.record(name, tx.gas_used)
+        assert regression is None, f"Gas regression: {regression}"
+
+    return method
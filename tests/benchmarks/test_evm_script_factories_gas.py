@@ -0,0 +1,185 @@
+import pytest
+from brownie import EasyTrack, EVMScriptExecutor, chain
+from eth_abi import encode_single
+
+import constants
+from utils.deployment import create_permission
+from utils.evm_script import encode_call_script
+from utils.lido import create_voting, execute_voting
+
+REWARD_PROGRAMS = ["0x" + format(0x1000 + index, "040x") for index in range(25)]
+ITEMS_COUNTS = [1, 10, 25]
+
+# EVMScript factories with numbers of items in their motions
+BENCHMARKS = [
+    ("AddRewardProgram", 1),
+    ("RemoveRewardProgram", 1),
+    ("IncreaseNodeOperatorStakingLimit", 1),
+] + [
+    (name, items_count)
+    for name in [
+        "AddRewardPrograms",
+        "RemoveRewardPrograms",
+        "TopUpRewardPrograms",
+        "TopUpLegoProgram",
+        "IncreaseNodeOperatorsStakingLimits",
+    ]
+    for items_count in ITEMS_COUNTS
+]
+
+
+class FactoriesSetup:
+    def __init__(self, easy_track, reward_programs_registry, factories, ldo):
+        self.easy_track = easy_track
+        self.reward_programs_registry = reward_programs_registry
+        self.factories = factories
+        self.ldo = ldo
+
+
+@pytest.fixture(scope="module")
+def factories_setup(
+    owner,
+    voting,
+    agent,
+    node_operator,
+    lego_program,
+    ldo,
+    finance,
+    acl,
+    calls_script,
+    NodeOperatorsRegistryMappingStub,
+    RewardProgramsRegistry,
+    AddRewardProgram,
+    AddRewardPrograms,
+    RemoveRewardProgram,
+    RemoveRewardPrograms,
+    TopUpRewardPrograms,
+    TopUpLegoProgram,
+    IncreaseNodeOperatorStakingLimit,
+    IncreaseNodeOperatorsStakingLimits,
+):
+    easy_track = owner.deploy(
+        EasyTrack,
+        ldo,
+        owner,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    evm_script_executor = owner.deploy(EVMScriptExecutor, calls_script, easy_track)
+    easy_track.setEVMScriptExecutor(evm_script_executor, {"from": owner})
+    # every node operator has its own staking limit slot, so each item of the motion
+    # writes a cold slot, as in NodeOperatorsRegistry
+    node_operators_registry = owner.deploy(
+        NodeOperatorsRegistryMappingStub, node_operator, max(ITEMS_COUNTS) + 1
+    )
+    registry = owner.deploy(
+        RewardProgramsRegistry,
+        voting,
+        [voting, evm_script_executor],
+        [voting, evm_script_executor],
+    )
+
+    factories = {
+        "AddRewardProgram": (
+            owner.deploy(AddRewardProgram, owner, registry),
+            create_permission(registry, "addRewardProgram"),
+        ),
+        "AddRewardPrograms": (
+            owner.deploy(AddRewardPrograms, owner, registry),
+            create_permission(registry, "addRewardPrograms"),
+        ),
+        "RemoveRewardProgram": (
+            owner.deploy(RemoveRewardProgram, owner, registry),
+            create_permission(registry, "removeRewardProgram"),
+        ),
+        "RemoveRewardPrograms": (
+            owner.deploy(RemoveRewardPrograms, owner, registry),
+            create_permission(registry, "removeRewardPrograms"),
+        ),
+        "TopUpRewardPrograms": (
+            owner.deploy(TopUpRewardPrograms, owner, registry, finance, ldo),
+            create_permission(finance, "newImmediatePayment"),
+        ),
+        "TopUpLegoProgram": (
+            owner.deploy(TopUpLegoProgram, owner, finance, lego_program),
+            create_permission(finance, "newImmediatePayment"),
+        ),
+        "IncreaseNodeOperatorStakingLimit": (
+            owner.deploy(IncreaseNodeOperatorStakingLimit, node_operators_registry),
+            create_permission(node_operators_registry, "setNodeOperatorStakingLimit"),
+        ),
+        "IncreaseNodeOperatorsStakingLimits": (
+            owner.deploy(IncreaseNodeOperatorsStakingLimits, owner, node_operators_registry),
+            create_permission(node_operators_registry, "setNodeOperatorStakingLimit"),
+        ),
+    }
+    for factory, permissions in factories.values():
+        easy_track.addEVMScriptFactory(factory, permissions, {"from": owner})
+
+    voting_id, _ = create_voting(
+        evm_script=encode_call_script(
+            [
+                (
+                    acl.address,
+                    acl.grantPermission.encode_input(
+                        evm_script_executor, finance, finance.CREATE_PAYMENTS_ROLE()
+                    ),
+                ),
+            ]
+        ),
+        description="Grant permissions to EVMScriptExecutor to make payments",
+        tx_params={"from": agent},
+    )
+    execute_voting(voting_id)
+
+    return FactoriesSetup(
+        easy_track, registry, {name: factory for name, (factory, _) in factories.items()}, ldo
+    )
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("name,items_count", BENCHMARKS)
+def test_evm_script_factory_motion_gas(
+    owner, node_operator, voting, factories_setup, record_gas, name, items_count
+):
+    "Must not use more gas on creation and enactment of the factory motion than the baseline"
+    easy_track = factories_setup.easy_track
+    reward_programs = REWARD_PROGRAMS[:items_count]
+    titles = ["Reward Program"] * items_count
+    if name in {"RemoveRewardProgram", "RemoveRewardPrograms", "TopUpRewardPrograms"}:
+        factories_setup.reward_programs_registry.addRewardPrograms(
+            reward_programs, titles, {"from": voting}
+        )
+
+    creator = owner
+    if name == "AddRewardProgram":
+        call_data = encode_single("(address,string)", [reward_programs[0], titles[0]])
+    elif name == "AddRewardPrograms":
+        call_data = encode_single("(address[],string[])", [reward_programs, titles])
+    elif name == "RemoveRewardProgram":
+        call_data = encode_single("(address)", [reward_programs[0]])
+    elif name == "RemoveRewardPrograms":
+        call_data = encode_single("(address[])", [reward_programs])
+    elif name == "TopUpRewardPrograms":
+        call_data = encode_single("(address[],uint256[])", [reward_programs, [1] * items_count])
+    elif name == "TopUpLegoProgram":
+        tokens = [factories_setup.ldo.address] * items_count
+        call_data = encode_single("(address[],uint256[])", [tokens, [1] * items_count])
+    elif name == "IncreaseNodeOperatorStakingLimit":
+        creator = node_operator
+        call_data = encode_single("(uint256,uint256)", [1, 300])
+    else:
+        node_operator_ids = list(range(1, items_count + 1))
+        call_data = encode_single("(uint256[],uint256[])", [node_operator_ids, [300] * items_count])
+
+    create_tx = easy_track.createMotion(
+        factories_setup.factories[name], call_data, {"from": creator}
+    )
+    record_gas(f"createMotion/{name}/items={items_count}", create_tx)
+
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+    enact_tx = easy_track.enactMotion(
+        create_tx.events["MotionCreated"]["_motionId"], call_data, {"from": owner}
+    )
+    record_gas(f"enactMotion/{name}/items={items_count}", enact_tx)
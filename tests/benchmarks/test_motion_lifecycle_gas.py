@@ -0,0 +1,111 @@
+import pytest
+from brownie import chain
+
+import constants
+
+ACTIVE_MOTIONS = [1, constants.MAX_MOTIONS_LIMIT // 2, constants.MAX_MOTIONS_LIMIT]
+PERMISSIONS_LENGTHS = [1, 8, 32]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def add_evm_script_factory(easy_track, evm_script_factory_stub, voting):
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+
+
+@pytest.fixture(scope="module")
+def create_motions(owner, easy_track, evm_script_factory_stub):
+    def method(count):
+        return [
+            easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner}).events[
+                "MotionCreated"
+            ]["_motionId"]
+            for _ in range(count)
+        ]
+
+    return method
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("permissions_length", PERMISSIONS_LENGTHS)
+@pytest.mark.parametrize("active_motions", [0, constants.MAX_MOTIONS_LIMIT - 1])
+def test_create_motion_gas(
+    owner,
+    voting,
+    easy_track,
+    create_motions,
+    record_gas,
+    EVMScriptFactoryStub,
+    permissions_length,
+    active_motions,
+):
+    "Must not use more gas on motion creation than the baseline"
+    factory = owner.deploy(EVMScriptFactoryStub)
+    easy_track.addEVMScriptFactory(
+        factory, permissions_of_length(factory, permissions_length), {"from": voting}
+    )
+    create_motions(active_motions)
+    tx = easy_track.createMotion(factory, b"", {"from": owner})
+    record_gas(
+        f"createMotion/permissions={permissions_length}/active_motions={active_motions}", tx
+    )
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("active_motions", ACTIVE_MOTIONS)
+def test_object_to_motion_gas(
+    ldo_holders, easy_track, create_motions, record_gas, distribute_holder_balance, active_motions
+):
+    "Must not use more gas on objection than the baseline"
+    motion_ids = create_motions(active_motions)
+    tx = easy_track.objectToMotion(motion_ids[-1], {"from": ldo_holders[0]})
+    record_gas(f"objectToMotion/active_motions={active_motions}", tx)
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("active_motions", ACTIVE_MOTIONS)
+def test_cancel_motion_gas(owner, easy_track, create_motions, record_gas, active_motions):
+    "Must not use more gas on motion cancel than the baseline"
+    motion_ids = create_motions(active_motions)
+    # the first motion is replaced with the last one in the list of active motions
+    tx = easy_track.cancelMotion(motion_ids[0], {"from": owner})
+    record_gas(f"cancelMotion/active_motions={active_motions}", tx)
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("active_motions", ACTIVE_MOTIONS)
+def test_cancel_motions_gas(voting, easy_track, create_motions, record_gas, active_motions):
+    "Must not use more gas on cancel of many motions than the baseline"
+    motion_ids = create_motions(active_motions)
+    tx = easy_track.cancelMotions(motion_ids, {"from": voting})
+    record_gas(f"cancelMotions/motions={active_motions}", tx)
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("active_motions", ACTIVE_MOTIONS)
+def test_cancel_all_motions_gas(voting, easy_track, create_motions, record_gas, active_motions):
+    "Must not use more gas on cancel of all motions than the baseline"
+    create_motions(active_motions)
+    tx = easy_track.cancelAllMotions({"from": voting})
+    record_gas(f"cancelAllMotions/motions={active_motions}", tx)
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("active_motions", ACTIVE_MOTIONS)
+def test_enact_motion_gas(owner, easy_track, create_motions, record_gas, active_motions):
+    "Must not use more gas on motion enactment than the baseline"
+    motion_ids = create_motions(active_motions)
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+    tx = easy_track.enactMotion(motion_ids[0], b"", {"from": owner})
+    record_gas(f"enactMotion/active_motions={active_motions}", tx)
+
+
+def permissions_of_length(factory, length):
+    # permissions of the factory are mixed with permissions to call methods of other
+    # addresses and sorted, so EasyTrack looks them up with binary search
+    permissions = [bytes(factory.DEFAULT_PERMISSIONS()).hex()]
+    permissions += [format(index + 1, "040x") + "aabbccdd" for index in range(length - 1)]
+    return "0x" + "".join(sorted(permissions))
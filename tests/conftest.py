@@ -147,6 +147,15 @@ def increase_node_operator_staking_limit(
     return owner.deploy(IncreaseNodeOperatorStakingLimit, node_operators_registry_stub)
 
 
+@pytest.fixture(scope="module")
+def increase_node_operators_staking_limits(
+    owner, node_operators_registry_stub, IncreaseNodeOperatorsStakingLimits
+):
+    return owner.deploy(
+        IncreaseNodeOperatorsStakingLimits, owner, node_operators_registry_stub
+    )
+
+
 @pytest.fixture(scope="module")
 def add_reward_program(owner, reward_programs_registry, AddRewardProgram):
     return owner.deploy(AddRewardProgram, owner, reward_programs_registry)
@@ -155,6 +164,14 @@ def add_reward_program(owner, reward_programs_registry, AddRewardProgram):
 def remove_reward_program(owner, reward_programs_registry, RemoveRewardProgram):
     return owner.deploy(RemoveRewardProgram, owner, reward_programs_registry)
 
+@pytest.fixture(scope="module")
+def add_reward_programs(owner, reward_programs_registry, AddRewardPrograms):
+    return owner.deploy(AddRewardPrograms, owner, reward_programs_registry)
+
+@pytest.fixture(scope="module")
+def remove_reward_programs(owner, reward_programs_registry, RemoveRewardPrograms):
+    return owner.deploy(RemoveRewardPrograms, owner, reward_programs_registry)
+
 @pytest.fixture(scope="module")
 def top_up_reward_programs(
     owner, finance, ldo, reward_programs_registry, TopUpRewardPrograms
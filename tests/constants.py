@@ -1,4 +1,5 @@
 MAX_MOTIONS_LIMIT = 24
 MAX_OBJECTIONS_THRESHOLD = 500
 MIN_MOTION_DURATION = 48 * 60 * 60  # 48 hours
+MAX_MOTION_DURATION = 2 ** 32 - 1  # max value of uint32
 DEFAULT_OBJECTIONS_THRESHOLD = 50  # 0.5%
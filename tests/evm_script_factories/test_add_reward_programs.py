@@ -0,0 +1,145 @@
+import pytest
+from eth_abi import encode_single
+from brownie import chain, reverts
+
+import constants
+from utils.evm_script import encode_call_script
+
+REWARD_PROGRAM_ADDRESSES = [
+    "0xffffFfFffffFfffffFFfFfFFfFffFfFfFFFfFfaA",
+    "0xfFFFfFfFfffFffFfFfFFfFFfffFfFfFffffffFbb",
+]
+REWARD_PROGRAM_TITLES = ["Reward Program A", "Reward Program B"]
+
+
+def test_deploy(owner, reward_programs_registry, AddRewardPrograms):
+    "Must deploy contract with correct data"
+    contract = owner.deploy(AddRewardPrograms, owner, reward_programs_registry)
+    assert contract.trustedCaller() == owner
+    assert contract.rewardProgramsRegistry() == reward_programs_registry
+
+
+def test_create_evm_script_called_by_stranger(stranger, add_reward_programs):
+    "Must revert with message 'CALLER_IS_FORBIDDEN' if creator isn't trustedCaller"
+    with reverts("CALLER_IS_FORBIDDEN"):
+        add_reward_programs.createEVMScript(
+            stranger, encode_call_data(REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_TITLES)
+        )
+
+
+def test_create_evm_script_invalid_data(owner, add_reward_programs):
+    "Must revert with message 'LENGTH_MISMATCH' if lengths of lists are different,"
+    "'EMPTY_DATA' if lists are empty and 'DUPLICATE_REWARD_PROGRAM' if some address is repeated"
+    with reverts("LENGTH_MISMATCH"):
+        add_reward_programs.createEVMScript(
+            owner, encode_call_data(REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_TITLES[:1])
+        )
+    with reverts("EMPTY_DATA"):
+        add_reward_programs.createEVMScript(owner, encode_call_data([], []))
+    with reverts("DUPLICATE_REWARD_PROGRAM"):
+        add_reward_programs.createEVMScript(
+            owner,
+            encode_call_data([REWARD_PROGRAM_ADDRESSES[0]] * 2, REWARD_PROGRAM_TITLES),
+        )
+
+
+def test_create_evm_script_reward_program_already_added(
+    owner, add_reward_programs, reward_programs_registry, evm_script_executor_stub
+):
+    "Must revert with message 'REWARD_PROGRAM_ALREADY_ADDED'"
+    "if any of reward programs already listed in RewardProgramsRegistry"
+    reward_programs_registry.addRewardProgram(
+        REWARD_PROGRAM_ADDRESSES[1], "", {"from": evm_script_executor_stub}
+    )
+    with reverts("REWARD_PROGRAM_ALREADY_ADDED"):
+        add_reward_programs.createEVMScript(
+            owner, encode_call_data(REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_TITLES)
+        )
+
+
+def test_create_evm_script(owner, add_reward_programs, reward_programs_registry):
+    "Must create EVMScript with single call of addRewardPrograms if all requirements are met"
+    evm_script = add_reward_programs.createEVMScript(
+        owner, encode_call_data(REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_TITLES)
+    )
+    expected_evm_script = encode_call_script(
+        [
+            (
+                reward_programs_registry.address,
+                reward_programs_registry.addRewardPrograms.encode_input(
+                    REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_TITLES
+                ),
+            )
+        ]
+    )
+    assert evm_script == expected_evm_script
+
+
+def test_decode_evm_script_call_data(add_reward_programs):
+    "Must decode EVMScript call data correctly"
+    assert add_reward_programs.decodeEVMScriptCallData(
+        encode_call_data(REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_TITLES)
+    ) == (REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_TITLES)
+
+
+@pytest.mark.skip_coverage
+def test_bulk_motion_gas(
+    owner,
+    voting,
+    accounts,
+    easy_track,
+    add_reward_program,
+    add_reward_programs,
+    reward_programs_registry,
+    evm_script_executor_stub,
+):
+    "Must spend less gas adding reward programs with one bulk motion than with a motion per program"
+    easy_track.addEVMScriptFactory(
+        add_reward_program,
+        reward_programs_registry.address + reward_programs_registry.addRewardProgram.signature[2:],
+        {"from": voting},
+    )
+    easy_track.addEVMScriptFactory(
+        add_reward_programs,
+        reward_programs_registry.address + reward_programs_registry.addRewardPrograms.signature[2:],
+        {"from": voting},
+    )
+    reward_programs = [account.address for account in accounts[:5]]
+    titles = [f"Reward Program {i}" for i in range(len(reward_programs))]
+
+    def run_motion(factory, call_data, method, *args):
+        # EVMScriptExecutorStub doesn't execute EVMScript, so the registry is called directly
+        create_tx = easy_track.createMotion(factory, call_data, {"from": owner})
+        chain.sleep(constants.MIN_MOTION_DURATION + 1)
+        motion_id = create_tx.events["MotionCreated"]["_motionId"]
+        enact_tx = easy_track.enactMotion(motion_id, call_data, {"from": owner})
+        execute_tx = method(*args, {"from": evm_script_executor_stub})
+        return create_tx.gas_used + enact_tx.gas_used + execute_tx.gas_used
+
+    single_motions_gas = sum(
+        run_motion(
+            add_reward_program,
+            "0x" + encode_single("(address,string)", [reward_program, title]).hex(),
+            reward_programs_registry.addRewardProgram,
+            reward_program,
+            title,
+        )
+        for reward_program, title in zip(reward_programs, titles)
+    )
+    # each motion sent 3 transactions. chain.snapshot() would replace the snapshot of fn_isolation
+    chain.undo(3 * len(reward_programs))
+    assert reward_programs_registry.getRewardPrograms() == []
+    bulk_motion_gas = run_motion(
+        add_reward_programs,
+        encode_call_data(reward_programs, titles),
+        reward_programs_registry.addRewardPrograms,
+        reward_programs,
+        titles,
+    )
+    assert reward_programs_registry.getRewardPrograms() == reward_programs
+
+    assert bulk_motion_gas < single_motions_gas
+
+
+def encode_call_data(addresses, titles):
+    return "0x" + encode_single("(address[],string[])", [addresses, titles]).hex()
@@ -0,0 +1,156 @@
+import pytest
+from brownie import reverts
+from eth_abi import encode_single
+from utils import deployment
+from utils.evm_script import encode_call_script
+
+# NodeOperatorsRegistryStub returns the same node operator with
+# stakingLimit == 200 and totalSigningKeys == 400 for any id
+NODE_OPERATOR_IDS = [1, 2, 5]
+STAKING_LIMITS = [250, 300, 400]
+
+
+def test_deploy(owner, node_operators_registry, IncreaseNodeOperatorsStakingLimits):
+    "Must deploy contract with correct data"
+    contract = owner.deploy(
+        IncreaseNodeOperatorsStakingLimits, owner, node_operators_registry
+    )
+    assert contract.trustedCaller() == owner
+    assert contract.nodeOperatorsRegistry() == node_operators_registry
+
+
+def test_create_evm_script_called_by_stranger(
+    stranger, increase_node_operators_staking_limits
+):
+    "Must revert with message 'CALLER_IS_FORBIDDEN' if creator isn't trustedCaller"
+    with reverts("CALLER_IS_FORBIDDEN"):
+        increase_node_operators_staking_limits.createEVMScript(
+            stranger, encode_call_data(NODE_OPERATOR_IDS, STAKING_LIMITS)
+        )
+
+
+def test_create_evm_script_invalid_data(owner, increase_node_operators_staking_limits):
+    "Must revert with message 'LENGTH_MISMATCH' if lengths of lists are different,"
+    "'EMPTY_DATA' if lists are empty and 'NODE_OPERATORS_IDS_NOT_SORTED'"
+    "if ids aren't in strictly ascending order"
+    with reverts("LENGTH_MISMATCH"):
+        increase_node_operators_staking_limits.createEVMScript(
+            owner, encode_call_data(NODE_OPERATOR_IDS, STAKING_LIMITS[:2])
+        )
+    with reverts("EMPTY_DATA"):
+        increase_node_operators_staking_limits.createEVMScript(
+            owner, encode_call_data([], [])
+        )
+    with reverts("NODE_OPERATORS_IDS_NOT_SORTED"):
+        increase_node_operators_staking_limits.createEVMScript(
+            owner, encode_call_data([1, 1], [300, 300])
+        )
+    with reverts("NODE_OPERATORS_IDS_NOT_SORTED"):
+        increase_node_operators_staking_limits.createEVMScript(
+            owner, encode_call_data([2, 1], [300, 300])
+        )
+
+
+def test_create_evm_script_invalid_staking_limits(
+    owner, node_operators_registry_stub, increase_node_operators_staking_limits
+):
+    "Must revert with the same errors as IncreaseNodeOperatorStakingLimit"
+    "if any of node operators can't get new staking limit"
+    with reverts("STAKING_LIMIT_TOO_LOW"):
+        increase_node_operators_staking_limits.createEVMScript(
+            owner, encode_call_data(NODE_OPERATOR_IDS, [250, 300, 200])
+        )
+    with reverts("NOT_ENOUGH_SIGNING_KEYS"):
+        increase_node_operators_staking_limits.createEVMScript(
+            owner, encode_call_data(NODE_OPERATOR_IDS, [250, 401, 300])
+        )
+    node_operators_registry_stub.setActive(False)
+    with reverts("NODE_OPERATOR_DISABLED"):
+        increase_node_operators_staking_limits.createEVMScript(
+            owner, encode_call_data(NODE_OPERATOR_IDS, STAKING_LIMITS)
+        )
+
+
+def test_create_evm_script(
+    owner, node_operators_registry_stub, increase_node_operators_staking_limits
+):
+    "Must create EVMScript with a setNodeOperatorStakingLimit call per node operator"
+    evm_script = increase_node_operators_staking_limits.createEVMScript(
+        owner, encode_call_data(NODE_OPERATOR_IDS, STAKING_LIMITS)
+    )
+    expected_evm_script = encode_call_script(
+        [
+            (
+                node_operators_registry_stub.address,
+                node_operators_registry_stub.setNodeOperatorStakingLimit.encode_input(
+                    id, staking_limit
+                ),
+            )
+            for id, staking_limit in zip(NODE_OPERATOR_IDS, STAKING_LIMITS)
+        ]
+    )
+    assert evm_script == expected_evm_script
+
+
+def test_decode_evm_script_call_data(increase_node_operators_staking_limits):
+    "Must decode EVMScript call data correctly"
+    assert increase_node_operators_staking_limits.decodeEVMScriptCallData(
+        encode_call_data(NODE_OPERATOR_IDS, STAKING_LIMITS)
+    ) == (NODE_OPERATOR_IDS, STAKING_LIMITS)
+
+
+@pytest.mark.skip_coverage
+def test_create_evm_script_gas(owner, voting, node_operators_registry):
+    "Must validate node operators up to the full set of NodeOperatorsRegistry"
+    "with gas growing linearly with the number of node operators"
+    increase_node_operators_staking_limits = (
+        deployment.deploy_increase_node_operators_staking_limits(
+            node_operators_registry=node_operators_registry,
+            trusted_caller=owner,
+            tx_params={"from": owner},
+        )
+    )
+
+    # make all node operators with signing keys valid targets of staking limits increase
+    node_operator_ids, staking_limits = [], []
+    for node_operator_id in range(node_operators_registry.getNodeOperatorsCount()):
+        (active, _, _, staking_limit, _, total_signing_keys, _) = (
+            node_operators_registry.getNodeOperator(node_operator_id, False)
+        )
+        if total_signing_keys == 0:
+            continue
+        if not active:
+            node_operators_registry.setNodeOperatorActive(
+                node_operator_id, True, {"from": voting}
+            )
+        if staking_limit >= total_signing_keys:
+            node_operators_registry.setNodeOperatorStakingLimit(
+                node_operator_id, 0, {"from": voting}
+            )
+        node_operator_ids.append(node_operator_id)
+        staking_limits.append(total_signing_keys)
+
+    node_operators_count = len(node_operator_ids)
+    gas_used = {}
+    for count in sorted({1, node_operators_count // 2, node_operators_count}):
+        call_data = encode_call_data(node_operator_ids[:count], staking_limits[:count])
+        gas_used[count] = increase_node_operators_staking_limits.createEVMScript.estimate_gas(
+            owner, call_data
+        )
+
+    if node_operators_count >= 4:
+        half = node_operators_count // 2
+        first_half_cost = (gas_used[half] - gas_used[1]) / (half - 1)
+        second_half_cost = (gas_used[node_operators_count] - gas_used[half]) / (
+            node_operators_count - half
+        )
+        assert second_half_cost < 1.25 * first_half_cost
+
+
+def encode_call_data(node_operator_ids, staking_limits):
+    return (
+        "0x"
+        + encode_single(
+            "(uint256[],uint256[])", [node_operator_ids, staking_limits]
+        ).hex()
+    )
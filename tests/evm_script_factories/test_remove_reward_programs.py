@@ -0,0 +1,80 @@
+from eth_abi import encode_single
+from brownie import reverts
+
+from utils.evm_script import encode_call_script
+
+REWARD_PROGRAM_ADDRESSES = [
+    "0xffffFfFffffFfffffFFfFfFFfFffFfFfFFFfFfaA",
+    "0xfFFFfFfFfffFffFfFfFFfFFfffFfFfFffffffFbb",
+]
+
+
+def test_deploy(owner, reward_programs_registry, RemoveRewardPrograms):
+    "Must deploy contract with correct data"
+    contract = owner.deploy(RemoveRewardPrograms, owner, reward_programs_registry)
+    assert contract.trustedCaller() == owner
+    assert contract.rewardProgramsRegistry() == reward_programs_registry
+
+
+def test_create_evm_script_called_by_stranger(stranger, remove_reward_programs):
+    "Must revert with message 'CALLER_IS_FORBIDDEN' if creator isn't trustedCaller"
+    with reverts("CALLER_IS_FORBIDDEN"):
+        remove_reward_programs.createEVMScript(
+            stranger, encode_call_data(REWARD_PROGRAM_ADDRESSES)
+        )
+
+
+def test_create_evm_script_invalid_data(
+    owner, remove_reward_programs, reward_programs_registry, evm_script_executor_stub
+):
+    "Must revert with message 'EMPTY_DATA' if list is empty,"
+    "'REWARD_PROGRAM_NOT_FOUND' if any of reward programs isn't listed in RewardProgramsRegistry"
+    "and 'DUPLICATE_REWARD_PROGRAM' if some address is repeated"
+    with reverts("EMPTY_DATA"):
+        remove_reward_programs.createEVMScript(owner, encode_call_data([]))
+
+    reward_programs_registry.addRewardProgram(
+        REWARD_PROGRAM_ADDRESSES[0], "", {"from": evm_script_executor_stub}
+    )
+    with reverts("REWARD_PROGRAM_NOT_FOUND"):
+        remove_reward_programs.createEVMScript(
+            owner, encode_call_data(REWARD_PROGRAM_ADDRESSES)
+        )
+    with reverts("DUPLICATE_REWARD_PROGRAM"):
+        remove_reward_programs.createEVMScript(
+            owner, encode_call_data([REWARD_PROGRAM_ADDRESSES[0]] * 2)
+        )
+
+
+def test_create_evm_script(
+    owner, remove_reward_programs, reward_programs_registry, evm_script_executor_stub
+):
+    "Must create EVMScript with single call of removeRewardPrograms if all requirements are met"
+    reward_programs_registry.addRewardPrograms(
+        REWARD_PROGRAM_ADDRESSES, ["", ""], {"from": evm_script_executor_stub}
+    )
+    evm_script = remove_reward_programs.createEVMScript(
+        owner, encode_call_data(REWARD_PROGRAM_ADDRESSES)
+    )
+    expected_evm_script = encode_call_script(
+        [
+            (
+                reward_programs_registry.address,
+                reward_programs_registry.removeRewardPrograms.encode_input(
+                    REWARD_PROGRAM_ADDRESSES
+                ),
+            )
+        ]
+    )
+    assert evm_script == expected_evm_script
+
+
+def test_decode_evm_script_call_data(remove_reward_programs):
+    "Must decode EVMScript call data correctly"
+    assert remove_reward_programs.decodeEVMScriptCallData(
+        encode_call_data(REWARD_PROGRAM_ADDRESSES)
+    ) == REWARD_PROGRAM_ADDRESSES
+
+
+def encode_call_data(addresses):
+    return "0x" + encode_single("(address[])", [addresses]).hex()
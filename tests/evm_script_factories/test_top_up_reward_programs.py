@@ -1,5 +1,9 @@
+import pytest
 from eth_abi import encode_single
-from brownie import reverts
+from brownie import chain, reverts
+from web3 import Web3
+
+import constants
 
 from utils.evm_script import encode_call_script
 
@@ -148,6 +152,38 @@ def test_create_evm_script(
     assert evm_script == expected_evm_script
 
 
+def test_create_evm_script_legacy_registry(
+    owner, finance, ldo, TopUpRewardPrograms, RewardProgramsRegistryLegacyStub
+):
+    "Must validate reward programs with isRewardProgram method if"
+    "RewardProgramsRegistry doesn't implement areRewardPrograms method"
+    legacy_registry = owner.deploy(RewardProgramsRegistryLegacyStub)
+    top_up_reward_programs = owner.deploy(
+        TopUpRewardPrograms, owner, legacy_registry, finance, ldo
+    )
+    call_data = encode_call_data(REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_AMOUNTS)
+
+    legacy_registry.addRewardProgram(REWARD_PROGRAM_ADDRESSES[0], {"from": owner})
+    with reverts("REWARD_PROGRAM_NOT_ALLOWED"):
+        top_up_reward_programs.createEVMScript(owner, call_data)
+
+    legacy_registry.addRewardProgram(REWARD_PROGRAM_ADDRESSES[1], {"from": owner})
+    expected_evm_script = encode_call_script(
+        [
+            (
+                finance.address,
+                finance.newImmediatePayment.encode_input(
+                    ldo, reward_program, amount, "Reward program top up"
+                ),
+            )
+            for reward_program, amount in zip(
+                REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_AMOUNTS
+            )
+        ]
+    )
+    assert top_up_reward_programs.createEVMScript(owner, call_data) == expected_evm_script
+
+
 def test_decode_evm_script_call_data(top_up_reward_programs):
     "Must decode EVMScript call data correctly"
     assert top_up_reward_programs.decodeEVMScriptCallData(
@@ -155,5 +191,54 @@ def test_decode_evm_script_call_data(top_up_reward_programs):
     ) == (REWARD_PROGRAM_ADDRESSES, REWARD_PROGRAM_AMOUNTS)
 
 
+@pytest.mark.skip_coverage
+def test_validation_gas(
+    owner,
+    voting,
+    easy_track,
+    finance,
+    top_up_reward_programs,
+    reward_programs_registry,
+    evm_script_executor_stub,
+):
+    "Must check all reward programs with a single call to RewardProgramsRegistry"
+    "on both creation and enactment of motion"
+    easy_track.addEVMScriptFactory(
+        top_up_reward_programs,
+        finance.address + finance.newImmediatePayment.signature[2:],
+        {"from": voting},
+    )
+    reward_programs = [Web3.toChecksumAddress(f"0x{i:040x}") for i in range(1, 101)]
+    for reward_program in reward_programs:
+        reward_programs_registry.addRewardProgram(
+            reward_program, "", {"from": evm_script_executor_stub}
+        )
+
+    for recipients_count in [1, 10, 50, 100]:
+        call_data = encode_call_data(
+            reward_programs[:recipients_count], [10 ** 18] * recipients_count
+        )
+        create_tx = easy_track.createMotion(top_up_reward_programs, call_data, {"from": owner})
+        chain.sleep(constants.MIN_MOTION_DURATION + 1)
+        enact_tx = easy_track.enactMotion(
+            create_tx.events["MotionCreated"]["_motionId"], call_data, {"from": owner}
+        )
+        print(
+            f"recipients: {recipients_count},",
+            f"createMotion gas: {create_tx.gas_used},",
+            f"enactMotion gas: {enact_tx.gas_used}",
+        )
+        assert count_calls(create_tx, reward_programs_registry.address) == 1
+        assert count_calls(enact_tx, reward_programs_registry.address) == 1
+
+
+def count_calls(tx, address):
+    return sum(
+        1
+        for step in tx.trace
+        if step["op"] in ("CALL", "STATICCALL") and int(step["stack"][-2], 16) == int(address, 16)
+    )
+
+
 def encode_call_data(addresses, amounts):
     return "0x" + encode_single("(address[],uint256[])", [addresses, amounts]).hex()
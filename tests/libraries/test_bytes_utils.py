@@ -76,3 +76,16 @@ def test_uint32_at(bytes_utils_wrapper, uint32_at_testcases):
 def test_uint256_at(bytes_utils_wrapper, uint256_at_testcases):
     source, location, result = uint256_at_testcases
     assert bytes_utils_wrapper.uint256At(source, location) == result
+
+
+@pytest.mark.skip_coverage
+def test_readers_gas(bytes_utils_wrapper):
+    "Readers of primitive types must cost no more than a raw word read plus a shift or a mask"
+    data = "0x" + "ab" * 64
+    baseline = bytes_utils_wrapper.uint256At.estimate_gas(data, 4)
+    print()
+    print(f"uint256At gas: {baseline}")
+    for method in ["bytes24At", "addressAt", "uint32At"]:
+        gas = getattr(bytes_utils_wrapper, method).estimate_gas(data, 4)
+        print(f"{method} gas: {gas} ({gas - baseline:+})")
+        assert gas - baseline <= 30
@@ -1,6 +1,7 @@
 import pytest
 from eth_abi import encode_single
 from utils.evm_script import encode_call_script
+from utils.evm_script_creator_harness import OVERLOADS, generate_cases, run_differential
 from brownie import reverts
 
 
@@ -201,6 +202,57 @@ def test_create_evm_script_many_addresses(
     assert evm_script == expected_evm_script
 
 
+@pytest.mark.skip_coverage
+def test_create_evm_script_gas_scaling(accounts, evm_script_creator_wrapper, finance, ldo):
+    "Gas used to create EVMScript must grow linearly with the number of actions"
+    actions_counts = [1, 10, 50, 100, 200]
+    recipient = accounts[3].address
+    top_up_call_data = "0x" + encode_single(
+        "(address,address,uint256,string)",
+        [ldo.address, recipient, 10 ** 18, "Reward program top up"],
+    ).hex()
+    create_evm_script = evm_script_creator_wrapper.createEVMScript[
+        "address,bytes4,bytes[]"
+    ]
+
+    gas_used = {}
+    for actions_count in actions_counts:
+        call_data = [top_up_call_data] * actions_count
+        evm_script = create_evm_script(
+            finance.address, finance.newImmediatePayment.signature, call_data
+        )
+        assert evm_script == encode_call_script(
+            [(finance.address, finance.newImmediatePayment.signature + top_up_call_data[2:])]
+            * actions_count
+        )
+        gas_used[actions_count] = create_evm_script.estimate_gas(
+            finance.address, finance.newImmediatePayment.signature, call_data
+        )
+
+    print()
+    print("createEVMScript(address,bytes4,bytes[]) gas usage:")
+    for actions_count, gas in gas_used.items():
+        print(f"{actions_count:>5} actions: {gas:>9} gas, {gas // actions_count:>7} per action")
+
+    # marginal cost of one action must not depend on the size of already built EVMScript
+    small_batch_action_cost = (gas_used[10] - gas_used[1]) / 9
+    large_batch_action_cost = (gas_used[200] - gas_used[100]) / 100
+    assert large_batch_action_cost < 1.25 * small_batch_action_cost
+
+
+@pytest.mark.skip_coverage
+def test_create_evm_script_differential(evm_script_creator_wrapper):
+    "Must build the same EVMScripts as encode_call_script for random actions"
+    cases = generate_cases(2000, seed=1)
+    assert {case.overload for case in cases} == set(OVERLOADS)
+
+    report = run_differential(evm_script_creator_wrapper, cases)
+    assert report.cases == len(cases)
+    assert report.actions == sum(len(case.actions) for case in cases)
+    assert report.mismatches == []
+    assert report.gas_per_action > 0
+
+
 def encode_remove_reward_program_calldata(reward_program):
     return "0x" + encode_single("(address)", [reward_program]).hex()
 
@@ -1,6 +1,7 @@
 import pytest
 from brownie import ZERO_ADDRESS
 from brownie.convert import to_bytes
+from utils import deployment
 from utils.evm_script import encode_call_script
 
 
@@ -207,3 +208,158 @@ def test_is_valid_permissions_invalid(
     evm_script_permissions_wrapper, invalid_permissions
 ):
     assert not evm_script_permissions_wrapper.isValidPermissions(invalid_permissions)
+
+
+def test_is_sorted_permissions(evm_script_permissions_wrapper):
+    permission_1 = "0x" + "00" * 20 + "aabbccdd"
+    permission_2 = "0x" + "00" * 20 + "aabbccde"
+    permission_3 = "0x" + "01" + "00" * 19 + "00000000"
+    assert evm_script_permissions_wrapper.isSortedPermissions(permission_1)
+    assert evm_script_permissions_wrapper.isSortedPermissions(
+        permission_1 + permission_2[2:] + permission_3[2:]
+    )
+    # duplicates are not allowed in sorted permissions
+    assert not evm_script_permissions_wrapper.isSortedPermissions(
+        permission_1 + permission_1[2:]
+    )
+    assert not evm_script_permissions_wrapper.isSortedPermissions(
+        permission_1 + permission_3[2:] + permission_2[2:]
+    )
+
+
+def test_create_permissions(
+    evm_script_permissions_wrapper, create_permission, node_operators_registry_stub
+):
+    "Must encode sorted permissions without duplicates"
+    method_names = ["setRewardAddress", "getNodeOperator", "setRewardAddress"]
+    permissions = deployment.create_permissions(
+        *[(node_operators_registry_stub, method_name) for method_name in method_names]
+    )
+    assert permissions == "0x" + "".join(
+        sorted(
+            create_permission(node_operators_registry_stub, method_name)[2:].lower()
+            for method_name in set(method_names)
+        )
+    )
+    assert evm_script_permissions_wrapper.isSortedPermissions(permissions)
+
+
+@pytest.mark.parametrize("is_allowed", [True, False])
+def test_can_execute_evm_script_sorted_permissions(
+    is_allowed,
+    evm_script_permissions_wrapper,
+    node_operators_registry_stub,
+    node_operators_registry_stub_calldata,
+):
+    "Must look up methods in sorted permissions with the same result as in unsorted ones"
+    method_names = ["setNodeOperatorStakingLimit", "getNodeOperator", "setRewardAddress"]
+    allowed_method_names = method_names if is_allowed else method_names[:-1]
+    sorted_permissions = deployment.create_permissions(
+        *[(node_operators_registry_stub, method_name) for method_name in allowed_method_names]
+    )
+    permissions = [
+        sorted_permissions[location : location + 48]
+        for location in range(2, len(sorted_permissions), 48)
+    ]
+    unsorted_permissions = "0x" + "".join(reversed(permissions))
+    evm_script = node_operators_registry_stub_calldata(method_names)
+
+    assert evm_script_permissions_wrapper.isSortedPermissions(sorted_permissions)
+    assert evm_script_permissions_wrapper.canExecuteEVMScript(
+        sorted_permissions, evm_script
+    ) == is_allowed
+    assert evm_script_permissions_wrapper.canExecuteEVMScript(
+        unsorted_permissions, evm_script
+    ) == is_allowed
+
+
+@pytest.mark.skip_coverage
+def test_can_execute_evm_script_gas(evm_script_permissions_wrapper):
+    "Lookup in sorted permissions must be cheaper than linear search for large permissions"
+    permissions_counts = [1, 10, 25, 50]
+    actions_counts = [1, 50, 100, 200]
+    all_permissions = sorted(
+        (f"{index * 7919:040x}", f"{index * 104729:08x}") for index in range(max(permissions_counts))
+    )
+
+    gas_used = {}
+    for permissions_count in permissions_counts:
+        permissions = all_permissions[:permissions_count]
+        sorted_permissions = "0x" + "".join(address + selector for address, selector in permissions)
+        unsorted_permissions = "0x" + "".join(
+            address + selector for address, selector in reversed(permissions)
+        )
+        for actions_count in actions_counts:
+            evm_script = encode_call_script(
+                [
+                    ("0x" + address, "0x" + selector)
+                    for address, selector in (
+                        permissions[(index * 13) % permissions_count]
+                        for index in range(actions_count)
+                    )
+                ]
+            )
+            for is_sorted, permissions_blob in [
+                (True, sorted_permissions),
+                (False, unsorted_permissions),
+            ]:
+                assert evm_script_permissions_wrapper.canExecuteEVMScript(
+                    permissions_blob, evm_script
+                )
+                gas_used[(permissions_count, actions_count, is_sorted)] = (
+                    evm_script_permissions_wrapper.canExecuteEVMScript.estimate_gas(
+                        permissions_blob, evm_script
+                    )
+                )
+
+    print()
+    print("canExecuteEVMScript gas usage (sorted / unsorted permissions):")
+    for permissions_count in permissions_counts:
+        for actions_count in actions_counts:
+            sorted_gas = gas_used[(permissions_count, actions_count, True)]
+            unsorted_gas = gas_used[(permissions_count, actions_count, False)]
+            print(
+                f"{permissions_count:>3} permissions, {actions_count:>4} actions: "
+                f"{sorted_gas:>9} / {unsorted_gas:>9}"
+            )
+
+    assert gas_used[(50, 200, True)] < 0.75 * gas_used[(50, 200, False)]
+
+
+@pytest.mark.skip_coverage
+def test_can_execute_evm_script_factories_gas(
+    evm_script_permissions_wrapper, finance, node_operators_registry, ldo
+):
+    "Reports gas of canExecuteEVMScript for EVMScripts of the same shape as created by factories"
+    new_immediate_payment = finance.address + finance.newImmediatePayment.signature[2:]
+    set_staking_limit = (
+        node_operators_registry.address
+        + node_operators_registry.setNodeOperatorStakingLimit.signature[2:]
+    )
+    scripts = {
+        "TopUpRewardPrograms": (
+            new_immediate_payment,
+            lambda index: (
+                finance.address,
+                finance.newImmediatePayment.encode_input(
+                    ldo, f"0x{index + 1:040x}", 10 ** 18, "Reward program top up"
+                ),
+            ),
+        ),
+        "IncreaseNodeOperatorsStakingLimits": (
+            set_staking_limit,
+            lambda index: (
+                node_operators_registry.address,
+                node_operators_registry.setNodeOperatorStakingLimit.encode_input(index, 1000),
+            ),
+        ),
+    }
+    print()
+    for factory_name, (permissions, create_action) in scripts.items():
+        for actions_count in [1, 10, 50, 100]:
+            evm_script = encode_call_script([create_action(i) for i in range(actions_count)])
+            assert evm_script_permissions_wrapper.canExecuteEVMScript(permissions, evm_script)
+            gas = evm_script_permissions_wrapper.canExecuteEVMScript.estimate_gas(
+                permissions, evm_script
+            )
+            print(f"{factory_name}, {actions_count:>3} actions: {gas:>9} gas")
@@ -18,6 +18,8 @@ def test_deploy_script(accounts):
         add_reward_program,
         remove_reward_program,
         top_up_reward_programs,
+        add_reward_programs,
+        remove_reward_programs,
     ) = deploy_easy_tracks(
         lido_contracts=lido_contracts,
         lego_program_vault=lego_program_vault,
@@ -75,6 +77,12 @@ def test_deploy_script(accounts):
     assert remove_reward_program.trustedCaller() == reward_programs_multisig
     assert remove_reward_program.rewardProgramsRegistry() == reward_programs_registry
 
+    assert add_reward_programs.trustedCaller() == reward_programs_multisig
+    assert add_reward_programs.rewardProgramsRegistry() == reward_programs_registry
+
+    assert remove_reward_programs.trustedCaller() == reward_programs_multisig
+    assert remove_reward_programs.rewardProgramsRegistry() == reward_programs_registry
+
     assert top_up_reward_programs.trustedCaller() == reward_programs_multisig
     assert top_up_reward_programs.finance() == lido_contracts.aragon.finance
     assert top_up_reward_programs.rewardToken() == lido_contracts.ldo
@@ -99,6 +107,14 @@ def test_deploy_script(accounts):
         reward_programs_registry.address
         + reward_programs_registry.removeRewardProgram.signature[2:]
     )
+    add_reward_programs_permission = (
+        reward_programs_registry.address
+        + reward_programs_registry.addRewardPrograms.signature[2:]
+    )
+    remove_reward_programs_permission = (
+        reward_programs_registry.address
+        + reward_programs_registry.removeRewardPrograms.signature[2:]
+    )
     assert (
         easy_track.evmScriptFactoryPermissions(increase_node_operators_staking_limit)
         == set_node_operator_staking_limit_permission
@@ -119,3 +135,11 @@ def test_deploy_script(accounts):
         easy_track.evmScriptFactoryPermissions(top_up_reward_programs)
         == new_immediate_payment_permission
     )
+    assert (
+        easy_track.evmScriptFactoryPermissions(add_reward_programs)
+        == add_reward_programs_permission
+    )
+    assert (
+        easy_track.evmScriptFactoryPermissions(remove_reward_programs)
+        == remove_reward_programs_permission
+    )
@@ -0,0 +1,174 @@
+import pytest
+from eth_abi import encode_single
+
+import constants
+from utils.deployment import create_permission
+from utils.evm_script_factories import (
+    get_factory_immutables,
+    reconstruct_evm_script,
+)
+
+REWARD_PROGRAM = "0xffffFfFffffFfffffFFfFfFFfFffFfFfFFFfFfaA"
+NEW_REWARD_PROGRAM = "0xfFFFfFfFfffFffFfFfFFfFFfffFfFfFffffffFbb"
+
+
+@pytest.fixture(scope="module")
+def compact_easy_track(owner, ldo, voting, evm_script_executor_stub, CompactEasyTrack):
+    contract = owner.deploy(
+        CompactEasyTrack,
+        ldo,
+        voting,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    contract.setEVMScriptExecutor(evm_script_executor_stub, {"from": voting})
+    return contract
+
+
+@pytest.fixture(scope="module")
+def factories(
+    owner,
+    node_operator,
+    ldo,
+    finance,
+    node_operators_registry_stub,
+    reward_programs_registry,
+    increase_node_operator_staking_limit,
+    increase_node_operators_staking_limits,
+    top_up_lego_program,
+    add_reward_program,
+    remove_reward_program,
+    add_reward_programs,
+    remove_reward_programs,
+    top_up_reward_programs,
+):
+    "Returns (factory, permission, creator, call data) of each EVMScript factory by its name"
+    staking_limit = create_permission(
+        node_operators_registry_stub, "setNodeOperatorStakingLimit"
+    )
+    payment = create_permission(finance, "newImmediatePayment")
+    return {
+        "IncreaseNodeOperatorStakingLimit": (
+            increase_node_operator_staking_limit,
+            staking_limit,
+            node_operator,
+            encode_single("(uint256,uint256)", [1, 300]),
+        ),
+        "IncreaseNodeOperatorsStakingLimits": (
+            increase_node_operators_staking_limits,
+            staking_limit,
+            owner,
+            encode_single("(uint256[],uint256[])", [[1, 2, 3], [300, 350, 400]]),
+        ),
+        "TopUpLegoProgram": (
+            top_up_lego_program,
+            payment,
+            owner,
+            encode_single("(address[],uint256[])", [[ldo.address], [10 ** 18]]),
+        ),
+        "AddRewardProgram": (
+            add_reward_program,
+            create_permission(reward_programs_registry, "addRewardProgram"),
+            owner,
+            encode_single("(address,string)", [NEW_REWARD_PROGRAM, "New Reward Program"]),
+        ),
+        "RemoveRewardProgram": (
+            remove_reward_program,
+            create_permission(reward_programs_registry, "removeRewardProgram"),
+            owner,
+            encode_single("(address)", [REWARD_PROGRAM]),
+        ),
+        "AddRewardPrograms": (
+            add_reward_programs,
+            create_permission(reward_programs_registry, "addRewardPrograms"),
+            owner,
+            encode_single(
+                "(address[],string[])", [[NEW_REWARD_PROGRAM], ["New Reward Program"]]
+            ),
+        ),
+        "RemoveRewardPrograms": (
+            remove_reward_programs,
+            create_permission(reward_programs_registry, "removeRewardPrograms"),
+            owner,
+            encode_single("(address[])", [[REWARD_PROGRAM]]),
+        ),
+        "TopUpRewardPrograms": (
+            top_up_reward_programs,
+            payment,
+            owner,
+            encode_single(
+                "(address[],uint256[])", [[REWARD_PROGRAM] * 2, [10 ** 18, 2 * 10 ** 18]]
+            ),
+        ),
+    }
+
+
+@pytest.fixture(scope="module", autouse=True)
+def add_reward_program_to_registry(reward_programs_registry, evm_script_executor_stub):
+    reward_programs_registry.addRewardProgram(
+        REWARD_PROGRAM, "Reward Program", {"from": evm_script_executor_stub}
+    )
+
+
+def test_motion_created_compact(owner, voting, compact_easy_track, evm_script_factory_stub):
+    "Must log MotionCreatedCompact event with the hash of EVMScript instead of MotionCreated event"
+    compact_easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    tx = compact_easy_track.createMotion(evm_script_factory_stub, "0xaabb", {"from": owner})
+
+    assert "MotionCreated" not in tx.events
+    event = tx.events["MotionCreatedCompact"]
+    assert event["_motionId"] == 1
+    assert event["_creator"] == owner
+    assert event["_evmScriptFactory"] == evm_script_factory_stub
+    assert event["_evmScriptCallData"] == "0xaabb"
+    assert event["_evmScriptHash"] == compact_easy_track.getMotion(1)[8]
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize(
+    "factory_name",
+    [
+        "IncreaseNodeOperatorStakingLimit",
+        "IncreaseNodeOperatorsStakingLimits",
+        "TopUpLegoProgram",
+        "AddRewardProgram",
+        "RemoveRewardProgram",
+        "AddRewardPrograms",
+        "RemoveRewardPrograms",
+        "TopUpRewardPrograms",
+    ],
+)
+def test_reconstruct_evm_script(
+    voting, easy_track, compact_easy_track, factories, factory_name
+):
+    "Must spend less gas on creation of motion with compact event and"
+    "recreate exactly the same EVMScript off-chain from the call data and the hash"
+    factory, permission, creator, call_data = factories[factory_name]
+    for contract in [easy_track, compact_easy_track]:
+        contract.addEVMScriptFactory(factory, permission, {"from": voting})
+
+    full_tx = easy_track.createMotion(factory, call_data, {"from": creator})
+    compact_tx = compact_easy_track.createMotion(factory, call_data, {"from": creator})
+    assert compact_tx.gas_used < full_tx.gas_used
+
+    event = compact_tx.events["MotionCreatedCompact"]
+    evm_script = reconstruct_evm_script(
+        factory_name,
+        get_factory_immutables(factory_name, factory.address),
+        event["_evmScriptCallData"],
+        event["_evmScriptHash"],
+    )
+    assert evm_script == full_tx.events["MotionCreated"]["_evmScript"]
+
+    with pytest.raises(ValueError):
+        reconstruct_evm_script(
+            factory_name,
+            get_factory_immutables(factory_name, factory.address),
+            event["_evmScriptCallData"],
+            "0x" + "00" * 32,
+        )
@@ -1,6 +1,6 @@
 import constants
 from brownie.network.state import Chain
-from brownie import reverts, ZERO_ADDRESS
+from brownie import reverts, web3, ZERO_ADDRESS
 from utils.evm_script import encode_call_script
 from utils.test_helpers import (
     access_controll_revert_message,
@@ -560,6 +560,157 @@ def test_object_to_motion_edge_case(
     assert len(easy_track.getMotions()) == 0
 
 
+########
+# OBJECT TO MOTIONS
+########
+
+
+def test_object_to_motions(
+    owner,
+    voting,
+    ldo_holders,
+    ldo,
+    easy_track,
+    evm_script_factory_stub,
+    distribute_holder_balance,
+):
+    "Must submit objection to each motion and emit MotionObjected event per motion"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    for _ in range(3):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+
+    tx = easy_track.objectToMotions([3, 1], {"from": ldo_holders[0]})
+
+    holder_balance = ldo.balanceOf(ldo_holders[0])
+    assert easy_track.objections(1, ldo_holders[0])
+    assert not easy_track.objections(2, ldo_holders[0])
+    assert easy_track.objections(3, ldo_holders[0])
+    assert easy_track.getMotion(1)[7] == holder_balance
+    assert easy_track.getMotion(2)[7] == 0
+    assert easy_track.getMotion(3)[7] == holder_balance
+
+    assert len(tx.events) == 2
+    for event, motion_id in zip(tx.events["MotionObjected"], [3, 1]):
+        assert event["_motionId"] == motion_id
+        assert event["_objector"] == ldo_holders[0]
+        assert event["_weight"] == holder_balance
+        assert event["_newObjectionsAmount"] == holder_balance
+        assert event["_newObjectionsAmountPct"] == 10000 * holder_balance // ldo.totalSupply()
+
+
+def test_object_to_motions_rejected(
+    owner, agent, ldo, voting, easy_track, evm_script_factory_stub
+):
+    "Must reject all motions which reached objections threshold and keep the rest unchanged"
+    objections_threshold_amount = int(
+        easy_track.objectionsThreshold() * ldo.totalSupply() // 10000
+    )
+    ldo.transfer(owner, objections_threshold_amount, {"from": agent})
+
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    for _ in range(3):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    motion_3 = easy_track.getMotion(3)
+
+    tx = easy_track.objectToMotions([1, 2], {"from": owner})
+
+    assert len(tx.events["MotionObjected"]) == 2
+    assert [e["_motionId"] for e in tx.events["MotionRejected"]] == [1, 2]
+    assert easy_track.getMotions() == [motion_3]
+
+
+def test_object_to_motions_same_snapshot_block(
+    owner,
+    voting,
+    ldo_holders,
+    ldo,
+    easy_track,
+    evm_script_factory_stub,
+    distribute_holder_balance,
+):
+    "Must request balance and total supply once for motions created in the same block"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+
+    # motions are created in one block with automine disabled
+    if "error" in web3.provider.make_request("evm_setAutomine", [False]):
+        web3.provider.make_request("miner_stop", [])
+    try:
+        nonce = web3.eth.get_transaction_count(owner.address, "pending")
+        tx_hashes = [
+            web3.eth.send_transaction(
+                {
+                    "from": owner.address,
+                    "to": easy_track.address,
+                    "data": easy_track.createMotion.encode_input(evm_script_factory_stub, b""),
+                    "gas": 1_000_000,
+                    "nonce": nonce + index,
+                }
+            )
+            for index in range(3)
+        ]
+        web3.provider.make_request("evm_mine", [])
+    finally:
+        if "error" in web3.provider.make_request("evm_setAutomine", [True]):
+            web3.provider.make_request("miner_start", [])
+    receipts = [web3.eth.get_transaction_receipt(tx_hash) for tx_hash in tx_hashes]
+    assert all(receipt.status == 1 for receipt in receipts)
+    assert len({receipt.blockNumber for receipt in receipts}) == 1
+    motions = easy_track.getMotions()
+    assert len(motions) == 3 and len({motion[5] for motion in motions}) == 1
+
+    tx = easy_track.objectToMotions([1, 2, 3], {"from": ldo_holders[0]})
+
+    holder_balance = ldo.balanceOf(ldo_holders[0])
+    assert [event["_motionId"] for event in tx.events["MotionObjected"]] == [1, 2, 3]
+    assert all(easy_track.getMotion(id)[7] == holder_balance for id in [1, 2, 3])
+    # balanceOfAt and totalSupplyAt are called once for all motions
+    token_calls = [
+        subcall
+        for subcall in tx.subcalls
+        if subcall["from"] == easy_track.address and subcall["to"] == ldo.address
+    ]
+    assert len(token_calls) == 2
+
+
+def test_object_to_motions_reverts(
+    owner,
+    voting,
+    stranger,
+    ldo_holders,
+    easy_track,
+    evm_script_factory_stub,
+    distribute_holder_balance,
+):
+    "Must revert with the same errors as objectToMotion if any of objections is invalid"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+
+    with reverts("MOTION_NOT_FOUND"):
+        easy_track.objectToMotions([1, 3], {"from": ldo_holders[0]})
+    with reverts("NOT_ENOUGH_BALANCE"):
+        easy_track.objectToMotions([1, 2], {"from": stranger})
+    with reverts("ALREADY_OBJECTED"):
+        easy_track.objectToMotions([1, 2, 1], {"from": ldo_holders[0]})
+    assert not easy_track.objections(1, ldo_holders[0])
+
+
 ########
 # CANCEL MOTIONS
 ########
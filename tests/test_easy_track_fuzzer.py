@@ -0,0 +1,73 @@
+import pytest
+import constants
+
+from utils.easy_track_fuzzer import EasyTrackFuzzer, FuzzMismatch
+
+
+@pytest.fixture(scope="module")
+def fuzzed_easy_track(owner, ldo, evm_script_executor_stub, evm_script_factory_stub, EasyTrack):
+    contract = owner.deploy(
+        EasyTrack,
+        ldo,
+        owner,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    contract.setEVMScriptExecutor(evm_script_executor_stub, {"from": owner})
+    contract.addEVMScriptFactory(
+        evm_script_factory_stub, evm_script_factory_stub.DEFAULT_PERMISSIONS(), {"from": owner}
+    )
+    return contract
+
+
+@pytest.fixture(scope="function")
+def fuzzer(
+    accounts,
+    owner,
+    stranger,
+    ldo_holders,
+    ldo,
+    fuzzed_easy_track,
+    evm_script_factory_stub,
+    distribute_holder_balance,
+):
+    return EasyTrackFuzzer(
+        fuzzed_easy_track,
+        evm_script_factory_stub,
+        ldo,
+        admin=owner,
+        creators=accounts[1:4],
+        objectors=list(ldo_holders) + [stranger],
+    )
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("seed", [1, 2, 3])
+def test_easy_track_matches_model(fuzzer, fuzzed_easy_track, seed):
+    "Must keep EasyTrack and its model in the same state after random sequences of calls"
+    stats = fuzzer.run(seed, blocks_count=30, block_size=12)
+    assert stats.transactions > 30
+    assert stats.blocks >= 30
+    assert stats.reverted < stats.transactions
+    # the chain is reverted after the run
+    assert fuzzed_easy_track.getMotions() == []
+
+
+@pytest.mark.skip_coverage
+def test_mismatch_is_shrunk(fuzzer):
+    "Must shrink failing sequence to the single call which causes the mismatch"
+    create_model = fuzzer._create_model
+
+    def create_broken_model():
+        model = create_model()
+        model.motion_duration += 1
+        return model
+
+    fuzzer._create_model = create_broken_model
+    with pytest.raises(FuzzMismatch) as error:
+        fuzzer.run(1, blocks_count=10, block_size=8)
+
+    assert len(error.value.blocks) == 1
+    assert error.value.blocks[0].sleep == 0
+    assert [op.method for op in error.value.blocks[0].operations] == ["createMotion"]
@@ -0,0 +1,136 @@
+import pytest
+from brownie import chain
+
+import constants
+from utils.test_helpers import storage_slots_written
+
+# Motion is stored in 4 slots: (evmScriptFactory, startDate, duration),
+# (creator, snapshotBlock, objectionsThreshold), (id, objectionsAmount), evmScriptHash
+MOTION_SLOTS = 4
+
+# Gas of SSTORE of a fresh slot under the Istanbul rules the tests run with (EIP-2200)
+SSTORE_SET_GAS = 20000
+# Before packing the motion was stored in 9 slots. Creation of the first motion wrote them
+# along with motions length, last motion id, motion index and the creator saved by
+# EVMScriptFactoryStub, all fresh. So the unpacked layout used at least this much gas
+UNPACKED_CREATE_MOTION_MIN_GAS = 21000 + (9 + 3 + 1) * SSTORE_SET_GAS
+# 5 fewer fresh slots save 100000 gas, at least half of it must show up in gas used
+PACKING_MIN_SAVING = 50000
+
+
+@pytest.fixture(scope="module", autouse=True)
+def add_evm_script_factory(easy_track, evm_script_factory_stub, voting):
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+
+
+@pytest.mark.skip_coverage
+def test_create_motion_storage_writes(owner, easy_track, evm_script_factory_stub):
+    "Must write only motion slots, motions length, last motion id and motion index on creation"
+    tx = easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    assert len(storage_slots_written(tx, easy_track.address)) == MOTION_SLOTS + 3
+    assert tx.gas_used < UNPACKED_CREATE_MOTION_MIN_GAS - PACKING_MIN_SAVING
+
+
+@pytest.mark.skip_coverage
+def test_object_to_motion_storage_writes(
+    owner, ldo_holders, easy_track, evm_script_factory_stub, distribute_holder_balance
+):
+    "Must write only objection flag and objections amount on objection"
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    tx = easy_track.objectToMotion(1, {"from": ldo_holders[0]})
+    assert "MotionRejected" not in tx.events
+    assert len(storage_slots_written(tx, easy_track.address)) == 2
+
+
+@pytest.mark.skip_coverage
+def test_cancel_motion_storage_writes(owner, easy_track, evm_script_factory_stub):
+    "Must touch at most two motions slots, motions length and motion indices on cancel"
+    for _ in range(3):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+
+    # canceled motion is replaced with the last one
+    tx = easy_track.cancelMotion(1, {"from": owner})
+    assert len(storage_slots_written(tx, easy_track.address)) <= 2 * MOTION_SLOTS + 3
+
+    # the last motion is removed
+    tx = easy_track.cancelMotion(2, {"from": owner})
+    assert len(storage_slots_written(tx, easy_track.address)) == MOTION_SLOTS + 2
+
+
+@pytest.mark.skip_coverage
+def test_enact_motion_storage_writes(owner, easy_track, evm_script_factory_stub):
+    "Must clear motion slots, motions length and motion index on enactment"
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+    tx = easy_track.enactMotion(1, b"", {"from": owner})
+    assert len(storage_slots_written(tx, easy_track.address)) == MOTION_SLOTS + 2
+
+
+@pytest.mark.skip_coverage
+def test_packed_motions_storage_gas(
+    owner, stranger, UnpackedMotionsStorageHarness, PackedMotionsStorageHarness
+):
+    "Must spend less gas on storage of motions than the unpacked layout used before"
+    evm_script_hash = "0x" + "ab" * 32
+    gas_used = {}
+    for name, harness in [
+        ("unpacked", owner.deploy(UnpackedMotionsStorageHarness)),
+        ("packed", owner.deploy(PackedMotionsStorageHarness)),
+    ]:
+        create_txs = [
+            harness.createMotion(stranger, evm_script_hash, {"from": owner})
+            for _ in range(3)
+        ]
+        gas_used[name] = {
+            "create": create_txs[0].gas_used,
+            "object": harness.objectToMotion(1, 10 ** 18, {"from": owner}).gas_used,
+            # the deleted motion is replaced with the last one
+            "delete_swap": harness.deleteMotion(1, {"from": owner}).gas_used,
+            "delete_last": harness.deleteMotion(2, {"from": owner}).gas_used,
+        }
+
+    for operation, unpacked_gas in gas_used["unpacked"].items():
+        assert gas_used["packed"][operation] < unpacked_gas, operation
+    assert (
+        gas_used["unpacked"]["create"] - gas_used["packed"]["create"] >= PACKING_MIN_SAVING
+    )
+
+
+def test_motions_getter(owner, easy_track, evm_script_factory_stub):
+    "Must return the same motion data by index as getMotions()"
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    motions = easy_track.getMotions()
+    for index, motion in enumerate(motions):
+        assert easy_track.motions(index) == motion
+        assert easy_track.getMotion(motion[0]) == motion
+
+
+@pytest.mark.skip_coverage
+@pytest.mark.parametrize("motions_count", [2, 5, constants.MAX_MOTIONS_LIMIT])
+def test_object_to_motions_gas(
+    owner,
+    ldo_holders,
+    easy_track,
+    evm_script_factory_stub,
+    distribute_holder_balance,
+    motions_count,
+):
+    "Must spend less gas objecting to many motions in one tx than in separate txs"
+    for _ in range(motions_count):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    motion_ids = list(range(1, motions_count + 1))
+
+    single_calls_gas = sum(
+        easy_track.objectToMotion(motion_id, {"from": ldo_holders[0]}).gas_used
+        for motion_id in motion_ids
+    )
+    # chain.snapshot() would replace the snapshot of fn_isolation
+    chain.undo(len(motion_ids))
+    batch_gas = easy_track.objectToMotions(motion_ids, {"from": ldo_holders[0]}).gas_used
+
+    assert batch_gas < single_calls_gas
@@ -0,0 +1,98 @@
+from types import SimpleNamespace
+
+import pytest
+from brownie import chain, web3
+
+import constants
+from utils.easy_track_lens import EasyTrackLensClient, LENS_OVERRIDE_ADDRESS
+
+
+@pytest.fixture(scope="module")
+def easy_track_lens(owner, EasyTrackLens):
+    return owner.deploy(EasyTrackLens)
+
+
+@pytest.fixture(scope="function")
+def motions(
+    owner, voting, ldo_holders, easy_track, evm_script_factory_stub, distribute_holder_balance
+):
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    easy_track.objectToMotion(2, {"from": ldo_holders[0]})
+    return easy_track.getMotions()
+
+
+def assert_state(state, easy_track, motions, accounts):
+    assert state.block_number == chain.height
+    assert state.paused == easy_track.paused()
+    assert state.governance_token == easy_track.governanceToken()
+    assert state.evm_script_executor == easy_track.evmScriptExecutor()
+    assert state.motion_duration == constants.MIN_MOTION_DURATION
+    assert state.motions_count_limit == constants.MAX_MOTIONS_LIMIT
+    assert state.objections_threshold == constants.DEFAULT_OBJECTIONS_THRESHOLD
+    assert state.evm_script_factories == {
+        factory: easy_track.evmScriptFactoryPermissions(factory)
+        for factory in easy_track.getEVMScriptFactories()
+    }
+
+    assert len(state.motions) == len(motions)
+    for motion_state, motion in zip(state.motions, motions):
+        assert tuple(motion_state[:9]) == tuple(motion)
+        assert motion_state.objections_amount_pct == (
+            10000 * motion[7] // motion_state.total_supply
+        )
+        for account in accounts:
+            assert motion_state.objections[account] == easy_track.objections(motion[0], account)
+            assert motion_state.can_object[account] == easy_track.canObjectToMotion(
+                motion[0], account
+            )
+
+
+def test_get_state(easy_track, easy_track_lens, motions, ldo_holders, stranger):
+    "Must return state of EasyTrack equal to the state collected by separate calls"
+    accounts = [ldo_holders[0], ldo_holders[1], stranger]
+    state = EasyTrackLensClient(easy_track, easy_track_lens.address).get_state(accounts)
+    assert state.motions[1].objections[ldo_holders[0]]
+    assert not state.motions[1].can_object[ldo_holders[0]]
+    assert state.motions[0].can_object[ldo_holders[0]]
+    assert not state.motions[0].can_object[stranger]
+    assert_state(state, easy_track, motions, accounts)
+
+
+def test_get_state_with_state_override(
+    easy_track, easy_track_lens, motions, ldo_holders, stranger
+):
+    "Must inject the bytecode of not deployed lens with the state override of eth_call"
+    # ganache doesn't support the state override, so calls to the overridden address
+    # are redirected to the lens deployed with the same bytecode
+    provider = StateOverrideProvider(web3.provider, easy_track_lens.address)
+    accounts = [ldo_holders[0], stranger]
+    state = EasyTrackLensClient(
+        easy_track, web3=SimpleNamespace(eth=web3.eth, provider=provider)
+    ).get_state(accounts)
+
+    assert len(provider.overrides) == 1
+    assert provider.overrides[0] == {
+        LENS_OVERRIDE_ADDRESS: {"code": web3.eth.get_code(easy_track_lens.address).hex()}
+    }
+    assert_state(state, easy_track, motions, accounts)
+
+
+class StateOverrideProvider:
+    def __init__(self, provider, deployed_address):
+        self.provider = provider
+        self.deployed_address = deployed_address
+        self.overrides = []
+
+    def make_request(self, method, params):
+        if method == "eth_call" and len(params) == 3:
+            call, block_identifier, overrides = params
+            self.overrides.append(overrides)
+            assert call["to"] in overrides
+            params = [dict(call, to=self.deployed_address), block_identifier]
+        return self.provider.make_request(method, params)
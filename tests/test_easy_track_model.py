@@ -0,0 +1,217 @@
+import pytest
+import constants
+from brownie import chain, reverts
+
+from utils.easy_track_model import (
+    EasyTrackModel,
+    MiniMeTokenModel,
+    ModelRevert,
+    MotionSettingsModel,
+    StaticEVMScriptFactoryModel,
+    can_execute_evm_script,
+)
+from utils.test_helpers import CANCEL_ROLE
+
+ADMIN = "0x00000000000000000000000000000000000000a1"
+CREATOR = "0x00000000000000000000000000000000000000c1"
+FACTORY = "0x00000000000000000000000000000000000000f1"
+TARGET = bytes.fromhex("420b1099b9ef5baba6d92029594ef45e19a04a4a")
+SELECTOR = bytes.fromhex("ae962acf")
+PERMISSIONS = TARGET + SELECTOR
+EVM_SCRIPT = bytes.fromhex("00000001") + TARGET + (4).to_bytes(4, "big") + SELECTOR
+HOLDERS = ["0x00000000000000000000000000000000000000b" + str(i) for i in range(3)]
+
+
+class GovernanceTokenAdapter:
+    """Reads balances of the model from deployed governance token"""
+
+    def __init__(self, token):
+        self.token = token
+
+    def balance_of_at(self, account, block):
+        return self.token.balanceOfAt(account, block)
+
+    def total_supply_at(self, block):
+        return self.token.totalSupplyAt(block)
+
+
+def create_model(holder_balances=(1, 1, 10 ** 6)):
+    token = MiniMeTokenModel()
+    for holder, balance in zip(HOLDERS, holder_balances):
+        token.mint(holder, balance, 0)
+    model = EasyTrackModel(
+        token,
+        ADMIN,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+        block_number=1,
+        timestamp=1000,
+    )
+    model.add_evm_script_factory(
+        ADMIN, FACTORY, PERMISSIONS, StaticEVMScriptFactoryModel(EVM_SCRIPT)
+    )
+    return model
+
+
+def test_motion_settings_events_order(owner, MotionSettings):
+    "Must emit events of motion settings in the same order as MotionSettings constructor"
+    settings = [
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    ]
+    tx = owner.deploy(MotionSettings, owner, *settings).tx
+    model = MotionSettingsModel(owner.address, *settings)
+    # the model doesn't emit RoleGranted events
+    assert [event.name for event in model.events] == [
+        event.name for event in tx.events if event.name != "RoleGranted"
+    ]
+
+
+def test_delete_motion_order():
+    "Must move the last motion to the place of deleted one"
+    model = create_model()
+    for _ in range(4):
+        model.create_motion(CREATOR, FACTORY)
+    model.cancel_motion(CREATOR, 1)
+    assert [motion[0] for motion in model.get_motions()] == [4, 2, 3]
+    model.cancel_motions(ADMIN, [3, 100, 4])
+    assert [motion[0] for motion in model.get_motions()] == [2]
+    assert model.get_motion(2)[0] == 2
+
+
+def test_cancel_all_motions_order():
+    "Must cancel motions starting from the last one"
+    model = create_model()
+    for _ in range(3):
+        model.create_motion(CREATOR, FACTORY)
+    model.cancel_all_motions(ADMIN)
+    assert model.get_motions() == []
+    assert [event.args["_motionId"] for event in model.events[-3:]] == [3, 2, 1]
+
+
+def test_reverts():
+    "Must revert with the same messages as EasyTrack does"
+    model = create_model()
+    with pytest.raises(ModelRevert, match="MOTION_NOT_FOUND"):
+        model.object_to_motion(HOLDERS[0], 1)
+    with pytest.raises(ModelRevert, match="EVM_SCRIPT_FACTORY_NOT_FOUND"):
+        model.create_motion(CREATOR, CREATOR)
+    motion_id = model.create_motion(CREATOR, FACTORY)
+    with pytest.raises(ModelRevert, match="NOT_CREATOR"):
+        model.cancel_motion(ADMIN, motion_id)
+    with pytest.raises(ModelRevert, match=f"is missing role {CANCEL_ROLE}"):
+        model.cancel_all_motions(CREATOR)
+    with pytest.raises(ModelRevert, match="MOTION_NOT_PASSED"):
+        model.enact_motion(CREATOR, motion_id)
+    with pytest.raises(ModelRevert, match="NOT_ENOUGH_BALANCE"):
+        model.object_to_motion(CREATOR, motion_id)
+    model.pause(ADMIN)
+    with pytest.raises(ModelRevert, match="Pausable: paused"):
+        model.create_motion(CREATOR, FACTORY)
+    model.unpause(ADMIN)
+    model.set_motions_count_limit(ADMIN, 1)
+    with pytest.raises(ModelRevert, match="MOTIONS_LIMIT_REACHED"):
+        model.create_motion(CREATOR, FACTORY)
+
+
+def test_object_to_motions_rollback():
+    "Must leave the state untouched when one of objections reverts"
+    model = create_model()
+    for _ in range(3):
+        model.create_motion(CREATOR, FACTORY)
+    model.object_to_motion(HOLDERS[1], 2)
+    events_count = len(model.events)
+
+    with pytest.raises(ModelRevert, match="ALREADY_OBJECTED"):
+        model.object_to_motions(HOLDERS[1], [1, 3, 2])
+    assert [motion[7] for motion in model.get_motions()] == [0, 1, 0]
+    assert not model.objections(1, HOLDERS[1])
+    assert len(model.events) == events_count
+
+    # objections of the whale reject motions
+    model.object_to_motions(HOLDERS[2], [3, 1])
+    assert [motion[0] for motion in model.get_motions()] == [2]
+    assert [event.name for event in model.events[-4:]] == [
+        "MotionObjected",
+        "MotionRejected",
+        "MotionObjected",
+        "MotionRejected",
+    ]
+
+
+def test_enact_motion():
+    "Must pass created EVMScript to the executor"
+    model = create_model()
+    motion_id = model.create_motion(CREATOR, FACTORY)
+    model.advance(constants.MIN_MOTION_DURATION)
+    model.enact_motion(ADMIN, motion_id)
+    assert model.get_motions() == []
+    assert model.evm_script_executor.executed == [EVM_SCRIPT]
+
+
+def test_can_execute_evm_script():
+    "Must validate EVMScript calls the same way as EVMScriptPermissions does"
+    other_permission = bytes(20) + SELECTOR
+    assert can_execute_evm_script(PERMISSIONS, EVM_SCRIPT)
+    assert can_execute_evm_script(other_permission + PERMISSIONS, EVM_SCRIPT + EVM_SCRIPT[4:])
+    assert not can_execute_evm_script(other_permission, EVM_SCRIPT)
+    assert not can_execute_evm_script(PERMISSIONS[:-1], EVM_SCRIPT)
+    assert not can_execute_evm_script(PERMISSIONS, EVM_SCRIPT[:4])
+
+
+def test_matches_easy_track(
+    voting,
+    ldo_holders,
+    stranger,
+    ldo,
+    easy_track,
+    evm_script_factory_stub,
+    distribute_holder_balance,
+):
+    "Must keep the same list of motions as EasyTrack after the same sequence of calls"
+    permissions = evm_script_factory_stub.DEFAULT_PERMISSIONS()
+    evm_script = evm_script_factory_stub.DEFAULT_EVM_SCRIPT()
+    model = EasyTrackModel(
+        GovernanceTokenAdapter(ldo),
+        voting.address,
+        easy_track.motionDuration(),
+        easy_track.motionsCountLimit(),
+        easy_track.objectionsThreshold(),
+    )
+    model.add_evm_script_factory(
+        voting.address,
+        evm_script_factory_stub.address,
+        permissions,
+        StaticEVMScriptFactoryModel(evm_script),
+    )
+    easy_track.addEVMScriptFactory(evm_script_factory_stub, permissions, {"from": voting})
+
+    def call(method, sender, *args):
+        tx = getattr(easy_track, method)(*args, {"from": sender})
+        model.block_number, model.timestamp = tx.block_number, tx.timestamp
+        model_method = {
+            "createMotion": model.create_motion,
+            "objectToMotion": model.object_to_motion,
+            "cancelMotion": model.cancel_motion,
+            "enactMotion": model.enact_motion,
+        }[method]
+        model_method(sender.address, *[getattr(arg, "address", arg) for arg in args])
+
+    for _ in range(4):
+        call("createMotion", stranger, evm_script_factory_stub, b"")
+    call("objectToMotion", ldo_holders[0], 2)
+    call("cancelMotion", stranger, 1)
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+    call("enactMotion", stranger, 3, b"")
+
+    assert model.get_motions() == [tuple(motion) for motion in easy_track.getMotions()]
+    with reverts(_revert_msg(model.object_to_motion, ldo_holders[0].address, 2)):
+        easy_track.objectToMotion(2, {"from": ldo_holders[0]})
+
+
+def _revert_msg(method, *args):
+    with pytest.raises(ModelRevert) as error:
+        method(*args)
+    return error.value.revert_msg
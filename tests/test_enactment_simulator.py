@@ -0,0 +1,164 @@
+import pytest
+from brownie import EasyTrack, EVMScriptExecutor, accounts, chain
+from eth_abi import encode_single
+
+import constants
+from utils.deployment import create_permission
+from utils.enactment_simulator import BalanceDiff, EnactmentSimulator
+from utils.evm_script import encode_call_script
+from utils.lido import create_voting, execute_voting
+
+
+def test_simulate_cached(
+    owner, stranger, voting, easy_track, evm_script_factory_stub, evm_script_executor_stub
+):
+    "Must enact all active motions on the snapshot and reuse effects at the same block"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub, evm_script_factory_stub.DEFAULT_PERMISSIONS(), {"from": voting}
+    )
+    simulator = EnactmentSimulator(easy_track, stranger, start_block=chain.height)
+    for _ in range(2):
+        easy_track.createMotion(evm_script_factory_stub, b"", {"from": owner})
+    motions = easy_track.getMotions()
+    height = chain.height
+
+    effects = simulator.simulate()
+    assert [motion_effects.motion_id for motion_effects in effects] == [1, 2]
+    assert all(motion_effects.success for motion_effects in effects)
+    # EVMScriptExecutorStub saves EVMScript of the first enacted motion only
+    storage_diffs = effects[0].storage_diffs
+    assert {diff.address for diff in storage_diffs} == {evm_script_executor_stub.address}
+    assert effects[1].storage_diffs == []
+    assert [event.name for event in effects[0].events] == ["MotionEnacted"]
+    assert effects[0].as_dict({easy_track.address.lower(): "EasyTrack"})["events"][0][
+        "contract"
+    ] == "EasyTrack"
+
+    assert chain.height == height
+    assert easy_track.getMotions() == motions
+    assert simulator.simulate() == effects
+
+
+@pytest.mark.skip_coverage
+def test_simulate_payment(
+    owner, stranger, agent, voting, lego_program, ldo, finance, acl, calls_script, TopUpLegoProgram
+):
+    "Must report token balance and storage changes made by enactment of the top up"
+    easy_track = owner.deploy(
+        EasyTrack,
+        ldo,
+        owner,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    evm_script_executor = owner.deploy(EVMScriptExecutor, calls_script, easy_track)
+    easy_track.setEVMScriptExecutor(evm_script_executor, {"from": owner})
+    top_up_lego_program = owner.deploy(TopUpLegoProgram, owner, finance, lego_program)
+    easy_track.addEVMScriptFactory(
+        top_up_lego_program, create_permission(finance, "newImmediatePayment"), {"from": owner}
+    )
+    voting_id, _ = create_voting(
+        evm_script=encode_call_script(
+            [
+                (
+                    acl.address,
+                    acl.grantPermission.encode_input(
+                        evm_script_executor, finance, finance.CREATE_PAYMENTS_ROLE()
+                    ),
+                ),
+            ]
+        ),
+        description="Grant permissions to EVMScriptExecutor to make payments",
+        tx_params={"from": agent},
+    )
+    execute_voting(voting_id)
+
+    simulator = EnactmentSimulator(easy_track, stranger, start_block=chain.height)
+    amount = 10 ** 18
+    easy_track.createMotion(
+        top_up_lego_program,
+        encode_single("(address[],uint256[])", [[ldo.address], [amount]]),
+        {"from": owner},
+    )
+    lego_program_balance = ldo.balanceOf(lego_program)
+
+    [effects] = simulator.simulate()
+    assert effects.success
+    assert set(effects.balance_diffs) == {
+        BalanceDiff(ldo.address, agent.address, -amount),
+        BalanceDiff(ldo.address, lego_program.address, amount),
+    }
+    # Finance is AppProxyUpgradeable, its storage is written by the delegated implementation
+    assert finance.address in {diff.address for diff in effects.storage_diffs}
+    assert ldo.balanceOf(lego_program) == lego_program_balance
+
+
+@pytest.mark.skip_coverage
+def test_simulate_staking_limit_increase(
+    owner,
+    stranger,
+    agent,
+    ldo,
+    acl,
+    calls_script,
+    node_operators_registry,
+    IncreaseNodeOperatorStakingLimit,
+):
+    "Must attribute storage writes of NodeOperatorsRegistry to the proxy, not to the implementation"
+    easy_track = owner.deploy(
+        EasyTrack,
+        ldo,
+        owner,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    evm_script_executor = owner.deploy(EVMScriptExecutor, calls_script, easy_track)
+    easy_track.setEVMScriptExecutor(evm_script_executor, {"from": owner})
+    increase_node_operator_staking_limit = owner.deploy(
+        IncreaseNodeOperatorStakingLimit, node_operators_registry
+    )
+    easy_track.addEVMScriptFactory(
+        increase_node_operator_staking_limit,
+        create_permission(node_operators_registry, "setNodeOperatorStakingLimit"),
+        {"from": owner},
+    )
+    voting_id, _ = create_voting(
+        evm_script=encode_call_script(
+            [
+                (
+                    acl.address,
+                    acl.grantPermission.encode_input(
+                        evm_script_executor,
+                        node_operators_registry,
+                        node_operators_registry.SET_NODE_OPERATOR_LIMIT_ROLE(),
+                    ),
+                ),
+            ]
+        ),
+        description="Grant permissions to EVMScriptExecutor to set staking limits",
+        tx_params={"from": agent},
+    )
+    execute_voting(voting_id)
+
+    # (active, name, rewardAddress, stakingLimit, stoppedValidators, totalSigningKeys, ...)
+    node_operator_id, node_operator = next(
+        (id, node_operator)
+        for id, node_operator in (
+            (id, node_operators_registry.getNodeOperator(id, False))
+            for id in range(node_operators_registry.getNodeOperatorsCount())
+        )
+        if node_operator[0] and node_operator[3] < node_operator[5]
+    )
+    simulator = EnactmentSimulator(easy_track, stranger, start_block=chain.height)
+    easy_track.createMotion(
+        increase_node_operator_staking_limit,
+        encode_single("(uint256,uint256)", [node_operator_id, node_operator[3] + 1]),
+        {"from": accounts.at(node_operator[2], force=True)},
+    )
+
+    [effects] = simulator.simulate()
+    assert effects.success
+    assert {diff.address for diff in effects.storage_diffs} == {node_operators_registry.address}
+    assert node_operators_registry.getNodeOperator(node_operator_id, False)[3] == node_operator[3]
@@ -0,0 +1,109 @@
+from brownie import chain
+
+from utils import deployed_easy_track
+
+from utils.evm_script_factories_history import (
+    EVMScriptFactoriesHistory,
+    DecodedPermission,
+    decode_permissions,
+    interfaces_selectors,
+    known_contracts,
+)
+
+
+def create_permission(contract, method):
+    return contract.address + getattr(contract, method).signature[2:]
+
+
+def test_factories_at(accounts, owner, evm_script_factories_registry):
+    "Must return EVMScript factories and permissions live at the given block"
+    history = EVMScriptFactoriesHistory(evm_script_factories_registry, chain.height)
+    factory_1, factory_2 = accounts[3], accounts[4]
+    permissions_1 = factory_1.address.lower() + "aabbccdd"
+    permissions_2 = factory_2.address.lower() + "11223344" + factory_2.address.lower()[2:] + "55667788"
+
+    block_before = chain.height
+    tx_1 = evm_script_factories_registry.addEVMScriptFactory(
+        factory_1, permissions_1, {"from": owner}
+    )
+    tx_2 = evm_script_factories_registry.addEVMScriptFactory(
+        factory_2, permissions_2, {"from": owner}
+    )
+    tx_3 = evm_script_factories_registry.removeEVMScriptFactory(factory_1, {"from": owner})
+    history.sync()
+
+    assert history.factories_at(block_before) == {}
+    assert history.factories_at(tx_1.block_number) == {factory_1.address: permissions_1}
+    assert history.factories_at(tx_2.block_number) == {
+        factory_1.address: permissions_1,
+        factory_2.address: permissions_2,
+    }
+    assert history.factories_at(tx_3.block_number) == {factory_2.address: permissions_2}
+    assert history.factories_at(chain.height + 100) == {factory_2.address: permissions_2}
+
+    # incremental sync
+    tx_4 = evm_script_factories_registry.addEVMScriptFactory(
+        factory_1, permissions_1, {"from": owner}
+    )
+    history.sync()
+    assert history.factories_at(tx_3.block_number) == {factory_2.address: permissions_2}
+    assert history.factories_at(tx_4.block_number) == {
+        factory_1.address: permissions_1,
+        factory_2.address: permissions_2,
+    }
+
+
+def test_decode_permissions(node_operators_registry, finance, agent, stranger):
+    "Must decode permissions into (contract, method) tuples using ABIs from interfaces"
+    permissions = (
+        create_permission(node_operators_registry, "setNodeOperatorStakingLimit")
+        + create_permission(finance, "newImmediatePayment")[2:]
+        + stranger.address[2:]
+        + "ffffffff"
+        # the method missing in the interface of the known contract
+        + agent.address[2:]
+        + finance.newImmediatePayment.signature[2:]
+    )
+    decoded = decode_permissions(
+        permissions, known_contracts("mainnet"), interfaces_selectors()
+    )
+    assert decoded == [
+        DecodedPermission(
+            node_operators_registry.address,
+            "NodeOperatorsRegistry",
+            node_operators_registry.setNodeOperatorStakingLimit.signature,
+            "setNodeOperatorStakingLimit",
+        ),
+        DecodedPermission(
+            finance.address,
+            "Finance",
+            finance.newImmediatePayment.signature,
+            "newImmediatePayment",
+        ),
+        DecodedPermission(stranger.address, None, "0xffffffff", None),
+        DecodedPermission(
+            agent.address, "Agent", finance.newImmediatePayment.signature, "newImmediatePayment"
+        ),
+    ]
+    assert str(decoded[0]) == "NodeOperatorsRegistry.setNodeOperatorStakingLimit"
+
+
+def test_decode_reward_programs_registry_permissions(RewardProgramsRegistry):
+    "Must decode methods of deployed RewardProgramsRegistry using the ABI of the project contract"
+    addresses = deployed_easy_track.addresses("mainnet")
+    registries = [
+        addresses.reward_programs.reward_programs_registry,
+        addresses.referral_partners.reward_programs_registry,
+    ]
+    methods = ["addRewardProgram", "removeRewardProgram"]
+    permissions = "0x" + "".join(
+        registry[2:] + RewardProgramsRegistry.signatures[method][2:]
+        for registry in registries
+        for method in methods
+    )
+    decoded = decode_permissions(
+        permissions, known_contracts("mainnet"), interfaces_selectors()
+    )
+    assert [(permission.contract_name, permission.method_name) for permission in decoded] == [
+        ("RewardProgramsRegistry", method) for _ in registries for method in methods
+    ]
@@ -0,0 +1,51 @@
+import json
+
+from utils.gas_benchmark import GasBaseline, GasRegression
+
+
+def test_regression_tolerance(tmp_path):
+    "Must report regression only when gas used exceeds the baseline plus tolerance"
+    path = tmp_path / "gas_baseline.json"
+    path.write_text(json.dumps({"createMotion": 100_000}))
+    baseline = GasBaseline(str(path), tolerance=1.0)
+
+    assert baseline.record("createMotion", 101_000) is None
+    assert baseline.record("createMotion", 90_000) is None
+    assert baseline.record("createMotion", 101_001) == GasRegression(
+        "createMotion", 100_000, 101_001
+    )
+
+
+def test_missing_benchmark(tmp_path):
+    "Must report benchmarks missing in the baseline outside of the update mode"
+    path = tmp_path / "gas_baseline.json"
+    path.write_text(json.dumps({"createMotion": 100_000}))
+
+    assert GasBaseline(str(path)).record("enactMotion", 50_000) == GasRegression(
+        "enactMotion", None, 50_000
+    )
+    assert GasBaseline(str(tmp_path / "missing.json")).record(
+        "createMotion", 100_000
+    ) == GasRegression("createMotion", None, 100_000)
+    assert GasBaseline(str(path), update=True).record("enactMotion", 50_000) is None
+    assert GasBaseline(str(path)).exists
+    assert not GasBaseline(str(tmp_path / "missing.json")).exists
+
+
+def test_save_baseline(tmp_path):
+    "Must write new and changed benchmarks to the baseline only in update mode"
+    path = tmp_path / "gas_baseline.json"
+    path.write_text(json.dumps({"createMotion": 100_000}))
+
+    baseline = GasBaseline(str(path))
+    baseline.record("createMotion", 90_000)
+    baseline.record("enactMotion", 50_000)
+    assert not baseline.save()
+    assert json.loads(path.read_text()) == {"createMotion": 100_000}
+
+    baseline = GasBaseline(str(path), update=True)
+    assert baseline.record("createMotion", 200_000) is None
+    assert baseline.record("enactMotion", 50_000) is None
+    assert baseline.save()
+    assert json.loads(path.read_text()) == {"createMotion": 200_000, "enactMotion": 50_000}
+    assert not baseline.save()
@@ -0,0 +1,69 @@
+import constants
+from brownie import chain
+
+from utils.evm_script import decode_evm_script, encode_call_script
+from utils.motion_enactor import MotionEnactor
+
+
+def test_enact_ready_motions(
+    owner, voting, stranger, easy_track, evm_script_factory_stub, evm_script_executor_stub
+):
+    "Must enact all passed motions in one batch using calldata from MotionCreated logs"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    motion_enactor = MotionEnactor(easy_track, stranger, start_block=chain.height)
+
+    easy_track.createMotion(evm_script_factory_stub, "0xaa", {"from": owner})
+    easy_track.createMotion(evm_script_factory_stub, "0xbb", {"from": owner})
+
+    # motions haven't passed yet
+    assert motion_enactor.enact_ready_motions() == []
+    assert motion_enactor.evm_script_call_data == {1: "0xaa", 2: "0xbb"}
+
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+    chain.mine()
+    easy_track.createMotion(evm_script_factory_stub, "0xcc", {"from": owner})
+
+    results = motion_enactor.enact_ready_motions()
+    assert [result.motion_id for result in results] == [1, 2]
+    assert [result.error for result in results] == [None, None]
+    for result in results:
+        result.tx.wait(1)
+        assert result.tx.status == 1
+        assert "MotionEnacted" in result.tx.events
+
+    assert [motion[0] for motion in easy_track.getMotions()] == [3]
+    assert evm_script_executor_stub.evmScript() == evm_script_factory_stub.DEFAULT_EVM_SCRIPT()
+
+    motion_enactor.sync()
+    assert motion_enactor.evm_script_call_data == {3: "0xcc"}
+
+
+def test_enact_ready_motions_simulation_failed(
+    owner, voting, stranger, easy_track, evm_script_factory_stub
+):
+    "Must skip motions which enactment reverts on simulation"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    motion_enactor = MotionEnactor(easy_track, stranger, start_block=chain.height)
+    easy_track.createMotion(evm_script_factory_stub, "0xaa", {"from": owner})
+
+    # EVMScript changes after motion creation
+    [(to, calldata)] = decode_evm_script(evm_script_factory_stub.DEFAULT_EVM_SCRIPT())
+    evm_script_factory_stub.setEVMScript(
+        encode_call_script([(to, calldata[:-2] + "ff")]), {"from": owner}
+    )
+    chain.sleep(constants.MIN_MOTION_DURATION + 1)
+    chain.mine()
+
+    [result] = motion_enactor.enact_ready_motions()
+    assert result.motion_id == 1
+    assert result.tx is None
+    assert result.error == "UNEXPECTED_EVM_SCRIPT"
+    assert len(easy_track.getMotions()) == 1
@@ -17,6 +17,7 @@ def test_deploy(owner, MotionSettings):
     assert contract.MAX_MOTIONS_LIMIT() == constants.MAX_MOTIONS_LIMIT
     assert contract.MAX_OBJECTIONS_THRESHOLD() == constants.MAX_OBJECTIONS_THRESHOLD
     assert contract.MIN_MOTION_DURATION() == constants.MIN_MOTION_DURATION
+    assert contract.MAX_MOTION_DURATION() == constants.MAX_MOTION_DURATION
 
     # roles
     assert contract.hasRole(contract.DEFAULT_ADMIN_ROLE(), owner)
@@ -54,6 +55,15 @@ def test_set_motion_duration_called_with_too_small_value(owner, motion_settings)
         motion_settings.setMotionDuration(motion_duration, {"from": owner})
 
 
+def test_set_motion_duration_called_with_too_large_value(owner, motion_settings):
+    "Must revert with 'VALUE_TOO_LARGE' message if value doesn't fit into uint32"
+    max_motion_duration = motion_settings.MAX_MOTION_DURATION()
+    motion_settings.setMotionDuration(max_motion_duration, {"from": owner})
+    assert motion_settings.motionDuration() == max_motion_duration
+    with reverts("VALUE_TOO_LARGE"):
+        motion_settings.setMotionDuration(max_motion_duration + 1, {"from": owner})
+
+
 def test_set_objections_threshold_called_with_permissions(owner, motion_settings):
     "Must update objections threshold when value is less or equal"
     "than MAX_OBJECTIONS_THRESHOLD and emits ObjectionsThresholdChanged(_newThreshold) event"
@@ -0,0 +1,159 @@
+import json
+import asyncio
+
+from brownie import web3
+
+import constants
+
+from utils.evm_script import decode_evm_script
+from utils.motion_watcher import FileSink, MotionWatcher, NetworkWatcher, WebhookSink
+
+
+class MemorySink:
+    def __init__(self):
+        self.records = []
+
+    async def emit(self, record):
+        self.records.append(record)
+
+
+def test_decode_evm_script(evm_script_factory_stub):
+    "Must split EVMScript into list of (to, calldata) tuples"
+    [(to, calldata)] = decode_evm_script(evm_script_factory_stub.DEFAULT_EVM_SCRIPT())
+    assert to.lower() == "0x420b1099b9ef5baba6d92029594ef45e19a04a4a"
+    assert calldata == (
+        "0xae962acf"
+        + "0000000000000000000000000000000000000000000000000000000000000001"
+        + "00000000000000000000000000000000000000000000000000000000000001f4"
+    )
+
+
+def test_poll_once(tmp_path, owner, voting, easy_track, evm_script_factory_stub):
+    "Must push alert with decoded EVMScript of every created motion to all sinks"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    network_watcher = NetworkWatcher(
+        network="development",
+        web3=web3,
+        easy_track_address=easy_track.address,
+        start_block=web3.eth.block_number + 1,
+        max_block_range=1,
+    )
+    memory_sink = MemorySink()
+    webhook_sink = WebhookSink("http://localhost/alerts")
+    alerts_file = tmp_path / "alerts.jsonl"
+    motion_watcher = MotionWatcher(
+        [network_watcher], [memory_sink, webhook_sink, FileSink(alerts_file)]
+    )
+
+    create_tx = easy_track.createMotion(evm_script_factory_stub, "0xaabb", {"from": owner})
+    easy_track.createMotion(evm_script_factory_stub, "0xccdd", {"from": owner})
+    asyncio.run(motion_watcher.poll_once())
+
+    assert [record["motion_id"] for record in memory_sink.records] == [1, 2]
+    alert = memory_sink.records[0]
+    assert alert["type"] == "motion_created"
+    assert alert["network"] == "development"
+    assert alert["creator"] == owner
+    assert alert["evm_script_factory"] == evm_script_factory_stub
+    assert alert["evm_script_call_data"] == "0xaabb"
+    assert alert["decoded_evm_script_call_data"] is None
+    assert alert["evm_script"] == evm_script_factory_stub.DEFAULT_EVM_SCRIPT()
+    assert alert["evm_script_hash"] == easy_track.getMotion(1)[8]
+    assert alert["actions"][0]["selector"] == "0xae962acf"
+    assert alert["block_number"] == create_tx.block_number
+    assert alert["transaction_hash"] == create_tx.txid
+
+    assert len(webhook_sink.outbox) == 2
+    assert json.loads(webhook_sink.outbox[1])["motion_id"] == 2
+    assert len(alerts_file.read_text().splitlines()) == 2
+
+    # next poll must not repeat already dispatched alerts
+    asyncio.run(motion_watcher.poll_once())
+    assert len(memory_sink.records) == 2
+
+    metrics = motion_watcher.metrics()
+    assert metrics["networks"][0]["alert_latency"]["count"] == 2
+    assert metrics["dispatch_latency"]["count"] == 2
+
+
+def test_poll_once_compact_event(
+    owner, voting, ldo, evm_script_factory_stub, CompactEasyTrack
+):
+    "Must push alert for motions logged with MotionCreatedCompact event"
+    compact_easy_track = owner.deploy(
+        CompactEasyTrack,
+        ldo,
+        voting,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    compact_easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    network_watcher = NetworkWatcher(
+        network="development",
+        web3=web3,
+        easy_track_address=compact_easy_track.address,
+        start_block=web3.eth.block_number + 1,
+    )
+    memory_sink = MemorySink()
+    motion_watcher = MotionWatcher([network_watcher], [memory_sink])
+
+    compact_easy_track.createMotion(evm_script_factory_stub, "0xaabb", {"from": owner})
+    asyncio.run(motion_watcher.poll_once())
+
+    [alert] = memory_sink.records
+    assert alert["motion_id"] == 1
+    assert alert["evm_script_call_data"] == "0xaabb"
+    assert alert["evm_script_hash"] == compact_easy_track.getMotion(1)[8]
+    # EVMScript of unknown factory can't be reconstructed off-chain
+    assert alert["evm_script"] is None
+    assert alert["actions"] == []
+
+
+def test_run_survives_failed_polls(owner, voting, easy_track, evm_script_factory_stub):
+    "Must keep polling all networks when polls of one of them fail"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub,
+        evm_script_factory_stub.DEFAULT_PERMISSIONS(),
+        {"from": voting},
+    )
+    network_watcher = NetworkWatcher(
+        network="development",
+        web3=web3,
+        easy_track_address=easy_track.address,
+        start_block=web3.eth.block_number + 1,
+    )
+    broken_network_watcher = NetworkWatcher(
+        network="broken", web3=web3, easy_track_address=easy_track.address, max_backoff=0.05
+    )
+
+    async def broken_poll(queue):
+        raise ConnectionError("node is unavailable")
+
+    broken_network_watcher.poll = broken_poll
+    memory_sink = MemorySink()
+    motion_watcher = MotionWatcher(
+        [broken_network_watcher, network_watcher], [memory_sink], poll_interval=0.01
+    )
+    easy_track.createMotion(evm_script_factory_stub, "0xaabb", {"from": owner})
+
+    async def run_until_alerted():
+        stop = asyncio.Event()
+        task = asyncio.create_task(motion_watcher.run(stop))
+        while not memory_sink.records or broken_network_watcher.failed_polls < 3:
+            await asyncio.sleep(0.01)
+        stop.set()
+        await task
+
+    asyncio.run(asyncio.wait_for(run_until_alerted(), timeout=30))
+    alerts = [record for record in memory_sink.records if record["type"] == "motion_created"]
+    assert [alert["motion_id"] for alert in alerts] == [1]
+    assert motion_watcher.metrics()["networks"][0]["failed_polls"] >= 3
@@ -0,0 +1,32 @@
+from brownie import chain
+
+from utils.evm_script_factories import SET_NODE_OPERATOR_STAKING_LIMIT
+from utils.motions_preflight import CandidateMotion, preflight_motions
+
+
+def test_preflight_motions(owner, stranger, voting, easy_track, evm_script_factory_stub):
+    "Must simulate creation of motions in sequence and revert the chain afterwards"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub, evm_script_factory_stub.DEFAULT_PERMISSIONS(), {"from": voting}
+    )
+    easy_track.setMotionsCountLimit(2, {"from": voting})
+    height = chain.height
+
+    candidate = CandidateMotion(evm_script_factory_stub.address, "0x", stranger.address)
+    unknown_factory = CandidateMotion(owner.address, "0x", stranger.address)
+    results = preflight_motions(easy_track, [candidate, unknown_factory, candidate, candidate])
+
+    assert [result.success for result in results] == [True, False, True, False]
+    assert results[1].revert_msg == "EVM_SCRIPT_FACTORY_NOT_FOUND"
+    assert results[3].revert_msg == "MOTIONS_LIMIT_REACHED"
+    assert [result.motion_id for result in results] == [1, None, 2, None]
+    assert results[0].gas_used > 0 and results[3].gas_used is None
+
+    assert results[0].evm_script == "0x" + bytes(evm_script_factory_stub.DEFAULT_EVM_SCRIPT()).hex()
+    [action] = results[0].actions
+    assert action.method == SET_NODE_OPERATOR_STAKING_LIMIT
+    assert action.args == (1, 500)
+    assert results[0].as_dict()["actions"][0]["args"] == ["1", "500"]
+
+    assert chain.height == height
+    assert easy_track.getMotions() == []
@@ -0,0 +1,159 @@
+import constants
+import eth_abi
+
+from utils.easy_track_model import EasyTrackModel, MiniMeTokenModel, StaticEVMScriptFactoryModel
+from utils.motions_scheduler import MotionsScheduler, PendingOperation
+
+ADMIN = "0x00000000000000000000000000000000000000a1"
+CREATOR = "0x00000000000000000000000000000000000000c1"
+ADD_REWARD_PROGRAM = "0x00000000000000000000000000000000000000f1"
+TOP_UP_REWARD_PROGRAMS = "0x00000000000000000000000000000000000000f2"
+INCREASE_STAKING_LIMITS = "0x00000000000000000000000000000000000000f3"
+ADD_REWARD_PROGRAMS = "0x00000000000000000000000000000000000000f4"
+RECIPIENTS = ["0x00000000000000000000000000000000000000e" + str(i) for i in range(5)]
+MOTION_DURATION = 72 * 60 * 60
+MOTIONS_COUNT_LIMIT = 12
+
+FACTORY_NAMES = {
+    ADD_REWARD_PROGRAM: "AddRewardProgram",
+    TOP_UP_REWARD_PROGRAMS: "TopUpRewardPrograms",
+    INCREASE_STAKING_LIMITS: "IncreaseNodeOperatorsStakingLimits",
+    ADD_REWARD_PROGRAMS: "AddRewardPrograms",
+}
+TARGET = bytes.fromhex("420b1099b9ef5baba6d92029594ef45e19a04a4a")
+SELECTOR = bytes.fromhex("ae962acf")
+EVM_SCRIPT = bytes.fromhex("00000001") + TARGET + (4).to_bytes(4, "big") + SELECTOR
+
+
+def create_model(now):
+    model = EasyTrackModel(
+        MiniMeTokenModel(),
+        ADMIN,
+        MOTION_DURATION,
+        MOTIONS_COUNT_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+        timestamp=now,
+    )
+    for factory in FACTORY_NAMES:
+        model.add_evm_script_factory(
+            ADMIN, factory, TARGET + SELECTOR, StaticEVMScriptFactoryModel(EVM_SCRIPT)
+        )
+    return model
+
+
+def test_pack_batches():
+    "Must pack items of batch factories into the min number of motions with unique keys"
+    scheduler = MotionsScheduler(FACTORY_NAMES, {"AddRewardPrograms": 3})
+    add_reward_programs = [
+        PendingOperation(ADD_REWARD_PROGRAMS, (RECIPIENTS[i % 4], "title")) for i in range(8)
+    ]
+    add_reward_programs.append(
+        PendingOperation(ADD_REWARD_PROGRAMS, (RECIPIENTS[0].replace("e", "E"), "title"))
+    )
+    add_reward_program = [
+        PendingOperation(ADD_REWARD_PROGRAM, (recipient, "title")) for recipient in RECIPIENTS[:2]
+    ]
+    motions = scheduler.pack(add_reward_program[:1] + add_reward_programs + add_reward_program[1:])
+
+    # motions of the factory go in a row
+    assert [len(motion) for motion in motions] == [1, 1, 3, 3, 3]
+    assert motions[:2] == [add_reward_program[:1], add_reward_program[1:]]
+    for motion in motions[2:]:
+        recipients = [operation.args[0].lower() for operation in motion]
+        assert len(set(recipients)) == len(recipients)
+    assert sorted(op for motion in motions[2:] for op in motion) == sorted(add_reward_programs)
+
+    call_data = scheduler.encode_call_data(motions[2])
+    recipients, titles = eth_abi.decode_single(
+        "(address[],string[])", bytes.fromhex(call_data[2:])
+    )
+    assert [recipient.lower() for recipient in recipients] == [
+        op.args[0].lower() for op in motions[2]
+    ]
+    assert list(titles) == ["title"] * 3
+
+
+def test_pack_top_ups_with_repeated_recipients():
+    "Must pack top ups of the same recipient into the same motion in order"
+    scheduler = MotionsScheduler(FACTORY_NAMES, {"TopUpRewardPrograms": 4})
+    top_ups = [PendingOperation(TOP_UP_REWARD_PROGRAMS, (RECIPIENTS[i % 2], i)) for i in range(7)]
+    motions = scheduler.pack(top_ups)
+    assert motions == [top_ups[:4], top_ups[4:]]
+
+    call_data = scheduler.encode_call_data(motions[0])
+    recipients, amounts = eth_abi.decode_single(
+        "(address[],uint256[])", bytes.fromhex(call_data[2:])
+    )
+    assert [recipient.lower() for recipient in recipients] == [RECIPIENTS[0], RECIPIENTS[1]] * 2
+    assert list(amounts) == [0, 1, 2, 3]
+
+
+def test_pack_sorted_node_operators():
+    "Must sort node operators ids in motions of IncreaseNodeOperatorsStakingLimits"
+    scheduler = MotionsScheduler(FACTORY_NAMES)
+    operations = [
+        PendingOperation(INCREASE_STAKING_LIMITS, (node_operator_id, 100))
+        for node_operator_id in [5, 1, 3, 1]
+    ]
+    motions = scheduler.pack(operations)
+    assert [[op.args[0] for op in motion] for motion in motions] == [[1, 5], [1, 3]]
+
+
+def test_plan_on_model():
+    "Must plan motions which never hit the motions limit and never leave slots idle"
+    now = 1_000_000
+    model = create_model(now - MOTION_DURATION)
+    for index in range(7):
+        model.create_motion(CREATOR, ADD_REWARD_PROGRAM)
+        model.advance(seconds=MOTION_DURATION // 7)
+    model.timestamp = now
+
+    scheduler = MotionsScheduler(FACTORY_NAMES)
+    operations = [PendingOperation(ADD_REWARD_PROGRAM, (RECIPIENTS[0], "title"))] * 30
+    operations += [PendingOperation(ADD_REWARD_PROGRAMS, (RECIPIENTS[0], "title"))] * 3
+    schedule = scheduler.plan(
+        operations, model.get_motions(), MOTIONS_COUNT_LIMIT, MOTION_DURATION, now
+    )
+    assert len(schedule.motions) == 33
+
+    # the motion is submitted later than now only when all slots were taken right before it
+    intervals = [(m[4], max(now, m[4] + m[3])) for m in model.get_motions()] + [
+        (motion.submit_at, motion.enact_at) for motion in schedule.motions
+    ]
+    for motion in schedule.motions:
+        if motion.submit_at > now:
+            busy = [start for start, end in intervals if start < motion.submit_at <= end]
+            assert len(busy) == MOTIONS_COUNT_LIMIT
+
+    # run the schedule on the model of EasyTrack enacting motions as soon as they pass
+    for planned in sorted(schedule.motions, key=lambda motion: motion.submit_at):
+        model.timestamp = planned.submit_at
+        for motion in list(model.motions):
+            if motion.start_date + motion.duration <= model.timestamp:
+                model.enact_motion(CREATOR, motion.id, b"")
+        model.create_motion(CREATOR, planned.factory, planned.evm_script_call_data)
+
+    last_enact_at = max(m.start_date + m.duration for m in model.motions)
+    assert schedule.makespan == last_enact_at - now
+    # 40 motions in 12 slots take 4 waves, 7 slots of the first wave are released before its end
+    assert 3 * MOTION_DURATION < schedule.makespan < 4 * MOTION_DURATION
+
+
+def test_plan_live(owner, voting, stranger, easy_track, evm_script_factory_stub):
+    "Must start planning from the end of active motions when the limit is reached"
+    easy_track.addEVMScriptFactory(
+        evm_script_factory_stub, evm_script_factory_stub.DEFAULT_PERMISSIONS(), {"from": voting}
+    )
+    easy_track.setMotionsCountLimit(1, {"from": voting})
+    tx = easy_track.createMotion(evm_script_factory_stub, b"", {"from": stranger})
+
+    scheduler = MotionsScheduler({evm_script_factory_stub.address: "RemoveRewardProgram"})
+    schedule = scheduler.plan_live(
+        easy_track, [PendingOperation(evm_script_factory_stub.address, (stranger.address,))]
+    )
+    [motion] = schedule.motions
+    assert motion.submit_at == tx.timestamp + easy_track.motionDuration()
+    assert motion.enact_at == motion.submit_at + easy_track.motionDuration()
+    assert motion.evm_script_call_data == "0x" + eth_abi.encode_single(
+        "(address)", (stranger.address,)
+    ).hex()
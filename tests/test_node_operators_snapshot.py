@@ -0,0 +1,64 @@
+from brownie import chain
+
+from utils.node_operators_snapshot import NodeOperatorsSnapshot, NodeOperatorsSnapshots
+
+
+def test_fetch(node_operators_registry):
+    "Must fetch state of all node operators at the pinned block"
+    block_number = chain.height
+    snapshot = NodeOperatorsSnapshot.fetch(node_operators_registry, block_number)
+    assert snapshot.block_number == block_number
+    assert len(snapshot.node_operators) == node_operators_registry.getNodeOperatorsCount()
+
+    for id, node_operator in snapshot.node_operators.items():
+        expected = node_operators_registry.getNodeOperator(id, False)
+        assert node_operator.active == expected[0]
+        assert node_operator.reward_address == expected[2]
+        assert node_operator.staking_limit == expected[3]
+        assert node_operator.total_signing_keys == expected[5]
+
+
+def test_snapshots_cache(stranger, node_operators_registry_stub):
+    "Must reuse snapshots at the same block and drop them when the block is replaced"
+    snapshots = NodeOperatorsSnapshots(node_operators_registry_stub, max_size=2)
+    height = chain.height
+    snapshot = snapshots.get(height, node_operator_ids=[1])
+    assert snapshots.get(height, node_operator_ids=[1]) is snapshot
+    assert snapshot.node_operators[1].staking_limit == 200
+
+    node_operators_registry_stub.setStakingLimit(300, {"from": stranger})
+    assert snapshots.get(height + 1, [1]).node_operators[1].staking_limit == 300
+    # the block at the same height is replaced after the undo
+    chain.undo()
+    node_operators_registry_stub.setStakingLimit(250, {"from": stranger})
+    assert snapshots.get(height + 1, [1]).node_operators[1].staking_limit == 250
+
+    # the least recently used snapshot is evicted
+    assert snapshots.get(height, [1]) is not snapshot
+
+
+def test_validate(node_operator, stranger, node_operators_registry_stub):
+    "Must validate proposed staking limits with the same rules as IncreaseNodeOperatorStakingLimit"
+    # stub has stakingLimit == 200 and totalSigningKeys == 400
+    snapshot = NodeOperatorsSnapshot.fetch(
+        node_operators_registry_stub, chain.height, node_operator_ids=[1]
+    )
+    assert snapshot.max_staking_limits() == {1: 400}
+    assert snapshot.validate([1, 1, 1, 1, 2], [201, 400, 200, 401, 300]) == [
+        None,
+        None,
+        "STAKING_LIMIT_TOO_LOW",
+        "NOT_ENOUGH_SIGNING_KEYS",
+        "NODE_OPERATOR_NOT_FOUND",
+    ]
+    assert snapshot.validate([1, 1], [300, 300], creators=[node_operator, stranger]) == [
+        None,
+        "CALLER_IS_NOT_NODE_OPERATOR",
+    ]
+
+    node_operators_registry_stub.setActive(False)
+    disabled_snapshot = NodeOperatorsSnapshot.fetch(
+        node_operators_registry_stub, chain.height, node_operator_ids=[1]
+    )
+    assert disabled_snapshot.max_staking_limits() == {1: None}
+    assert disabled_snapshot.validate([1], [300]) == ["NODE_OPERATOR_DISABLED"]
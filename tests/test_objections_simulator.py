@@ -0,0 +1,77 @@
+import pytest
+import constants
+from brownie import chain
+
+from utils.objections_simulator import (
+    HUNDRED_PERCENT,
+    holder_balances_at,
+    min_rejecting_amount,
+    participation_for_duration,
+    simulate_rejection_rates,
+)
+
+TOTAL_SUPPLY = 10 ** 27
+
+
+def test_min_rejecting_amount():
+    "Must return the min amount which gives objections percent not less than threshold"
+    threshold = constants.DEFAULT_OBJECTIONS_THRESHOLD
+    amount = min_rejecting_amount(threshold, TOTAL_SUPPLY + 1)
+    assert HUNDRED_PERCENT * amount // (TOTAL_SUPPLY + 1) == threshold
+    assert HUNDRED_PERCENT * (amount - 1) // (TOTAL_SUPPLY + 1) == threshold - 1
+
+
+def test_exact_integer_math():
+    "Must reject motions the same way as EasyTrack does without rounding of balances"
+    threshold = constants.DEFAULT_OBJECTIONS_THRESHOLD
+    amount = min_rejecting_amount(threshold, TOTAL_SUPPLY)
+    # the amount is split between many holders to check the sum of limbs
+    balances = [amount // 1000] * 999 + [amount - amount // 1000 * 999]
+
+    result = simulate_rejection_rates(balances, TOTAL_SUPPLY, 1.0, [threshold], trials=100)
+    assert result.rejection_rates == {threshold: 1.0}
+
+    balances[-1] -= 1
+    result = simulate_rejection_rates(
+        balances, TOTAL_SUPPLY, 1.0, [threshold, threshold - 1], trials=100
+    )
+    assert result.rejection_rates == {threshold: 0.0, threshold - 1: 1.0}
+
+
+def test_rejection_rates():
+    "Must reject motion only when objections reach threshold"
+    whale = min_rejecting_amount(constants.MAX_OBJECTIONS_THRESHOLD, TOTAL_SUPPLY)
+    result = simulate_rejection_rates(
+        [whale, 1, 0], TOTAL_SUPPLY, [0.25, 0.0, 1.0], [0, 500], trials=100_000, seed=1
+    )
+    # objection from the holder without tokens reverts and can't reject motion
+    assert result.rejection_rates[0] == result.rejection_rates[500]
+    assert abs(result.rejection_rates[500] - 0.25) < 5 * result.standard_error(500)
+
+
+def test_participation_for_duration():
+    "Must return probability to object at least once during the motion"
+    assert participation_for_duration(0.5, 2 * 24 * 60 * 60) == 0.75
+    assert participation_for_duration(0.0, constants.MIN_MOTION_DURATION) == 0
+
+
+def test_holder_balances_at(ldo, ldo_holders, stranger, distribute_holder_balance):
+    "Must fetch balances of holders at the snapshot block"
+    block = chain.height
+    ldo.transfer(stranger, 1, {"from": ldo_holders[0]})
+    holders = list(ldo_holders) + [stranger]
+    assert holder_balances_at(ldo, holders, block) == [
+        ldo.balanceOfAt(holder, block) for holder in holders
+    ]
+    assert holder_balances_at(ldo, [stranger], chain.height) == [1]
+
+
+@pytest.mark.skip_coverage
+def test_million_trials():
+    "Must simulate 10^6 trials of hundreds of holders"
+    balances = [TOTAL_SUPPLY // 1000 + index for index in range(300)]
+    result = simulate_rejection_rates(
+        balances, TOTAL_SUPPLY, 0.01, [50, 100, 500], trials=10 ** 6, seed=1
+    )
+    rates = result.rejection_rates
+    assert 1 >= rates[50] >= rates[100] >= rates[500] >= 0
@@ -124,3 +124,85 @@ def test_remove_reward_program(
         assert len(set(reward_programs).union(contract_reward_programs)) == len(
             contract_reward_programs
         )
+
+
+def test_are_reward_programs(accounts, evm_script_executor_stub, reward_programs_registry):
+    "Must return if each of passed addresses is listed as reward program"
+    reward_programs_registry.addRewardProgram(
+        accounts[1], "Reward Program 1", {"from": evm_script_executor_stub}
+    )
+    reward_programs_registry.addRewardProgram(
+        accounts[3], "Reward Program 3", {"from": evm_script_executor_stub}
+    )
+    assert reward_programs_registry.areRewardPrograms([]) == []
+    assert reward_programs_registry.areRewardPrograms(accounts[:5]) == [
+        False,
+        True,
+        False,
+        True,
+        False,
+    ]
+
+
+def test_add_reward_programs(
+    accounts, evm_script_executor_stub, stranger, reward_programs_registry
+):
+    "Must add all reward programs and emit RewardProgramAdded event for each of them."
+    "Fails with 'LENGTH_MISMATCH' or 'REWARD_PROGRAM_ALREADY_ADDED' errors on invalid input"
+    with reverts(
+        access_controll_revert_message(
+            stranger, reward_programs_registry.ADD_REWARD_PROGRAM_ROLE()
+        )
+    ):
+        reward_programs_registry.addRewardPrograms([stranger], [""], {"from": stranger})
+
+    with reverts("LENGTH_MISMATCH"):
+        reward_programs_registry.addRewardPrograms(
+            accounts[1:3], ["Reward Program 1"], {"from": evm_script_executor_stub}
+        )
+
+    tx = reward_programs_registry.addRewardPrograms(
+        accounts[1:3],
+        ["Reward Program 1", "Reward Program 2"],
+        {"from": evm_script_executor_stub},
+    )
+    assert len(tx.events["RewardProgramAdded"]) == 2
+    assert tx.events["RewardProgramAdded"][1]["_rewardProgram"] == accounts[2]
+    assert tx.events["RewardProgramAdded"][1]["_title"] == "Reward Program 2"
+    assert reward_programs_registry.getRewardPrograms() == accounts[1:3]
+
+    with reverts("REWARD_PROGRAM_ALREADY_ADDED"):
+        reward_programs_registry.addRewardPrograms(
+            [accounts[3], accounts[2]], ["", ""], {"from": evm_script_executor_stub}
+        )
+
+
+def test_remove_reward_programs(
+    accounts, evm_script_executor_stub, stranger, reward_programs_registry
+):
+    "Must remove all reward programs and emit RewardProgramRemoved event for each of them."
+    "Fails with 'REWARD_PROGRAM_NOT_FOUND' error if any of reward programs isn't listed"
+    reward_programs_registry.addRewardPrograms(
+        accounts[1:4], ["", "", ""], {"from": evm_script_executor_stub}
+    )
+
+    with reverts(
+        access_controll_revert_message(
+            stranger, reward_programs_registry.REMOVE_REWARD_PROGRAM_ROLE()
+        )
+    ):
+        reward_programs_registry.removeRewardPrograms([accounts[1]], {"from": stranger})
+
+    with reverts("REWARD_PROGRAM_NOT_FOUND"):
+        reward_programs_registry.removeRewardPrograms(
+            [accounts[1], accounts[4]], {"from": evm_script_executor_stub}
+        )
+
+    tx = reward_programs_registry.removeRewardPrograms(
+        [accounts[1], accounts[3]], {"from": evm_script_executor_stub}
+    )
+    assert [e["_rewardProgram"] for e in tx.events["RewardProgramRemoved"]] == [
+        accounts[1],
+        accounts[3],
+    ]
+    assert reward_programs_registry.getRewardPrograms() == [accounts[2]]
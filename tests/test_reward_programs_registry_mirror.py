@@ -0,0 +1,63 @@
+from brownie import chain
+
+from utils.reward_programs_registry_mirror import (
+    RewardProgramsRegistryMirror,
+    TopUpValidationError,
+)
+
+
+def test_sync(accounts, reward_programs_registry, evm_script_executor_stub):
+    "Must apply added and removed reward programs incrementally"
+    mirror = RewardProgramsRegistryMirror(reward_programs_registry, chain.height)
+    reward_programs = accounts[3:6]
+
+    for index, reward_program in enumerate(reward_programs):
+        reward_programs_registry.addRewardProgram(
+            reward_program, f"Program #{index}", {"from": evm_script_executor_stub}
+        )
+    mirror.sync()
+    assert mirror.reward_programs == {
+        reward_programs[0].address: "Program #0",
+        reward_programs[1].address: "Program #1",
+        reward_programs[2].address: "Program #2",
+    }
+    assert mirror.is_in_sync()
+
+    reward_programs_registry.removeRewardProgram(
+        reward_programs[1], {"from": evm_script_executor_stub}
+    )
+    # re-adding in the same sync range must keep the latest state
+    reward_programs_registry.removeRewardProgram(
+        reward_programs[0], {"from": evm_script_executor_stub}
+    )
+    reward_programs_registry.addRewardProgram(
+        reward_programs[0], "Program #0 v2", {"from": evm_script_executor_stub}
+    )
+    mirror.sync()
+    assert mirror.reward_programs == {
+        reward_programs[0].address: "Program #0 v2",
+        reward_programs[2].address: "Program #2",
+    }
+    assert mirror.is_reward_program(reward_programs[0].address.lower())
+    assert not mirror.is_reward_program(reward_programs[1])
+    assert mirror.is_in_sync()
+
+
+def test_validate_top_up(accounts, reward_programs_registry, evm_script_executor_stub):
+    "Must report all errors which make TopUpRewardPrograms revert"
+    mirror = RewardProgramsRegistryMirror(reward_programs_registry, chain.height)
+    allowed, not_allowed = accounts[3], accounts[4]
+    reward_programs_registry.addRewardProgram(
+        allowed, "", {"from": evm_script_executor_stub}
+    )
+    mirror.sync()
+
+    assert mirror.validate_top_up([allowed], [1, 2]) == [
+        TopUpValidationError(None, "LENGTH_MISMATCH")
+    ]
+    assert mirror.validate_top_up([], []) == [TopUpValidationError(None, "EMPTY_DATA")]
+    assert mirror.validate_top_up([allowed, allowed], [10 ** 18, 10 ** 18]) == []
+    assert mirror.validate_top_up([allowed, not_allowed, allowed], [1, 1, 0]) == [
+        TopUpValidationError(1, "REWARD_PROGRAM_NOT_ALLOWED"),
+        TopUpValidationError(2, "ZERO_AMOUNT"),
+    ]
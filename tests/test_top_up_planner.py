@@ -0,0 +1,154 @@
+import pytest
+import constants
+import eth_abi
+
+from brownie import EasyTrack, EVMScriptExecutor, accounts, chain
+from utils.deployment import create_permission
+from utils.evm_script import encode_call_script
+from utils.lido import create_voting, execute_voting
+from utils.top_up_planner import (
+    LinearGasModel,
+    TopUpGasModel,
+    fit_linear_gas_model,
+    measure_top_up_gas,
+    plan_top_up_motions,
+    read_payouts_csv,
+)
+
+RECIPIENTS = ["0x" + format(index + 1, "040x") for index in range(40)]
+GAS_MODEL = TopUpGasModel(
+    create_motion=LinearGasModel(base=100_000, per_item=10_000),
+    enact_motion=LinearGasModel(base=150_000, per_item=30_000),
+)
+
+
+def test_fit_linear_gas_model():
+    "Must fit the model which never underestimates measured gas"
+    samples = [(1, 131_000), (5, 249_500), (10, 401_000), (20, 700_000)]
+    model = fit_linear_gas_model(samples)
+    assert 29_000 < model.per_item < 31_000
+    assert all(model.predict(size) >= gas_used for size, gas_used in samples)
+    assert any(model.predict(size) - gas_used <= model.per_item for size, gas_used in samples)
+
+    with pytest.raises(ValueError):
+        fit_linear_gas_model([(5, 100), (5, 200)])
+
+
+def test_plan_top_up_motions():
+    "Must split payouts into the min number of motions under the gas ceiling"
+    payouts = [(recipient, index + 1) for index, recipient in enumerate(RECIPIENTS[:23])]
+    # enactMotion of 10 recipients takes 450_000 gas, the max among both methods
+    assert GAS_MODEL.max_items(460_000) == 10
+
+    planned = plan_top_up_motions(payouts, GAS_MODEL, 460_000)
+    assert [len(motion.recipients) for motion in planned] == [8, 8, 7]
+    assert [motion.enact_motion_gas for motion in planned] == [390_000, 390_000, 360_000]
+    assert [motion.create_motion_gas for motion in planned] == [180_000, 180_000, 170_000]
+    assert [
+        (recipient, amount)
+        for motion in planned
+        for recipient, amount in zip(motion.recipients, motion.amounts)
+    ] == payouts
+
+    recipients, amounts = eth_abi.decode_single(
+        "(address[],uint256[])", bytes.fromhex(planned[2].evm_script_call_data[2:])
+    )
+    assert [recipient.lower() for recipient in recipients] == planned[2].recipients
+    assert list(amounts) == planned[2].amounts
+
+    with pytest.raises(ValueError):
+        plan_top_up_motions(payouts, GAS_MODEL, 170_000)
+
+
+def test_read_payouts_csv(tmp_path):
+    "Must read payouts with or without header"
+    path = tmp_path / "payouts.csv"
+    path.write_text(f"recipient,amount\n{RECIPIENTS[0]},5e18\n\n{RECIPIENTS[1]}, 1000\n")
+    assert read_payouts_csv(path) == [(RECIPIENTS[0], 5 * 10 ** 18), (RECIPIENTS[1], 1000)]
+
+    path.write_text(f"{RECIPIENTS[0]},1\n")
+    assert read_payouts_csv(path) == [(RECIPIENTS[0], 1)]
+
+
+@pytest.mark.skip_coverage
+def test_planned_motions_gas(
+    agent, voting, finance, ldo, calls_script, acl, RewardProgramsRegistry, TopUpRewardPrograms
+):
+    "Must predict gas of planned motions not less than used by their enactments"
+    deployer = accounts[0]
+    trusted_address = accounts[7]
+
+    easy_track = deployer.deploy(
+        EasyTrack,
+        ldo,
+        deployer,
+        constants.MIN_MOTION_DURATION,
+        constants.MAX_MOTIONS_LIMIT,
+        constants.DEFAULT_OBJECTIONS_THRESHOLD,
+    )
+    evm_script_executor = deployer.deploy(EVMScriptExecutor, calls_script, easy_track)
+    easy_track.setEVMScriptExecutor(evm_script_executor, {"from": deployer})
+    reward_programs_registry = deployer.deploy(
+        RewardProgramsRegistry,
+        voting,
+        [voting, evm_script_executor],
+        [voting, evm_script_executor],
+    )
+    top_up_reward_programs = deployer.deploy(
+        TopUpRewardPrograms, trusted_address, reward_programs_registry, finance, ldo
+    )
+    easy_track.addEVMScriptFactory(
+        top_up_reward_programs,
+        create_permission(finance, "newImmediatePayment"),
+        {"from": deployer},
+    )
+    reward_programs_registry.addRewardPrograms(
+        RECIPIENTS, ["Reward Program"] * len(RECIPIENTS), {"from": voting}
+    )
+
+    voting_id, _ = create_voting(
+        evm_script=encode_call_script(
+            [
+                (
+                    acl.address,
+                    acl.grantPermission.encode_input(
+                        evm_script_executor, finance, finance.CREATE_PAYMENTS_ROLE()
+                    ),
+                ),
+            ]
+        ),
+        description="Grant permissions to EVMScriptExecutor to make payments",
+        tx_params={"from": agent},
+    )
+    execute_voting(voting_id)
+
+    amount = 10 ** 18
+    height = chain.height
+    gas_model = measure_top_up_gas(
+        easy_track, top_up_reward_programs, trusted_address, RECIPIENTS, amount=amount
+    )
+    assert chain.height == height
+    assert len(easy_track.getMotions()) == 0
+
+    gas_ceiling = gas_model.enact_motion.predict(12)
+    planned = plan_top_up_motions(
+        [(recipient, amount) for recipient in RECIPIENTS], gas_model, gas_ceiling
+    )
+    assert len(planned) == 4
+
+    for motion in planned:
+        create_tx = easy_track.createMotion(
+            top_up_reward_programs, motion.evm_script_call_data, {"from": trusted_address}
+        )
+        chain.sleep(constants.MIN_MOTION_DURATION + 1)
+        enact_tx = easy_track.enactMotion(
+            create_tx.events["MotionCreated"]["_motionId"],
+            motion.evm_script_call_data,
+            {"from": trusted_address},
+        )
+        assert create_tx.gas_used <= motion.create_motion_gas <= gas_ceiling
+        assert enact_tx.gas_used <= motion.enact_motion_gas <= gas_ceiling
+        # the model is an upper bound, but not a loose one
+        assert motion.enact_motion_gas - enact_tx.gas_used < gas_model.enact_motion.per_item
+
+    assert all(ldo.balanceOf(recipient) == amount for recipient in RECIPIENTS)
@@ -0,0 +1,60 @@
+import pytest
+
+from utils import lido
+from utils.vote_for_new_factories import (
+    FactoryToAdd,
+    FactoryToRemove,
+    create_votings_on_new_factories,
+    estimate_items_gas,
+    omnibus_items,
+    split_items,
+)
+
+
+def test_split_items():
+    "Must split items into the fewest votes keeping their order"
+    assert split_items([30, 50, 20, 60, 40, 10], 100) == [[0, 1, 2], [3, 4], [5]]
+    assert split_items([100, 100], 100) == [[0], [1]]
+    with pytest.raises(ValueError):
+        split_items([50, 101], 100)
+
+
+@pytest.mark.skip_coverage
+def test_split_omnibus_vote(
+    owner, voting, agent, easy_track, evm_script_factory_stub, EVMScriptFactoryStub, monkeypatch
+):
+    "Must create votes under the gas budget which re-add removed factory after its removal"
+    permissions = evm_script_factory_stub.DEFAULT_PERMISSIONS()
+    easy_track.addEVMScriptFactory(evm_script_factory_stub, permissions, {"from": voting})
+    new_factories = [owner.deploy(EVMScriptFactoryStub) for _ in range(3)]
+    factories_to_remove = [FactoryToRemove(factory=evm_script_factory_stub)]
+    factories_to_add = [
+        FactoryToAdd(factory=factory, permissions=permissions)
+        for factory in new_factories + [evm_script_factory_stub]
+    ]
+
+    items = omnibus_items(easy_track, factories_to_add, factories_to_remove)
+    items_gas = estimate_items_gas(items)
+    # estimation doesn't change the state
+    assert easy_track.getEVMScriptFactories() == [evm_script_factory_stub]
+    assert len(items_gas) == 5
+
+    gas_budget = max(items_gas) * 2
+    monkeypatch.setattr("utils.vote_for_new_factories.prompt_bool", lambda: True)
+    vote_ids = create_votings_on_new_factories(
+        easy_track,
+        factories_to_add,
+        factories_to_remove,
+        "mainnet",
+        {"from": agent},
+        gas_budget,
+    )
+    votes = split_items(items_gas, gas_budget)
+    assert len(vote_ids) == len(votes) > 1
+    assert votes[0][0] == 0 and votes[-1][-1] == len(items) - 1
+
+    for vote_id in vote_ids:
+        lido.execute_voting(vote_id)
+    factories = easy_track.getEVMScriptFactories()
+    assert set(factories) == set(new_factories + [evm_script_factory_stub])
+    assert factories[-1] == evm_script_factory_stub
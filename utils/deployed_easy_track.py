@@ -8,7 +8,8 @@ from brownie import (
     RewardProgramsRegistry,
     IncreaseNodeOperatorStakingLimit,
     TopUpLegoProgram,
-    Contract
+    Contract,
+    web3
 )
 
 def addresses(network="mainnet"):
@@ -54,6 +55,21 @@ def addresses(network="mainnet"):
         f"""Unknown network "{network}". Supported networks: mainnet, goerli."""
     )
 
+def deployment_block(address: str, web3=web3) -> int:
+    """Returns number of the block where the contract was deployed. Found by binary search
+    of the first block with the code at the address, so requires an archive node"""
+    high = web3.eth.block_number
+    if not web3.eth.get_code(address, high):
+        raise ValueError(f"No contract at {address}")
+    low = 0
+    while low < high:
+        middle = (low + high) // 2
+        if web3.eth.get_code(address, middle):
+            high = middle
+        else:
+            low = middle + 1
+    return low
+
 def contract_or_none(
     contract: Contract,
     addr: Optional[str]
@@ -1,12 +1,16 @@
 from brownie import (
     EasyTrack,
+    CompactEasyTrack,
     TopUpLegoProgram,
     EVMScriptExecutor,
     AddRewardProgram,
+    AddRewardPrograms,
     RemoveRewardProgram,
+    RemoveRewardPrograms,
     TopUpRewardPrograms,
     RewardProgramsRegistry,
-    IncreaseNodeOperatorStakingLimit
+    IncreaseNodeOperatorStakingLimit,
+    IncreaseNodeOperatorsStakingLimits,
 )
 
 
@@ -17,8 +21,11 @@ def deploy_easy_track(
     motions_count_limit,
     objections_threshold,
     tx_params,
+    compact_motion_created_event=False,
 ):
-    return EasyTrack.deploy(
+    # CompactEasyTrack logs the hash of EVMScript instead of the full EVMScript on motion creation
+    easy_track = CompactEasyTrack if compact_motion_created_event else EasyTrack
+    return easy_track.deploy(
         governance_token,
         admin,
         motion_duration,
@@ -47,6 +54,13 @@ def deploy_reward_programs_registry(voting, evm_script_executor, tx_params):
 def deploy_increase_node_operator_staking_limit(node_operators_registry, tx_params):
     return IncreaseNodeOperatorStakingLimit.deploy(node_operators_registry, tx_params)
 
+def deploy_increase_node_operators_staking_limits(
+    node_operators_registry, trusted_caller, tx_params
+):
+    return IncreaseNodeOperatorsStakingLimits.deploy(
+        trusted_caller, node_operators_registry, tx_params
+    )
+
 
 def deploy_top_up_lego_program(
     finance, lego_program, lego_committee_multisig, tx_params
@@ -70,6 +84,20 @@ def deploy_remove_reward_program(
         reward_programs_multisig, reward_programs_registry, tx_params
     )
 
+def deploy_add_reward_programs(
+    reward_programs_registry, reward_programs_multisig, tx_params
+):
+    return AddRewardPrograms.deploy(
+        reward_programs_multisig, reward_programs_registry, tx_params
+    )
+
+def deploy_remove_reward_programs(
+    reward_programs_registry, reward_programs_multisig, tx_params
+):
+    return RemoveRewardPrograms.deploy(
+        reward_programs_multisig, reward_programs_registry, tx_params
+    )
+
 def deploy_top_up_reward_programs(
     finance,
     governance_token,
@@ -103,6 +131,8 @@ def add_evm_script_factories(
     increase_node_operator_staking_limit,
     lido_contracts,
     tx_params,
+    add_reward_programs=None,
+    remove_reward_programs=None,
 ):
     easy_track.addEVMScriptFactory(
         increase_node_operator_staking_limit,
@@ -125,6 +155,14 @@ def add_evm_script_factories(
         lido_contracts,
         tx_params
     )
+    if add_reward_programs is not None and remove_reward_programs is not None:
+        add_evm_script_bulk_reward_program_factories(
+            easy_track,
+            add_reward_programs,
+            remove_reward_programs,
+            reward_programs_registry,
+            tx_params
+        )
 
 def add_evm_script_reward_program_factories(
     easy_track,
@@ -151,6 +189,24 @@ def add_evm_script_reward_program_factories(
         tx_params,
     )
 
+def add_evm_script_bulk_reward_program_factories(
+    easy_track,
+    add_reward_programs,
+    remove_reward_programs,
+    reward_programs_registry,
+    tx_params
+):
+    easy_track.addEVMScriptFactory(
+        add_reward_programs,
+        create_permission(reward_programs_registry, "addRewardPrograms"),
+        tx_params,
+    )
+    easy_track.addEVMScriptFactory(
+        remove_reward_programs,
+        create_permission(reward_programs_registry, "removeRewardPrograms"),
+        tx_params,
+    )
+
 def transfer_admin_role(deployer, easy_track, new_admin, tx_params):
     easy_track.grantRole(easy_track.DEFAULT_ADMIN_ROLE(), new_admin, tx_params)
     easy_track.revokeRole(easy_track.DEFAULT_ADMIN_ROLE(), deployer, tx_params)
@@ -158,3 +214,12 @@ def transfer_admin_role(deployer, easy_track, new_admin, tx_params):
 
 def create_permission(contract, method):
     return contract.address + getattr(contract, method).signature[2:]
+
+
+def create_permissions(*contract_methods):
+    """Encodes permissions for given (contract, method) tuples. Tuples are sorted and
+    deduplicated to allow EVMScriptPermissions to look them up with binary search"""
+    permissions = sorted(
+        {create_permission(contract, method)[2:].lower() for contract, method in contract_methods}
+    )
+    return "0x" + "".join(permissions)
@@ -0,0 +1,422 @@
+"""Differential fuzzer of EasyTrack against its Python model (utils/easy_track_model.py).
+
+Random sequences of blocks with EasyTrack calls are sent to the local chain with automine
+disabled, so every block contains many transactions. After each mined block, transactions are
+replayed on the model in the order they were included into the block. Status and EasyTrack
+events of each transaction and the state of EasyTrack after each block are compared with the
+model. Failed sequences are shrunk to the minimal sequence reproducing the mismatch.
+"""
+
+import random
+from typing import List, NamedTuple, Sequence, Tuple
+
+from brownie import web3 as default_web3
+from web3 import Web3
+
+from utils.easy_track_model import (
+    EasyTrackModel,
+    MiniMeTokenModel,
+    ModelRevert,
+    StaticEVMScriptFactoryModel,
+)
+
+DEFAULT_TX_GAS = 500_000
+
+# motion id which never exists in EasyTrack
+MISSING_MOTION = -1
+
+
+class Operation(NamedTuple):
+    method: str
+    sender: str
+    # indices of motions in the list of active motions known at the moment of sending,
+    # MISSING_MOTION to use the id of not existed motion
+    motions: Tuple[int, ...] = ()
+
+
+class Block(NamedTuple):
+    # seconds to move the chain time before the block is mined
+    sleep: int
+    operations: Tuple[Operation, ...]
+
+
+class FuzzStats(NamedTuple):
+    blocks: int
+    transactions: int
+    reverted: int
+
+
+class FuzzMismatch(AssertionError):
+    """Raised when EasyTrack and the model diverge. Holds the (shrunk) failing sequence"""
+
+    def __init__(self, message: str, blocks: Sequence[Block]):
+        super().__init__(f"{message}\nFailing sequence:\n" + format_blocks(blocks))
+        self.message = message
+        self.blocks = list(blocks)
+
+
+def format_blocks(blocks: Sequence[Block]) -> str:
+    lines = []
+    for number, block in enumerate(blocks):
+        lines.append(f"  block {number} (+{block.sleep}s)")
+        lines += [f"    {operation}" for operation in block.operations]
+    return "\n".join(lines)
+
+
+def generate_blocks(
+    rnd: random.Random,
+    blocks_count: int,
+    block_size: int,
+    admin: str,
+    creators: Sequence[str],
+    objectors: Sequence[str],
+    motion_duration: int,
+) -> List[Block]:
+    """Generates random sequence of blocks with EasyTrack calls"""
+    senders = list(creators) + list(objectors)
+
+    def pick_motions(count):
+        return tuple(
+            MISSING_MOTION if rnd.random() < 0.05 else rnd.randrange(32) for _ in range(count)
+        )
+
+    generators = [
+        (30, lambda: Operation("createMotion", rnd.choice(creators))),
+        (25, lambda: Operation("objectToMotion", rnd.choice(objectors), pick_motions(1))),
+        (
+            8,
+            lambda: Operation(
+                "objectToMotions", rnd.choice(objectors), pick_motions(rnd.randint(0, 4))
+            ),
+        ),
+        (10, lambda: Operation("cancelMotion", rnd.choice(senders), pick_motions(1))),
+        (15, lambda: Operation("enactMotion", rnd.choice(senders), pick_motions(1))),
+        (
+            3,
+            lambda: Operation(
+                "cancelMotions",
+                rnd.choice([admin, admin, rnd.choice(senders)]),
+                pick_motions(rnd.randint(0, 4)),
+            ),
+        ),
+        (1, lambda: Operation("cancelAllMotions", rnd.choice([admin, rnd.choice(senders)]))),
+        (2, lambda: Operation("pause", rnd.choice([admin, rnd.choice(senders)]))),
+        (3, lambda: Operation("unpause", rnd.choice([admin, rnd.choice(senders)]))),
+    ]
+    weights = [weight for weight, _ in generators]
+    blocks = []
+    for _ in range(blocks_count):
+        sleep = 0 if rnd.random() < 0.7 else rnd.randint(1, 2 * motion_duration)
+        operations = tuple(
+            rnd.choices(generators, weights)[0][1]() for _ in range(rnd.randint(1, block_size))
+        )
+        blocks.append(Block(sleep, operations))
+    return blocks
+
+
+class EasyTrackFuzzer:
+    """Runs sequences of blocks against deployed EasyTrack and its model. EasyTrack must
+    use the EVMScriptFactoryStub added as the only EVMScript factory. Balances of the governance
+    token mustn't change while the fuzzer runs. All senders must be unlocked on the node"""
+
+    def __init__(
+        self,
+        easy_track,
+        evm_script_factory_stub,
+        governance_token,
+        admin: str,
+        creators: Sequence[str],
+        objectors: Sequence[str],
+        web3=default_web3,
+        tx_gas: int = DEFAULT_TX_GAS,
+    ):
+        self.easy_track = easy_track
+        self.evm_script_factory_stub = evm_script_factory_stub
+        self.governance_token = governance_token
+        self.admin = str(admin)
+        self.creators = [str(creator) for creator in creators]
+        self.objectors = [str(objector) for objector in objectors]
+        self.web3 = web3
+        self.tx_gas = tx_gas
+        self.transactions = 0
+        self.blocks = 0
+        self.reverted = 0
+        self._contract = web3.eth.contract(
+            address=Web3.toChecksumAddress(easy_track.address), abi=easy_track.abi
+        )
+        self._snapshot_id = None
+        self._event_names = {
+            Web3.keccak(text=_event_signature(item)): item["name"]
+            for item in easy_track.abi
+            if item["type"] == "event"
+        }
+
+    def run(
+        self,
+        seed: int,
+        blocks_count: int = 50,
+        block_size: int = 16,
+        shrink: bool = True,
+        max_shrink_runs: int = 200,
+    ) -> FuzzStats:
+        """Runs random sequence generated from the seed and reverts the chain to the state before
+        the run. Raises FuzzMismatch with the shrunk failing sequence on the divergence"""
+        blocks = generate_blocks(
+            random.Random(seed),
+            blocks_count,
+            block_size,
+            self.admin,
+            self.creators,
+            self.objectors,
+            self.easy_track.motionDuration(),
+        )
+        self._snapshot_id = self._rpc("evm_snapshot")
+        try:
+            self.check(blocks)
+        except FuzzMismatch as error:
+            if not shrink:
+                raise
+            self._revert()
+            raise self._shrink(error, max_shrink_runs) from None
+        finally:
+            self._rpc("evm_revert", self._snapshot_id)
+        return FuzzStats(self.blocks, self.transactions, self.reverted)
+
+    def check(self, blocks: Sequence[Block]):
+        """Sends the sequence of blocks and compares EasyTrack with the model after each block"""
+        model = self._create_model()
+        self._assert_state(model, blocks)
+        nonces = {}
+        self._set_automine(False)
+        try:
+            for block in blocks:
+                self._run_block(model, block, nonces, blocks)
+        finally:
+            self._set_automine(True)
+
+    def _create_model(self) -> EasyTrackModel:
+        if self.easy_track.paused() or self.easy_track.getMotions():
+            raise ValueError("EasyTrack must be unpaused and have no active motions")
+        block = self.web3.eth.get_block("latest")
+        token = MiniMeTokenModel()
+        total_supply = self.governance_token.totalSupply()
+        for account in set(self.creators + self.objectors + [self.admin]):
+            balance = self.governance_token.balanceOf(account)
+            token.mint(account, balance, 0)
+            total_supply -= balance
+        # the rest of tokens belongs to accounts which don't take part in the fuzzing
+        token.mint(None, total_supply, 0)
+
+        easy_track = self.easy_track
+        model = EasyTrackModel(
+            token,
+            self.admin,
+            easy_track.motionDuration(),
+            easy_track.motionsCountLimit(),
+            easy_track.objectionsThreshold(),
+            block_number=block.number,
+            timestamp=block.timestamp,
+        )
+        model.add_evm_script_factory(
+            self.admin,
+            self.evm_script_factory_stub.address,
+            easy_track.evmScriptFactoryPermissions(self.evm_script_factory_stub),
+            StaticEVMScriptFactoryModel(self.evm_script_factory_stub.evmScript()),
+        )
+        # lastMotionId isn't public, the id of the next motion is returned by createMotion
+        create_motion = self._contract.functions.createMotion(
+            self.evm_script_factory_stub.address, b""
+        )
+        model.last_motion_id = create_motion.call({"from": self.creators[0]}) - 1
+        return model
+
+    def _run_block(self, model, block, nonces, blocks):
+        if block.sleep:
+            self._rpc("evm_increaseTime", block.sleep)
+        motion_ids = [motion.id for motion in model.motions]
+        next_motion_id = model.last_motion_id + 1
+        calls = {}
+        for operation in block.operations:
+            args = [self._motion_id(index, motion_ids) for index in operation.motions]
+            if operation.method in ("objectToMotions", "cancelMotions"):
+                args = [args]
+            elif operation.method == "createMotion":
+                args = [self.evm_script_factory_stub.address, b""]
+                motion_ids.append(next_motion_id)
+                next_motion_id += 1
+            elif operation.method == "enactMotion":
+                args.append(b"")
+            tx_hash = self._send(operation.sender, operation.method, args, nonces)
+            calls[tx_hash] = (operation, args)
+
+        while calls:
+            self._rpc("evm_mine")
+            mined_block = self.web3.eth.get_block("latest")
+            if not mined_block.transactions:
+                raise RuntimeError("Pending transactions are not mined")
+            model.block_number = mined_block.number
+            model.timestamp = mined_block.timestamp
+            for tx_hash in mined_block.transactions:
+                if tx_hash not in calls:
+                    continue
+                operation, args = calls.pop(tx_hash)
+                self._check_transaction(model, tx_hash, operation, args, blocks)
+            self._assert_state(model, blocks)
+            self.blocks += 1
+
+    def _check_transaction(self, model, tx_hash, operation, args, blocks):
+        receipt = self.web3.eth.get_transaction_receipt(tx_hash)
+        events_count = len(model.events)
+        revert_msg = None
+        try:
+            getattr(model, _model_method(operation.method))(operation.sender, *args)
+        except ModelRevert as error:
+            revert_msg = error.revert_msg
+        self.transactions += 1
+
+        expected_status = 0 if revert_msg is not None else 1
+        if receipt.status != expected_status:
+            raise FuzzMismatch(
+                f"{operation.method}{tuple(args)} from {operation.sender}: status "
+                f"{receipt.status}, model status {expected_status} ({revert_msg})",
+                blocks,
+            )
+        if revert_msg is not None:
+            self.reverted += 1
+            return
+        expected_events = [
+            (event.name, event.args.get("_motionId")) for event in model.events[events_count:]
+        ]
+        events = [
+            (
+                self._event_names.get(log.topics[0]),
+                int.from_bytes(log.topics[1], "big") if len(log.topics) > 1 else None,
+            )
+            for log in receipt.logs
+            if log.address == self._contract.address
+        ]
+        if events != expected_events:
+            raise FuzzMismatch(
+                f"{operation.method}{tuple(args)}: events {events}, model events "
+                f"{expected_events}",
+                blocks,
+            )
+
+    def _assert_state(self, model, blocks):
+        motions = [tuple(motion) for motion in self._contract.functions.getMotions().call()]
+        motions = [motion[:8] + ("0x" + bytes(motion[8]).hex(),) for motion in motions]
+        if motions != model.get_motions():
+            raise FuzzMismatch(
+                f"motions {motions} differ from model motions {model.get_motions()}", blocks
+            )
+        paused = self._contract.functions.paused().call()
+        if paused != model.paused:
+            raise FuzzMismatch(f"paused {paused} differs from model {model.paused}", blocks)
+
+    def _shrink(self, error: FuzzMismatch, max_runs) -> FuzzMismatch:
+        """Removes blocks, operations and time warps while the sequence keeps failing"""
+        failure = error
+        runs = 0
+
+        def fails(candidate):
+            nonlocal failure, runs
+            runs += 1
+            try:
+                self.check(candidate)
+                return False
+            except FuzzMismatch as candidate_error:
+                failure = candidate_error
+                return True
+            finally:
+                self._revert()
+
+        blocks = list(error.blocks)
+        for candidates in (_without_blocks, _without_operations, _without_sleeps):
+            changed = True
+            while changed and runs < max_runs:
+                changed = False
+                for candidate in candidates(blocks):
+                    if runs >= max_runs:
+                        break
+                    if fails(candidate):
+                        blocks = candidate
+                        changed = True
+                        break
+        return FuzzMismatch(failure.message, blocks)
+
+    def _revert(self):
+        # snapshots are single-use, so the new one is taken right after the revert
+        self._rpc("evm_revert", self._snapshot_id)
+        self._snapshot_id = self._rpc("evm_snapshot")
+
+    def _send(self, sender, method, args, nonces) -> bytes:
+        if sender not in nonces:
+            nonces[sender] = self.web3.eth.get_transaction_count(sender, "pending")
+        tx_hash = self.web3.eth.send_transaction(
+            {
+                "from": sender,
+                "to": self._contract.address,
+                "data": self._contract.encodeABI(fn_name=method, args=args),
+                "gas": self.tx_gas,
+                "nonce": nonces[sender],
+            }
+        )
+        nonces[sender] += 1
+        return bytes(tx_hash)
+
+    def _set_automine(self, enabled: bool):
+        response = self.web3.provider.make_request("evm_setAutomine", [enabled])
+        if "error" in response:
+            self._rpc("miner_start" if enabled else "miner_stop")
+
+    def _rpc(self, method, *params):
+        response = self.web3.provider.make_request(method, list(params))
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    @staticmethod
+    def _motion_id(index, motion_ids):
+        if index == MISSING_MOTION or not motion_ids:
+            return 2 ** 64 - 1
+        return motion_ids[index % len(motion_ids)]
+
+
+def _event_signature(abi_item) -> str:
+    return f"{abi_item['name']}({','.join(i['type'] for i in abi_item['inputs'])})"
+
+
+def _model_method(method: str) -> str:
+    return {
+        "createMotion": "create_motion",
+        "objectToMotion": "object_to_motion",
+        "objectToMotions": "object_to_motions",
+        "cancelMotion": "cancel_motion",
+        "cancelMotions": "cancel_motions",
+        "cancelAllMotions": "cancel_all_motions",
+        "enactMotion": "enact_motion",
+        "pause": "pause",
+        "unpause": "unpause",
+    }[method]
+
+
+def _without_blocks(blocks: List[Block]):
+    size = len(blocks) // 2
+    while size > 0:
+        for start in range(0, len(blocks), size):
+            yield blocks[:start] + blocks[start + size :]
+        size //= 2
+
+
+def _without_operations(blocks: List[Block]):
+    for number, block in enumerate(blocks):
+        for index in range(len(block.operations)):
+            operations = block.operations[:index] + block.operations[index + 1 :]
+            if operations:
+                yield blocks[:number] + [Block(block.sleep, operations)] + blocks[number + 1 :]
+
+
+def _without_sleeps(blocks: List[Block]):
+    for number, block in enumerate(blocks):
+        if block.sleep:
+            yield blocks[:number] + [Block(0, block.operations)] + blocks[number + 1 :]
@@ -0,0 +1,122 @@
+from typing import List, NamedTuple, Optional, Sequence
+
+from brownie import Contract, EasyTrackLens, web3 as default_web3
+from web3 import Web3
+
+# Address the runtime bytecode of EasyTrackLens is placed at when the lens isn't deployed
+LENS_OVERRIDE_ADDRESS = "0x00000000000000000000000000000000000E1e25"
+
+
+class MotionState(NamedTuple):
+    id: int
+    evm_script_factory: str
+    creator: str
+    duration: int
+    start_date: int
+    snapshot_block: int
+    objections_threshold: int
+    objections_amount: int
+    evm_script_hash: str
+    total_supply: int
+    objections_amount_pct: int
+    # mapping of the account to the flag if the account has objected to the motion
+    objections: dict
+    # mapping of the account to the flag if the account can object to the motion
+    can_object: dict
+
+
+class EasyTrackState(NamedTuple):
+    block_number: int
+    paused: bool
+    governance_token: str
+    evm_script_executor: str
+    motion_duration: int
+    motions_count_limit: int
+    objections_threshold: int
+    # mapping of the EVMScript factory to its permissions
+    evm_script_factories: dict
+    motions: List[MotionState]
+
+
+class EasyTrackLensClient:
+    """Reads the whole state of EasyTrack in one eth_call to EasyTrackLens. When the address
+    of deployed lens isn't passed, the lens bytecode is injected with the state override"""
+
+    def __init__(self, easy_track, lens_address: Optional[str] = None, web3=default_web3):
+        self.easy_track = easy_track
+        self.web3 = web3
+        self.use_state_override = lens_address is None
+        self.lens_address = LENS_OVERRIDE_ADDRESS if lens_address is None else lens_address
+        self._lens = Contract.from_abi("EasyTrackLens", self.lens_address, EasyTrackLens.abi)
+
+    def get_state(self, accounts: Sequence[str] = (), block_identifier="latest") -> EasyTrackState:
+        accounts = [Web3.toChecksumAddress(str(account)) for account in accounts]
+        if isinstance(block_identifier, int):
+            block_number = block_identifier
+            block_identifier = hex(block_identifier)
+        else:
+            block_number = self.web3.eth.get_block(block_identifier).number
+            block_identifier = hex(block_number)
+        get_state = self._lens.getEasyTrackState
+        call = {
+            "to": self.lens_address,
+            "data": get_state.encode_input(self.easy_track.address, accounts),
+        }
+        params = [call, block_identifier]
+        if self.use_state_override:
+            params.append({self.lens_address: {"code": _deployed_bytecode()}})
+        response = self.web3.provider.make_request("eth_call", params)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return _parse_state(block_number, get_state.decode_output(response["result"]), accounts)
+
+
+def _deployed_bytecode():
+    bytecode = EasyTrackLens._build["deployedBytecode"]
+    return bytecode if bytecode.startswith("0x") else "0x" + bytecode
+
+
+def _parse_state(block_number, state, accounts) -> EasyTrackState:
+    (
+        paused,
+        governance_token,
+        evm_script_executor,
+        motion_duration,
+        motions_count_limit,
+        objections_threshold,
+        evm_script_factories,
+        motions,
+    ) = state
+    return EasyTrackState(
+        block_number=block_number,
+        paused=paused,
+        governance_token=str(governance_token),
+        evm_script_executor=str(evm_script_executor),
+        motion_duration=motion_duration,
+        motions_count_limit=motions_count_limit,
+        objections_threshold=objections_threshold,
+        evm_script_factories={
+            str(factory): "0x" + bytes(permissions).hex()
+            for factory, permissions in evm_script_factories
+        },
+        motions=[_parse_motion(motion, accounts) for motion in motions],
+    )
+
+
+def _parse_motion(motion_state, accounts) -> MotionState:
+    motion, total_supply, objections_amount_pct, objections, can_object = motion_state
+    return MotionState(
+        id=motion[0],
+        evm_script_factory=str(motion[1]),
+        creator=str(motion[2]),
+        duration=motion[3],
+        start_date=motion[4],
+        snapshot_block=motion[5],
+        objections_threshold=motion[6],
+        objections_amount=motion[7],
+        evm_script_hash=str(motion[8]),
+        total_supply=total_supply,
+        objections_amount_pct=objections_amount_pct,
+        objections=dict(zip(accounts, objections)),
+        can_object=dict(zip(accounts, can_object)),
+    )
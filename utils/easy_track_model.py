@@ -0,0 +1,607 @@
+"""Pure-Python in-memory model of EasyTrack, MotionSettings and EVMScriptFactoriesRegistry.
+
+The model reproduces the observable behaviour of the contracts: revert messages and the order
+of checks, emitted events, the 'swap and pop' ordering of motions and factories and the rollback
+of the state on reverted calls. It doesn't talk to the node and is used as a fast oracle in
+tests and for what-if analysis of motions.
+"""
+
+from bisect import bisect_right
+from typing import Callable, Dict, List, Sequence, Set, Tuple
+
+from eth_utils import keccak
+
+from utils.test_helpers import CANCEL_ROLE, DEFAULT_ADMIN_ROLE, PAUSE_ROLE, UNPAUSE_ROLE
+
+HUNDRED_PERCENT = 10000
+
+MAX_MOTIONS_LIMIT = 24
+MAX_OBJECTIONS_THRESHOLD = 500
+MIN_MOTION_DURATION = 48 * 60 * 60
+MAX_MOTION_DURATION = 2 ** 32 - 1
+
+SPEC_ID_SIZE = 4
+ADDRESS_SIZE = 20
+CALLDATA_LENGTH_SIZE = 4
+METHOD_SELECTOR_SIZE = 4
+PERMISSION_SIZE = ADDRESS_SIZE + METHOD_SELECTOR_SIZE
+
+# Revert message of the solidity panic on the division by zero as it is reported by brownie
+DIVISION_BY_ZERO = "Division or modulo by zero"
+
+
+class ModelRevert(Exception):
+    """Raised when the modeled contract call reverts. Holds the revert message of the contract"""
+
+    def __init__(self, revert_msg: str):
+        super().__init__(revert_msg)
+        self.revert_msg = revert_msg
+
+
+class Motion:
+    """Active motion. Fields follow the order of EasyTrack.Motion struct"""
+
+    __slots__ = (
+        "id",
+        "evm_script_factory",
+        "creator",
+        "duration",
+        "start_date",
+        "snapshot_block",
+        "objections_threshold",
+        "objections_amount",
+        "evm_script_hash",
+    )
+
+    def __init__(
+        self,
+        id,
+        evm_script_factory,
+        creator,
+        duration,
+        start_date,
+        snapshot_block,
+        objections_threshold,
+        objections_amount=0,
+        evm_script_hash=b"",
+    ):
+        self.id = id
+        self.evm_script_factory = evm_script_factory
+        self.creator = creator
+        self.duration = duration
+        self.start_date = start_date
+        self.snapshot_block = snapshot_block
+        self.objections_threshold = objections_threshold
+        self.objections_amount = objections_amount
+        self.evm_script_hash = evm_script_hash
+
+    def as_tuple(self) -> tuple:
+        """Returns motion in the same form as it is returned by EasyTrack.getMotion()"""
+        return (
+            self.id,
+            self.evm_script_factory,
+            self.creator,
+            self.duration,
+            self.start_date,
+            self.snapshot_block,
+            self.objections_threshold,
+            self.objections_amount,
+            "0x" + self.evm_script_hash.hex(),
+        )
+
+    def __repr__(self):
+        return f"Motion{self.as_tuple()}"
+
+
+class Event:
+    """Event emitted by the model"""
+
+    __slots__ = ("name", "args")
+
+    def __init__(self, name: str, args: dict):
+        self.name = name
+        self.args = args
+
+    def __eq__(self, other):
+        return isinstance(other, Event) and (self.name, self.args) == (other.name, other.args)
+
+    def __repr__(self):
+        return f"Event({self.name}, {self.args})"
+
+
+class MiniMeTokenModel:
+    """Governance token with balances history. Values at the block are resolved
+    the same way as in MiniMeToken: by the last checkpoint made at or before the block"""
+
+    __slots__ = ("_balances", "_total_supply")
+
+    def __init__(self):
+        # account -> ([blocks], [values]) of checkpoints in ascending order of blocks
+        self._balances: Dict[str, Tuple[List[int], List[int]]] = {}
+        self._total_supply: Tuple[List[int], List[int]] = ([], [])
+
+    def mint(self, account: str, amount: int, block: int):
+        self._update(self._balances.setdefault(account, ([], [])), amount, block)
+        self._update(self._total_supply, amount, block)
+
+    def burn(self, account: str, amount: int, block: int):
+        if self.balance_of_at(account, block) < amount:
+            raise ModelRevert("NOT_ENOUGH_BALANCE")
+        self._update(self._balances[account], -amount, block)
+        self._update(self._total_supply, -amount, block)
+
+    def transfer(self, sender: str, recipient: str, amount: int, block: int):
+        if self.balance_of_at(sender, block) < amount:
+            raise ModelRevert("NOT_ENOUGH_BALANCE")
+        self._update(self._balances[sender], -amount, block)
+        self._update(self._balances.setdefault(recipient, ([], [])), amount, block)
+
+    def balance_of_at(self, account: str, block: int) -> int:
+        checkpoints = self._balances.get(account)
+        return 0 if checkpoints is None else self._value_at(checkpoints, block)
+
+    def total_supply_at(self, block: int) -> int:
+        return self._value_at(self._total_supply, block)
+
+    @staticmethod
+    def _value_at(checkpoints, block):
+        blocks, values = checkpoints
+        index = bisect_right(blocks, block) - 1
+        return values[index] if index >= 0 else 0
+
+    @staticmethod
+    def _update(checkpoints, delta, block):
+        blocks, values = checkpoints
+        if blocks and block < blocks[-1]:
+            raise ValueError(f"Checkpoint at block {block} is older than the last one")
+        value = (values[-1] if values else 0) + delta
+        if blocks and blocks[-1] == block:
+            values[-1] = value
+        else:
+            blocks.append(block)
+            values.append(value)
+
+
+class StaticEVMScriptFactoryModel:
+    """EVMScript factory which returns the same EVMScript on every call (like EVMScriptFactoryStub).
+    Any object with the create_evm_script(creator, evm_script_call_data) method which returns bytes
+    or raises ModelRevert might be used as the model of EVMScript factory"""
+
+    def __init__(self, evm_script: bytes):
+        self.evm_script = to_bytes(evm_script)
+
+    def create_evm_script(self, creator: str, evm_script_call_data: bytes) -> bytes:
+        return self.evm_script
+
+
+class EVMScriptExecutorModel:
+    """Collects EVMScripts passed for the execution"""
+
+    def __init__(self):
+        self.executed: List[bytes] = []
+
+    def execute_evm_script(self, evm_script: bytes):
+        self.executed.append(evm_script)
+
+
+def to_bytes(value) -> bytes:
+    """Converts hex string or bytes-like value into bytes"""
+    if isinstance(value, str):
+        return bytes.fromhex(value[2:] if value.startswith("0x") else value)
+    return bytes(value)
+
+
+def is_valid_permissions(permissions: bytes) -> bool:
+    return len(permissions) > 0 and len(permissions) % PERMISSION_SIZE == 0
+
+
+def can_execute_evm_script(permissions: bytes, evm_script: bytes) -> bool:
+    """Port of EVMScriptPermissions.canExecuteEVMScript(). Bytes beyond the end of malformed
+    EVMScript are read as zeros, while the contract reads whatever lies next in memory"""
+    location = SPEC_ID_SIZE
+    if not is_valid_permissions(permissions) or len(evm_script) <= location:
+        return False
+    allowed = {
+        permissions[i : i + PERMISSION_SIZE] for i in range(0, len(permissions), PERMISSION_SIZE)
+    }
+    padded_script = evm_script + bytes(32)
+    while location < len(evm_script):
+        address_end = location + ADDRESS_SIZE
+        calldata_start = address_end + CALLDATA_LENGTH_SIZE
+        calldata_length = int.from_bytes(padded_script[address_end:calldata_start], "big")
+        method_id = (
+            padded_script[location:address_end]
+            + padded_script[calldata_start : calldata_start + METHOD_SELECTOR_SIZE]
+        )
+        if method_id not in allowed:
+            return False
+        location = calldata_start + calldata_length
+    return True
+
+
+class AccessControlModel:
+    """Roles of OpenZeppelin's AccessControl. Accounts are compared case-insensitively"""
+
+    def __init__(self):
+        self.roles: Dict[str, Set[str]] = {}
+        self.events: List[Event] = []
+
+    def has_role(self, role: str, account: str) -> bool:
+        return account.lower() in self.roles.get(role, ())
+
+    def grant_role(self, sender: str, role: str, account: str):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        self._setup_role(role, account)
+
+    def revoke_role(self, sender: str, role: str, account: str):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        self.roles.get(role, set()).discard(account.lower())
+
+    def renounce_role(self, sender: str, role: str, account: str):
+        if sender.lower() != account.lower():
+            raise ModelRevert("AccessControl: can only renounce roles for self")
+        self.roles.get(role, set()).discard(account.lower())
+
+    def _setup_role(self, role: str, account: str):
+        self.roles.setdefault(role, set()).add(account.lower())
+
+    def _check_role(self, role: str, account: str):
+        if not self.has_role(role, account):
+            raise ModelRevert(
+                f"AccessControl: account {account.lower()} is missing role {role}"
+            )
+
+
+class MotionSettingsModel(AccessControlModel):
+    """Model of MotionSettings contract"""
+
+    def __init__(self, admin, motion_duration, motions_count_limit, objections_threshold):
+        AccessControlModel.__init__(self)
+        self._setup_role(DEFAULT_ADMIN_ROLE, admin)
+        self._init_motion_settings(motion_duration, motions_count_limit, objections_threshold)
+
+    def _init_motion_settings(self, motion_duration, motions_count_limit, objections_threshold):
+        # same order as in the constructor of MotionSettings
+        self._set_motion_duration(motion_duration)
+        self._set_motions_count_limit(motions_count_limit)
+        self._set_objections_threshold(objections_threshold)
+
+    def set_motion_duration(self, sender: str, motion_duration: int):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        self._set_motion_duration(motion_duration)
+
+    def set_objections_threshold(self, sender: str, objections_threshold: int):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        self._set_objections_threshold(objections_threshold)
+
+    def set_motions_count_limit(self, sender: str, motions_count_limit: int):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        self._set_motions_count_limit(motions_count_limit)
+
+    def _set_motion_duration(self, motion_duration):
+        if motion_duration < MIN_MOTION_DURATION:
+            raise ModelRevert("VALUE_TOO_SMALL")
+        if motion_duration > MAX_MOTION_DURATION:
+            raise ModelRevert("VALUE_TOO_LARGE")
+        self.motion_duration = motion_duration
+        self.events.append(Event("MotionDurationChanged", {"_motionDuration": motion_duration}))
+
+    def _set_objections_threshold(self, objections_threshold):
+        if objections_threshold > MAX_OBJECTIONS_THRESHOLD:
+            raise ModelRevert("VALUE_TOO_LARGE")
+        self.objections_threshold = objections_threshold
+        self.events.append(
+            Event("ObjectionsThresholdChanged", {"_newThreshold": objections_threshold})
+        )
+
+    def _set_motions_count_limit(self, motions_count_limit):
+        if motions_count_limit > MAX_MOTIONS_LIMIT:
+            raise ModelRevert("VALUE_TOO_LARGE")
+        self.motions_count_limit = motions_count_limit
+        self.events.append(
+            Event("MotionsCountLimitChanged", {"_newMotionsCountLimit": motions_count_limit})
+        )
+
+
+class EVMScriptFactoriesRegistryModel(AccessControlModel):
+    """Model of EVMScriptFactoriesRegistry contract. EVMScript factories are registered
+    under the address and modeled by objects with create_evm_script() method"""
+
+    def __init__(self, admin):
+        AccessControlModel.__init__(self)
+        self._setup_role(DEFAULT_ADMIN_ROLE, admin)
+        self._init_evm_script_factories_registry()
+
+    def _init_evm_script_factories_registry(self):
+        self.evm_script_factories: List[str] = []
+        self.evm_script_factory_permissions: Dict[str, bytes] = {}
+        self.evm_script_factory_models: Dict[str, object] = {}
+        self._evm_script_factory_indices: Dict[str, int] = {}
+
+    def add_evm_script_factory(self, sender: str, evm_script_factory: str, permissions, model):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        permissions = to_bytes(permissions)
+        if not is_valid_permissions(permissions):
+            raise ModelRevert("INVALID_PERMISSIONS")
+        if evm_script_factory in self._evm_script_factory_indices:
+            raise ModelRevert("EVM_SCRIPT_FACTORY_ALREADY_ADDED")
+        self.evm_script_factories.append(evm_script_factory)
+        self._evm_script_factory_indices[evm_script_factory] = len(self.evm_script_factories)
+        self.evm_script_factory_permissions[evm_script_factory] = permissions
+        self.evm_script_factory_models[evm_script_factory] = model
+        self.events.append(
+            Event(
+                "EVMScriptFactoryAdded",
+                {"_evmScriptFactory": evm_script_factory, "_permissions": permissions},
+            )
+        )
+
+    def remove_evm_script_factory(self, sender: str, evm_script_factory: str):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        index = self._evm_script_factory_indices.get(evm_script_factory, 0) - 1
+        if index < 0:
+            raise ModelRevert("EVM_SCRIPT_FACTORY_NOT_FOUND")
+        last_evm_script_factory = self.evm_script_factories.pop()
+        if last_evm_script_factory != evm_script_factory:
+            self.evm_script_factories[index] = last_evm_script_factory
+            self._evm_script_factory_indices[last_evm_script_factory] = index + 1
+        del self._evm_script_factory_indices[evm_script_factory]
+        del self.evm_script_factory_permissions[evm_script_factory]
+        del self.evm_script_factory_models[evm_script_factory]
+        self.events.append(
+            Event("EVMScriptFactoryRemoved", {"_evmScriptFactory": evm_script_factory})
+        )
+
+    def is_evm_script_factory(self, evm_script_factory: str) -> bool:
+        return evm_script_factory in self._evm_script_factory_indices
+
+    def _create_evm_script(self, evm_script_factory, creator, evm_script_call_data) -> bytes:
+        if evm_script_factory not in self._evm_script_factory_indices:
+            raise ModelRevert("EVM_SCRIPT_FACTORY_NOT_FOUND")
+        evm_script = bytes(
+            self.evm_script_factory_models[evm_script_factory].create_evm_script(
+                creator, evm_script_call_data
+            )
+        )
+        permissions = self.evm_script_factory_permissions[evm_script_factory]
+        if not can_execute_evm_script(permissions, evm_script):
+            raise ModelRevert("HAS_NO_PERMISSIONS")
+        return evm_script
+
+
+class EasyTrackModel(EVMScriptFactoriesRegistryModel, MotionSettingsModel):
+    """Model of EasyTrack contract. Every state changing method accepts the address of
+    the caller first and uses block_number and timestamp attributes as the current block.
+    Reverted calls raise ModelRevert and leave the state of the model untouched"""
+
+    def __init__(
+        self,
+        governance_token: MiniMeTokenModel,
+        admin: str,
+        motion_duration: int,
+        motions_count_limit: int,
+        objections_threshold: int,
+        evm_script_executor=None,
+        block_number: int = 0,
+        timestamp: int = 0,
+    ):
+        AccessControlModel.__init__(self)
+        self._init_evm_script_factories_registry()
+        self._init_motion_settings(motion_duration, motions_count_limit, objections_threshold)
+        for role in (DEFAULT_ADMIN_ROLE, PAUSE_ROLE, UNPAUSE_ROLE, CANCEL_ROLE):
+            self._setup_role(role, admin)
+        self.governance_token = governance_token
+        self.evm_script_executor = (
+            EVMScriptExecutorModel() if evm_script_executor is None else evm_script_executor
+        )
+        self.block_number = block_number
+        self.timestamp = timestamp
+        self.paused = False
+        self.motions: List[Motion] = []
+        self.last_motion_id = 0
+        self._motion_indices_by_motion_id: Dict[int, int] = {}
+        # ids of motions objected by the account (accounts are lowercased)
+        self._objections: Dict[str, Set[int]] = {}
+
+    def advance(self, seconds: int = 0, blocks: int = 1):
+        """Moves the current block of the model forward"""
+        self.timestamp += seconds
+        self.block_number += blocks
+
+    # ------------------
+    # STATE CHANGING METHODS
+    # ------------------
+
+    def create_motion(self, sender: str, evm_script_factory: str, evm_script_call_data=b"") -> int:
+        self._when_not_paused()
+        if len(self.motions) >= self.motions_count_limit:
+            raise ModelRevert("MOTIONS_LIMIT_REACHED")
+        evm_script_call_data = to_bytes(evm_script_call_data)
+        evm_script = self._create_evm_script(evm_script_factory, sender, evm_script_call_data)
+        evm_script_hash = keccak(evm_script)
+
+        self.last_motion_id += 1
+        motion = Motion(
+            self.last_motion_id,
+            evm_script_factory,
+            sender,
+            self.motion_duration,
+            self.timestamp,
+            self.block_number,
+            self.objections_threshold,
+            0,
+            evm_script_hash,
+        )
+        self.motions.append(motion)
+        self._motion_indices_by_motion_id[motion.id] = len(self.motions)
+        self.events.append(
+            Event(
+                "MotionCreated",
+                {
+                    "_motionId": motion.id,
+                    "_creator": sender,
+                    "_evmScriptFactory": evm_script_factory,
+                    "_evmScriptCallData": evm_script_call_data,
+                    "_evmScript": evm_script,
+                },
+            )
+        )
+        return motion.id
+
+    def enact_motion(self, sender: str, motion_id: int, evm_script_call_data=b""):
+        self._when_not_paused()
+        motion = self._get_motion(motion_id)
+        if motion.start_date + motion.duration > self.timestamp:
+            raise ModelRevert("MOTION_NOT_PASSED")
+        evm_script = self._create_evm_script(
+            motion.evm_script_factory, motion.creator, to_bytes(evm_script_call_data)
+        )
+        if keccak(evm_script) != motion.evm_script_hash:
+            raise ModelRevert("UNEXPECTED_EVM_SCRIPT")
+
+        self._delete_motion(motion_id)
+        self.events.append(Event("MotionEnacted", {"_motionId": motion_id}))
+        self.evm_script_executor.execute_evm_script(evm_script)
+
+    def object_to_motion(self, sender: str, motion_id: int):
+        self.object_to_motions(sender, [motion_id])
+
+    def object_to_motions(self, sender: str, motion_ids: Sequence[int]):
+        objected = self._objections.setdefault(sender.lower(), set())
+        rollback = self._snapshot()
+        new_objections = []
+        try:
+            for motion_id in motion_ids:
+                motion = self._get_motion(motion_id)
+                if motion_id in objected:
+                    raise ModelRevert("ALREADY_OBJECTED")
+                objected.add(motion_id)
+                new_objections.append(motion_id)
+                self._object_to_motion(sender, motion)
+        except ModelRevert:
+            objected.difference_update(new_objections)
+            rollback()
+            raise
+
+    def cancel_motion(self, sender: str, motion_id: int):
+        motion = self._get_motion(motion_id)
+        if motion.creator.lower() != sender.lower():
+            raise ModelRevert("NOT_CREATOR")
+        self._delete_motion(motion_id)
+        self.events.append(Event("MotionCanceled", {"_motionId": motion_id}))
+
+    def cancel_motions(self, sender: str, motion_ids: Sequence[int]):
+        self._check_role(CANCEL_ROLE, sender)
+        for motion_id in motion_ids:
+            if motion_id in self._motion_indices_by_motion_id:
+                self._delete_motion(motion_id)
+                self.events.append(Event("MotionCanceled", {"_motionId": motion_id}))
+
+    def cancel_all_motions(self, sender: str):
+        self._check_role(CANCEL_ROLE, sender)
+        while self.motions:
+            motion_id = self.motions[-1].id
+            self._delete_motion(motion_id)
+            self.events.append(Event("MotionCanceled", {"_motionId": motion_id}))
+
+    def set_evm_script_executor(self, sender: str, evm_script_executor):
+        self._check_role(DEFAULT_ADMIN_ROLE, sender)
+        self.evm_script_executor = evm_script_executor
+        self.events.append(
+            Event("EVMScriptExecutorChanged", {"_evmScriptExecutor": evm_script_executor})
+        )
+
+    def pause(self, sender: str):
+        self._when_not_paused()
+        self._check_role(PAUSE_ROLE, sender)
+        self.paused = True
+        self.events.append(Event("Paused", {"account": sender}))
+
+    def unpause(self, sender: str):
+        if not self.paused:
+            raise ModelRevert("Pausable: not paused")
+        self._check_role(UNPAUSE_ROLE, sender)
+        self.paused = False
+        self.events.append(Event("Unpaused", {"account": sender}))
+
+    # ------------------
+    # VIEW METHODS
+    # ------------------
+
+    def can_object_to_motion(self, motion_id: int, objector: str) -> bool:
+        motion = self._get_motion(motion_id)
+        balance = self.governance_token.balance_of_at(objector, motion.snapshot_block)
+        return balance > 0 and not self.objections(motion_id, objector)
+
+    def objections(self, motion_id: int, objector: str) -> bool:
+        return motion_id in self._objections.get(objector.lower(), ())
+
+    def get_motions(self) -> List[tuple]:
+        return [motion.as_tuple() for motion in self.motions]
+
+    def get_motion(self, motion_id: int) -> tuple:
+        return self._get_motion(motion_id).as_tuple()
+
+    # ------------------
+    # PRIVATE METHODS
+    # ------------------
+
+    def _when_not_paused(self):
+        if self.paused:
+            raise ModelRevert("Pausable: paused")
+
+    def _get_motion(self, motion_id: int) -> Motion:
+        index = self._motion_indices_by_motion_id.get(motion_id)
+        if index is None:
+            raise ModelRevert("MOTION_NOT_FOUND")
+        return self.motions[index - 1]
+
+    def _delete_motion(self, motion_id: int):
+        index = self._motion_indices_by_motion_id.pop(motion_id) - 1
+        last_motion = self.motions.pop()
+        if last_motion.id != motion_id:
+            self.motions[index] = last_motion
+            self._motion_indices_by_motion_id[last_motion.id] = index + 1
+
+    def _object_to_motion(self, sender: str, motion: Motion):
+        objector_balance = self.governance_token.balance_of_at(sender, motion.snapshot_block)
+        if objector_balance == 0:
+            raise ModelRevert("NOT_ENOUGH_BALANCE")
+        total_supply = self.governance_token.total_supply_at(motion.snapshot_block)
+        if total_supply == 0:
+            raise ModelRevert(DIVISION_BY_ZERO)
+        new_objections_amount = motion.objections_amount + objector_balance
+        new_objections_amount_pct = HUNDRED_PERCENT * new_objections_amount // total_supply
+        self.events.append(
+            Event(
+                "MotionObjected",
+                {
+                    "_motionId": motion.id,
+                    "_objector": sender,
+                    "_weight": objector_balance,
+                    "_newObjectionsAmount": new_objections_amount,
+                    "_newObjectionsAmountPct": new_objections_amount_pct,
+                },
+            )
+        )
+        if new_objections_amount_pct < motion.objections_threshold:
+            motion.objections_amount = new_objections_amount
+        else:
+            self._delete_motion(motion.id)
+            self.events.append(Event("MotionRejected", {"_motionId": motion.id}))
+
+    def _snapshot(self) -> Callable[[], None]:
+        """Returns function which restores motions and events to the current state"""
+        motions = list(self.motions)
+        objections_amounts = [motion.objections_amount for motion in motions]
+        indices = dict(self._motion_indices_by_motion_id)
+        events_count = len(self.events)
+
+        def rollback():
+            for motion, objections_amount in zip(motions, objections_amounts):
+                motion.objections_amount = objections_amount
+            self.motions[:] = motions
+            self._motion_indices_by_motion_id = indices
+            del self.events[events_count:]
+
+        return rollback
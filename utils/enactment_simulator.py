@@ -0,0 +1,234 @@
+"""Simulation of the effects of motions enactment.
+
+All active motions are enacted in one pass on the local fork: the chain is moved past the end
+of the longest motion under a single snapshot, motions are enacted in the order of their ids
+and the chain is reverted afterwards. Storage writes are collected from the traces of
+enactments, balance changes from the Transfer logs and transfers of ether. Both are attributed
+to the contract whose storage is used by the frame, not to the executed code, so writes made
+through proxies land on the proxies.
+Effects are cached by (motion id, block), so repeated views of the same block are free.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+from brownie import web3 as default_web3
+from brownie.exceptions import VirtualMachineError
+from web3 import Web3
+
+from utils.motion_enactor import MotionEnactor
+
+TRANSFER_TOPIC = Web3.keccak(text="Transfer(address,address,uint256)")
+
+
+class StorageDiff(NamedTuple):
+    address: str
+    slot: str
+    before: str
+    after: str
+
+
+class BalanceDiff(NamedTuple):
+    # None for ether
+    token: Optional[str]
+    holder: str
+    delta: int
+
+
+class EmittedEvent(NamedTuple):
+    address: str
+    name: str
+    args: dict
+
+
+class MotionEffects(NamedTuple):
+    motion_id: int
+    block: int
+    success: bool
+    revert_msg: Optional[str]
+    gas_used: Optional[int]
+    storage_diffs: List[StorageDiff]
+    balance_diffs: List[BalanceDiff]
+    events: List[EmittedEvent]
+
+    def as_dict(self, labels: Optional[Dict[str, str]] = None) -> dict:
+        """Summarises effects. labels maps lowercased addresses to the names of contracts"""
+        labels = labels or {}
+
+        def label(address):
+            return None if address is None else labels.get(address.lower(), address)
+
+        return {
+            "motion_id": self.motion_id,
+            "block": self.block,
+            "success": self.success,
+            "revert_msg": self.revert_msg,
+            "gas_used": self.gas_used,
+            "storage_diffs": [
+                {
+                    "contract": label(diff.address),
+                    "slot": diff.slot,
+                    "before": diff.before,
+                    "after": diff.after,
+                }
+                for diff in self.storage_diffs
+            ],
+            "balance_diffs": [
+                {
+                    "token": label(diff.token) or "ETH",
+                    "holder": label(diff.holder),
+                    "delta": str(diff.delta),
+                }
+                for diff in self.balance_diffs
+            ],
+            "events": [
+                {
+                    "contract": label(event.address),
+                    "name": event.name,
+                    "args": {name: str(value) for name, value in event.args.items()},
+                }
+                for event in self.events
+            ],
+        }
+
+
+class EnactmentSimulator:
+    """Enacts active motions of EasyTrack on the throwaway snapshot of the fork.
+    The sender of enactments must be unlocked on the node"""
+
+    def __init__(self, easy_track, sender, start_block=0, max_block_range=1000, web3=default_web3):
+        self.easy_track = easy_track
+        self.sender = sender
+        self.web3 = web3
+        self._motion_enactor = MotionEnactor(easy_track, sender, start_block, max_block_range)
+        self._cache: Dict[Tuple[int, int], MotionEffects] = {}
+
+    def simulate(self) -> List[MotionEffects]:
+        """Returns effects of enactment of every active motion at the latest block"""
+        block = self.web3.eth.block_number
+        motions = self.easy_track.getMotions()
+        if any((motion[0], block) not in self._cache for motion in motions):
+            self._motion_enactor.sync(block)
+            self._cache = {key: value for key, value in self._cache.items() if key[1] == block}
+            for effects in self._simulate(motions, block):
+                self._cache[(effects.motion_id, block)] = effects
+        return [self._cache[(motion[0], block)] for motion in motions]
+
+    def _simulate(self, motions: Sequence[tuple], block: int) -> List[MotionEffects]:
+        snapshot_id = self._rpc("evm_snapshot")
+        try:
+            now = self.web3.eth.get_block(block).timestamp
+            # startDate + duration of the longest motion
+            ends_at = max(motion[4] + motion[3] for motion in motions)
+            if ends_at >= now:
+                self._rpc("evm_increaseTime", ends_at - now + 1)
+                self._rpc("evm_mine")
+            return [
+                self._enact(motion_id, block)
+                for motion_id in sorted(motion[0] for motion in motions)
+            ]
+        finally:
+            self._rpc("evm_revert", snapshot_id)
+
+    def _enact(self, motion_id: int, block: int) -> MotionEffects:
+        call_data = self._motion_enactor.evm_script_call_data.get(motion_id)
+        if call_data is None:
+            return MotionEffects(
+                motion_id, block, False, "MotionCreated log wasn't found", None, [], [], []
+            )
+        try:
+            self.easy_track.enactMotion.call(motion_id, call_data, {"from": self.sender})
+        except VirtualMachineError as error:
+            return MotionEffects(
+                motion_id, block, False, error.revert_msg or str(error), None, [], [], []
+            )
+
+        tx = self.easy_track.enactMotion(motion_id, call_data, {"from": self.sender})
+        return MotionEffects(
+            motion_id=motion_id,
+            block=block,
+            success=True,
+            revert_msg=None,
+            gas_used=tx.gas_used,
+            storage_diffs=self._storage_diffs(tx),
+            balance_diffs=self._token_balance_diffs(tx) + self._ether_balance_diffs(tx),
+            events=[
+                EmittedEvent(event.address, event.name, dict(event)) for event in tx.events
+            ],
+        )
+
+    def _storage_diffs(self, tx) -> List[StorageDiff]:
+        # the bookkeeping of EasyTrack itself isn't an effect of the motion
+        written = {
+            (context, int(step["stack"][-1], 16))
+            for context, step in self._trace_with_contexts(tx)
+            if step["op"] == "SSTORE" and context != self.easy_track.address
+        }
+        diffs = []
+        for address, slot in sorted(written):
+            before = self.web3.eth.get_storage_at(address, slot, tx.block_number - 1)
+            after = self.web3.eth.get_storage_at(address, slot, tx.block_number)
+            if before != after:
+                diffs.append(StorageDiff(address, hex(slot), before.hex(), after.hex()))
+        return diffs
+
+    @staticmethod
+    def _token_balance_diffs(tx) -> List[BalanceDiff]:
+        deltas: Dict[Tuple[str, str], int] = {}
+        for log in tx.logs:
+            if len(log.topics) != 3 or log.topics[0] != TRANSFER_TOPIC:
+                continue
+            amount = int.from_bytes(bytes(Web3.toBytes(hexstr=log.data)), "big")
+            for topic, sign in ((log.topics[1], -1), (log.topics[2], 1)):
+                holder = Web3.toChecksumAddress(topic[12:])
+                key = (log.address, holder)
+                deltas[key] = deltas.get(key, 0) + sign * amount
+        return [
+            BalanceDiff(token, holder, delta)
+            for (token, holder), delta in deltas.items()
+            if delta != 0
+        ]
+
+    def _ether_balance_diffs(self, tx) -> List[BalanceDiff]:
+        # CALL stack: gas, address, value, ...
+        holders = set()
+        for context, step in self._trace_with_contexts(tx):
+            if step["op"] == "CALL" and int(step["stack"][-3], 16) > 0:
+                holders.add(context)
+                holders.add(Web3.toChecksumAddress(step["stack"][-2][-40:]))
+        diffs = []
+        for holder in sorted(holders):
+            before = self.web3.eth.get_balance(holder, tx.block_number - 1)
+            delta = self.web3.eth.get_balance(holder, tx.block_number) - before
+            if delta != 0:
+                diffs.append(BalanceDiff(None, holder, delta))
+        return diffs
+
+    @staticmethod
+    def _trace_with_contexts(tx) -> List[Tuple[str, dict]]:
+        """Pairs steps of the trace with the address whose storage and balance they use.
+        step["address"] is the address of the executed code, which differs from it in frames
+        of DELEGATECALL: Aragon apps are proxies, so their storage is written by implementations"""
+        contexts: Dict[int, Optional[str]] = {}
+        result = []
+        for step in tx.trace:
+            depth = step["depth"]
+            if not contexts:
+                contexts[depth] = tx.receiver
+            context = contexts[depth]
+            result.append((context, step))
+            # the context of the frame opened by the step. Steps of frames without code,
+            # like calls to EOAs, don't exist, so the value is replaced by the next call
+            if step["op"] in ("CALL", "STATICCALL"):
+                contexts[depth + 1] = Web3.toChecksumAddress(step["stack"][-2][-40:])
+            elif step["op"] in ("DELEGATECALL", "CALLCODE"):
+                contexts[depth + 1] = context
+            elif step["op"] in ("CREATE", "CREATE2"):
+                # the address of the created contract isn't known until the frame returns
+                contexts[depth + 1] = None
+        return [(context, step) for context, step in result if context is not None]
+
+    def _rpc(self, method, *params):
+        response = self.web3.provider.make_request(method, list(params))
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
@@ -0,0 +1,20 @@
+from brownie import web3 as default_web3
+from web3 import Web3
+
+
+def web3_contract(contract, web3=default_web3, abi=None):
+    """Returns web3 contract object for the given brownie contract to query its logs.
+    When abi is passed it's used instead of the ABI of the contract"""
+    return web3.eth.contract(
+        address=Web3.toChecksumAddress(contract.address), abi=abi or contract.abi
+    )
+
+
+def get_logs(event, from_block, to_block, max_block_range=1000):
+    """Fetches logs of the web3 contract event in chunks of max_block_range blocks"""
+    logs = []
+    while from_block <= to_block:
+        chunk_to_block = min(to_block, from_block + max_block_range - 1)
+        logs += event.getLogs(fromBlock=from_block, toBlock=chunk_to_block)
+        from_block = chunk_to_block + 1
+    return logs
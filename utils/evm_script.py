@@ -21,3 +21,23 @@ def encode_call_script(actions, spec_id=1):
         length = eth_abi.encode_single("uint32", len(calldata_bytes) // 2).hex()
         result += addr_bytes + length[56:] + calldata_bytes
     return result
+
+
+def decode_evm_script(evm_script):
+    if isinstance(evm_script, str):
+        evm_script = Web3.toBytes(hexstr=HexAddress(evm_script))
+    evm_script = bytes(evm_script)
+    calls = []
+    location = 4  # first 4 bytes reserved for SPEC_ID
+    while location < len(evm_script):
+        to = Web3.toChecksumAddress(evm_script[location : location + 20])
+        calldata_length = int.from_bytes(
+            evm_script[location + 20 : location + 24], "big"
+        )
+        calldata_start = location + 24
+        calldata = evm_script[calldata_start : calldata_start + calldata_length]
+        if len(calldata) != calldata_length:
+            raise ValueError(f"EVMScript is truncated at position {location}")
+        calls.append((to, "0x" + calldata.hex()))
+        location = calldata_start + calldata_length
+    return calls
@@ -0,0 +1,169 @@
+"""Differential harness of EVMScript encoders.
+
+Random sets of actions are encoded by utils.evm_script.encode_call_script and by
+EVMScriptCreator library via the methods of EVMScriptCreatorWrapper. All on-chain encodings
+are evaluated in a few batched eth_call requests, and the gas used by them is estimated
+the same way, so thousands of cases take seconds.
+"""
+
+import random
+import time
+from typing import List, NamedTuple, Optional, Tuple
+
+import eth_abi
+from brownie import web3 as default_web3
+from web3 import Web3
+
+from utils.evm_script import encode_call_script
+from utils.rpc import batch_eth_call, batch_estimate_gas, intrinsic_gas
+
+# Overloads of EVMScriptCreatorWrapper.createEVMScript
+SINGLE_CALL = "address,bytes4,bytes"
+SAME_METHOD = "address,bytes4,bytes[]"
+SAME_ADDRESS = "address,bytes4[],bytes[]"
+MANY_ADDRESSES = "address[],bytes4[],bytes[]"
+OVERLOADS = [SINGLE_CALL, SAME_METHOD, SAME_ADDRESS, MANY_ADDRESSES]
+
+
+class EncoderCase(NamedTuple):
+    overload: str
+    # (to, method id, call data of the method) of each action
+    actions: List[Tuple[str, bytes, bytes]]
+
+    def wrapper_args(self) -> list:
+        to, method_ids, call_data = zip(*self.actions)
+        if self.overload == SINGLE_CALL:
+            return [to[0], method_ids[0], call_data[0]]
+        if self.overload == SAME_METHOD:
+            return [to[0], method_ids[0], list(call_data)]
+        if self.overload == SAME_ADDRESS:
+            return [to[0], list(method_ids), list(call_data)]
+        return [list(to), list(method_ids), list(call_data)]
+
+    def encode(self) -> str:
+        return encode_call_script(
+            [
+                (to, "0x" + (method_id + call_data).hex())
+                for to, method_id, call_data in self.actions
+            ]
+        )
+
+
+class Mismatch(NamedTuple):
+    case: EncoderCase
+    expected: str
+    # None if the call to EVMScriptCreatorWrapper has failed
+    actual: Optional[str]
+
+
+class DifferentialReport(NamedTuple):
+    cases: int
+    actions: int
+    mismatches: List[Mismatch]
+    python_seconds: float
+    onchain_seconds: float
+    # gas used by the on-chain encoding without the intrinsic gas of the transactions
+    onchain_gas: int
+
+    @property
+    def python_us_per_action(self) -> float:
+        return 1e6 * self.python_seconds / self.actions
+
+    @property
+    def onchain_us_per_action(self) -> float:
+        return 1e6 * self.onchain_seconds / self.actions
+
+    @property
+    def gas_per_action(self) -> float:
+        return self.onchain_gas / self.actions
+
+    def __str__(self):
+        return (
+            f"{self.cases} cases, {self.actions} actions, {len(self.mismatches)} mismatches\n"
+            f"python: {self.python_us_per_action:.2f} us per action\n"
+            f"onchain: {self.gas_per_action:.0f} gas, "
+            f"{self.onchain_us_per_action:.2f} us of eth_call per action"
+        )
+
+
+def generate_cases(
+    count: int, seed: Optional[int] = None, max_actions: int = 8, max_call_data_length: int = 256
+) -> List[EncoderCase]:
+    """Generates random cases for all overloads of createEVMScript. Call data lengths
+    are random, not only multiples of 32, to check the copying of the tails of call data"""
+    rng = random.Random(seed)
+
+    def address():
+        return Web3.toChecksumAddress(rng.getrandbits(160).to_bytes(20, "big"))
+
+    def method_id():
+        return rng.getrandbits(32).to_bytes(4, "big")
+
+    def call_data():
+        return bytes(rng.getrandbits(8) for _ in range(rng.randint(0, max_call_data_length)))
+
+    cases = []
+    for _ in range(count):
+        overload = rng.choice(OVERLOADS)
+        actions_count = 1 if overload == SINGLE_CALL else rng.randint(1, max_actions)
+        to, selector = address(), method_id()
+        actions = []
+        for _ in range(actions_count):
+            if overload == MANY_ADDRESSES:
+                to = address()
+            if overload in (SAME_ADDRESS, MANY_ADDRESSES):
+                selector = method_id()
+            actions.append((to, selector, call_data()))
+        cases.append(EncoderCase(overload, actions))
+    return cases
+
+
+def run_differential(
+    evm_script_creator_wrapper, cases: List[EncoderCase], batch_size=500, web3=default_web3
+) -> DifferentialReport:
+    """Compares EVMScripts built by the Python encoder and by EVMScriptCreator"""
+    started_at = time.perf_counter()
+    expected = [case.encode() for case in cases]
+    python_seconds = time.perf_counter() - started_at
+
+    calls = [
+        (
+            evm_script_creator_wrapper.address,
+            _encode_wrapper_call(evm_script_creator_wrapper, case),
+        )
+        for case in cases
+    ]
+    started_at = time.perf_counter()
+    outputs = []
+    for start in range(0, len(calls), batch_size):
+        outputs += batch_eth_call(calls[start : start + batch_size], "latest", web3)
+    onchain_seconds = time.perf_counter() - started_at
+
+    onchain_gas = 0
+    for start in range(0, len(calls), batch_size):
+        batch = calls[start : start + batch_size]
+        for (_, data), gas in zip(batch, batch_estimate_gas(batch, "latest", web3)):
+            if gas is not None:
+                onchain_gas += gas - intrinsic_gas(data)
+
+    mismatches = []
+    for case, expected_evm_script, output in zip(cases, expected, outputs):
+        actual = None if output is None else "0x" + eth_abi.decode_single("bytes", output).hex()
+        if actual != expected_evm_script.lower():
+            mismatches.append(Mismatch(case, expected_evm_script, actual))
+
+    return DifferentialReport(
+        cases=len(cases),
+        actions=sum(len(case.actions) for case in cases),
+        mismatches=mismatches,
+        python_seconds=python_seconds,
+        onchain_seconds=onchain_seconds,
+        onchain_gas=onchain_gas,
+    )
+
+
+def _encode_wrapper_call(evm_script_creator_wrapper, case: EncoderCase) -> str:
+    method = evm_script_creator_wrapper.createEVMScript[case.overload]
+    args = eth_abi.encode_abi(case.overload.split(","), case.wrapper_args())
+    return method.signature + args.hex()
+
@@ -0,0 +1,205 @@
+from typing import Dict, List, NamedTuple, Optional
+
+import eth_abi
+from brownie import web3 as default_web3
+from web3 import Web3
+
+from utils import deployed_easy_track
+from utils.evm_script import decode_evm_script, encode_call_script, strip_byte_prefix
+from utils.rpc import batch_eth_call
+
+# ABI types of the _evmScriptCallData accepted by each EVMScript factory
+EVM_SCRIPT_CALL_DATA_TYPES = {
+    "IncreaseNodeOperatorStakingLimit": "(uint256,uint256)",
+    "IncreaseNodeOperatorsStakingLimits": "(uint256[],uint256[])",
+    "TopUpLegoProgram": "(address[],uint256[])",
+    "AddRewardProgram": "(address,string)",
+    "RemoveRewardProgram": "(address)",
+    "AddRewardPrograms": "(address[],string[])",
+    "RemoveRewardPrograms": "(address[])",
+    "TopUpRewardPrograms": "(address[],uint256[])",
+}
+
+# Getters of immutable addresses used by each EVMScript factory to create EVMScript
+FACTORY_IMMUTABLES = {
+    "IncreaseNodeOperatorStakingLimit": ["nodeOperatorsRegistry"],
+    "IncreaseNodeOperatorsStakingLimits": ["nodeOperatorsRegistry"],
+    "TopUpLegoProgram": ["finance", "legoProgram"],
+    "AddRewardProgram": ["rewardProgramsRegistry"],
+    "RemoveRewardProgram": ["rewardProgramsRegistry"],
+    "AddRewardPrograms": ["rewardProgramsRegistry"],
+    "RemoveRewardPrograms": ["rewardProgramsRegistry"],
+    "TopUpRewardPrograms": ["finance", "rewardToken"],
+}
+
+NEW_IMMEDIATE_PAYMENT = "newImmediatePayment(address,address,uint256,string)"
+SET_NODE_OPERATOR_STAKING_LIMIT = "setNodeOperatorStakingLimit(uint256,uint64)"
+
+# Signatures of the methods called by EVMScripts of the factories
+ACTION_SIGNATURES = [
+    NEW_IMMEDIATE_PAYMENT,
+    SET_NODE_OPERATOR_STAKING_LIMIT,
+    "addRewardProgram(address,string)",
+    "removeRewardProgram(address)",
+    "addRewardPrograms(address[],string[])",
+    "removeRewardPrograms(address[])",
+]
+
+
+class DecodedAction(NamedTuple):
+    to: str
+    calldata: str
+    # signature and arguments of the called method, None for unknown methods
+    method: Optional[str]
+    args: Optional[tuple]
+
+
+def factory_names(network="mainnet") -> Dict[str, str]:
+    """Returns mapping of lowercased address of deployed EVMScript factory to its contract name"""
+    addresses = deployed_easy_track.addresses(network)
+    result = {
+        addresses.increase_node_operator_staking_limit: "IncreaseNodeOperatorStakingLimit",
+        addresses.top_up_lego_program: "TopUpLegoProgram",
+    }
+    for reward_programs in [addresses.reward_programs, addresses.referral_partners]:
+        result[reward_programs.add_reward_program] = "AddRewardProgram"
+        result[reward_programs.remove_reward_program] = "RemoveRewardProgram"
+        result[reward_programs.top_up_reward_programs] = "TopUpRewardPrograms"
+    return {address.lower(): name for address, name in result.items() if address}
+
+
+def decode_evm_script_call_data(factory_name: str, evm_script_call_data) -> Optional[tuple]:
+    """Decodes _evmScriptCallData of the motion off-chain. Returns None for unknown factories"""
+    if factory_name not in EVM_SCRIPT_CALL_DATA_TYPES:
+        return None
+    if isinstance(evm_script_call_data, str):
+        evm_script_call_data = Web3.toBytes(hexstr=strip_byte_prefix(evm_script_call_data))
+    return eth_abi.decode_single(
+        EVM_SCRIPT_CALL_DATA_TYPES[factory_name], bytes(evm_script_call_data)
+    )
+
+
+def decode_evm_script_actions(evm_script) -> List[DecodedAction]:
+    """Splits EVMScript into actions and decodes calls of the methods used by the factories"""
+    signatures = {_selector(signature): signature for signature in ACTION_SIGNATURES}
+    actions = []
+    for to, calldata in decode_evm_script(evm_script):
+        method = signatures.get(calldata[:10])
+        args = None
+        if method is not None:
+            args = eth_abi.decode_abi(
+                method[method.index("(") + 1 : -1].split(","), bytes.fromhex(calldata[10:])
+            )
+        actions.append(DecodedAction(to, calldata, method, args))
+    return actions
+
+
+def get_factory_immutables(
+    factory_name, factory_address, block_identifier="latest", web3=default_web3
+) -> Dict[str, str]:
+    """Reads immutable addresses the EVMScript factory uses to create EVMScript in one batch request"""
+    getters = FACTORY_IMMUTABLES[factory_name]
+    outputs = batch_eth_call(
+        [(factory_address, _selector(f"{getter}()")) for getter in getters],
+        block_identifier,
+        web3,
+    )
+    if any(output is None for output in outputs):
+        raise ValueError(f"Can't read immutables of {factory_name} at {factory_address}")
+    return {
+        getter: Web3.toChecksumAddress(output[12:32]) for getter, output in zip(getters, outputs)
+    }
+
+
+def create_evm_script(factory_name, immutables: Dict[str, str], evm_script_call_data) -> str:
+    """Creates EVMScript off-chain the same way as EVMScript factory does. Doesn't validate
+    the call data, so the result is valid only for the call data of created motions"""
+    if isinstance(evm_script_call_data, str):
+        evm_script_call_data = Web3.toBytes(hexstr=strip_byte_prefix(evm_script_call_data))
+    call_data = bytes(evm_script_call_data)
+    decoded = decode_evm_script_call_data(factory_name, call_data)
+    if decoded is None:
+        raise ValueError(f"Unknown EVMScript factory: {factory_name}")
+
+    if factory_name == "IncreaseNodeOperatorStakingLimit":
+        actions = [
+            (
+                immutables["nodeOperatorsRegistry"],
+                _encode_call(SET_NODE_OPERATOR_STAKING_LIMIT, call_data),
+            )
+        ]
+    elif factory_name == "IncreaseNodeOperatorsStakingLimits":
+        actions = [
+            (
+                immutables["nodeOperatorsRegistry"],
+                _encode_call(
+                    SET_NODE_OPERATOR_STAKING_LIMIT,
+                    eth_abi.encode_abi(["uint256", "uint256"], [id, staking_limit]),
+                ),
+            )
+            for id, staking_limit in zip(*decoded)
+        ]
+    elif factory_name == "TopUpLegoProgram":
+        actions = [
+            _new_immediate_payment(
+                immutables["finance"],
+                token,
+                immutables["legoProgram"],
+                amount,
+                "Lego Program Transfer",
+            )
+            for token, amount in zip(*decoded)
+        ]
+    elif factory_name == "TopUpRewardPrograms":
+        actions = [
+            _new_immediate_payment(
+                immutables["finance"],
+                immutables["rewardToken"],
+                reward_program,
+                amount,
+                "Reward program top up",
+            )
+            for reward_program, amount in zip(*decoded)
+        ]
+    else:
+        # reward programs registry factories pass the call data as is
+        method = {
+            "AddRewardProgram": "addRewardProgram(address,string)",
+            "RemoveRewardProgram": "removeRewardProgram(address)",
+            "AddRewardPrograms": "addRewardPrograms(address[],string[])",
+            "RemoveRewardPrograms": "removeRewardPrograms(address[])",
+        }[factory_name]
+        actions = [(immutables["rewardProgramsRegistry"], _encode_call(method, call_data))]
+    return encode_call_script(actions)
+
+
+def reconstruct_evm_script(
+    factory_name, immutables: Dict[str, str], evm_script_call_data, evm_script_hash
+) -> str:
+    """Creates EVMScript of the motion off-chain and checks it against the hash stored on-chain"""
+    evm_script = create_evm_script(factory_name, immutables, evm_script_call_data)
+    if isinstance(evm_script_hash, bytes):
+        evm_script_hash = Web3.toHex(evm_script_hash)
+    if Web3.keccak(hexstr=evm_script).hex() != evm_script_hash.lower():
+        raise ValueError("Reconstructed EVMScript doesn't match the EVMScript hash")
+    return evm_script
+
+
+def _selector(signature):
+    return Web3.keccak(text=signature)[:4].hex()
+
+
+def _encode_call(signature, args: bytes):
+    return _selector(signature) + args.hex()
+
+
+def _new_immediate_payment(finance, token, receiver, amount, reference):
+    return (
+        finance,
+        _encode_call(
+            NEW_IMMEDIATE_PAYMENT,
+            eth_abi.encode_abi(
+                ["address", "address", "uint256", "string"], [token, receiver, amount, reference]
+            ),
+        ),
+    )
@@ -0,0 +1,170 @@
+import os
+import json
+from bisect import bisect_right
+from typing import Dict, List, NamedTuple, Optional
+
+from brownie import chain
+from web3 import Web3
+
+from utils import deployed_easy_track, lido
+from utils.events import get_logs, web3_contract
+
+PROJECT_DIR = os.path.dirname(os.path.dirname(__file__))
+INTERFACES_DIR = os.path.join(PROJECT_DIR, "interfaces")
+BUILD_CONTRACTS_DIR = os.path.join(PROJECT_DIR, "build", "contracts")
+
+# Contracts of the project called by EVMScripts. Their ABIs are read from brownie build artifacts
+PROJECT_CONTRACTS = ["RewardProgramsRegistry"]
+
+# Size of (address, bytes4) tuple in permissions
+PERMISSION_SIZE = 24
+
+
+class DecodedPermission(NamedTuple):
+    address: str
+    contract_name: Optional[str]
+    selector: str
+    method_name: Optional[str]
+
+    def __str__(self):
+        contract = self.contract_name or self.address
+        return f"{contract}.{self.method_name or self.selector}"
+
+
+def _abi_type(abi_input):
+    if not abi_input["type"].startswith("tuple"):
+        return abi_input["type"]
+    components = ",".join(_abi_type(component) for component in abi_input["components"])
+    return f"({components}){abi_input['type'][len('tuple'):]}"
+
+
+def _abi_selectors(abi) -> Dict[str, str]:
+    selectors = {}
+    for item in abi:
+        if item.get("type") != "function":
+            continue
+        signature = f"{item['name']}({','.join(_abi_type(i) for i in item['inputs'])})"
+        selectors[Web3.keccak(text=signature)[:4].hex()] = item["name"]
+    return selectors
+
+
+def interfaces_selectors(
+    interfaces_dir=INTERFACES_DIR,
+    build_contracts_dir=BUILD_CONTRACTS_DIR,
+    project_contracts=PROJECT_CONTRACTS,
+) -> Dict[str, Dict[str, str]]:
+    """Returns mapping of interface name to the mapping of method selector to method name
+    built from ABIs stored in interfaces directory and build artifacts of project contracts"""
+    result = {}
+    for file_name in sorted(os.listdir(interfaces_dir)):
+        if not file_name.endswith(".json"):
+            continue
+        with open(os.path.join(interfaces_dir, file_name)) as file:
+            result[file_name[: -len(".json")]] = _abi_selectors(json.load(file))
+    for name in project_contracts:
+        with open(os.path.join(build_contracts_dir, f"{name}.json")) as file:
+            result[name] = _abi_selectors(json.load(file)["abi"])
+    return result
+
+
+def known_contracts(network="mainnet") -> Dict[str, str]:
+    """Returns mapping of lowercased address of known Lido contract to its interface name"""
+    lido_addresses = lido.addresses(network)
+    aragon = lido_addresses.aragon
+    easy_track_addresses = deployed_easy_track.addresses(network)
+    result = {
+        aragon.acl: "ACL",
+        aragon.agent: "Agent",
+        aragon.voting: "Voting",
+        aragon.finance: "Finance",
+        aragon.gov_token: "MiniMeToken",
+        aragon.calls_script: "CallsScript",
+        aragon.token_manager: "TokenManager",
+        lido_addresses.steth: "Lido",
+        lido_addresses.oracle: "Oracle",
+        lido_addresses.node_operators_registry: "NodeOperatorsRegistry",
+        easy_track_addresses.reward_programs.reward_programs_registry: "RewardProgramsRegistry",
+        easy_track_addresses.referral_partners.reward_programs_registry: "RewardProgramsRegistry",
+    }
+    return {address.lower(): name for address, name in result.items()}
+
+
+def decode_permissions(permissions, contracts=None, selectors=None) -> List[DecodedPermission]:
+    """Splits permissions bytes into (contract, method) tuples. Contract and method names
+    are resolved using passed mappings of known contracts and interfaces selectors"""
+    if isinstance(permissions, str):
+        permissions = Web3.toBytes(hexstr=permissions)
+    permissions = bytes(permissions)
+    if len(permissions) % PERMISSION_SIZE != 0:
+        raise ValueError(f"Invalid permissions length: {len(permissions)}")
+    contracts = contracts or {}
+    selectors = selectors or {}
+    result = []
+    for location in range(0, len(permissions), PERMISSION_SIZE):
+        address = Web3.toChecksumAddress(permissions[location : location + 20])
+        selector = "0x" + permissions[location + 20 : location + PERMISSION_SIZE].hex()
+        contract_name = contracts.get(address.lower())
+        method_name = selectors.get(contract_name, {}).get(selector)
+        if method_name is None:
+            method_name = next(
+                (names[selector] for names in selectors.values() if selector in names), None
+            )
+        result.append(DecodedPermission(address, contract_name, selector, method_name))
+    return result
+
+
+class EVMScriptFactoriesHistory:
+    """Time-indexed list of EVMScript factories of EVMScriptFactoriesRegistry (or EasyTrack)
+    reconstructed from EVMScriptFactoryAdded and EVMScriptFactoryRemoved logs"""
+
+    def __init__(self, evm_script_factories_registry, start_block=0, max_block_range=10000):
+        self.max_block_range = max_block_range
+        self._events = web3_contract(evm_script_factories_registry).events
+        self._next_block = start_block
+        # block numbers where the registry was changed in ascending order
+        self._blocks: List[int] = []
+        # factory -> permissions changes made in the corresponding block. None means the
+        # factory was removed. Only changes are stored to not copy the full list of
+        # factories for each block, so states are rebuilt by replaying them
+        self._changes: List[Dict[str, Optional[str]]] = []
+
+    def sync(self, to_block=None):
+        """Replays registry logs emitted since the previous sync up to to_block (latest by default)"""
+        to_block = chain.height if to_block is None else to_block
+        logs = get_logs(
+            self._events.EVMScriptFactoryAdded, self._next_block, to_block, self.max_block_range
+        ) + get_logs(
+            self._events.EVMScriptFactoryRemoved, self._next_block, to_block, self.max_block_range
+        )
+        for log in sorted(logs, key=lambda log: (log.blockNumber, log.logIndex)):
+            if not self._blocks or self._blocks[-1] != log.blockNumber:
+                self._blocks.append(log.blockNumber)
+                self._changes.append({})
+            factory = Web3.toChecksumAddress(log.args._evmScriptFactory)
+            if log.event == "EVMScriptFactoryAdded":
+                self._changes[-1][factory] = "0x" + bytes(log.args._permissions).hex()
+            else:
+                self._changes[-1][factory] = None
+        self._next_block = max(self._next_block, to_block + 1)
+        return self
+
+    def factories_at(self, block_number) -> Dict[str, str]:
+        """Returns mapping of EVMScript factories to their permissions live at the given block"""
+        state = {}
+        for changes in self._changes[: bisect_right(self._blocks, block_number)]:
+            for factory, permissions in changes.items():
+                if permissions is None:
+                    state.pop(factory, None)
+                else:
+                    state[factory] = permissions
+        return state
+
+    def permissions_at(
+        self, block_number, contracts=None, selectors=None
+    ) -> Dict[str, List[DecodedPermission]]:
+        """Returns decoded permissions of EVMScript factories live at the given block"""
+        selectors = interfaces_selectors() if selectors is None else selectors
+        return {
+            factory: decode_permissions(permissions, contracts, selectors)
+            for factory, permissions in self.factories_at(block_number).items()
+        }
@@ -0,0 +1,62 @@
+"""Baseline of gas used by EasyTrack benchmarks.
+
+Results of benchmarks are compared with the JSON baseline: a benchmark regresses when it uses
+more gas than the baseline plus the tolerance. Benchmarks missing in the baseline fail too,
+the baseline is written with the current results only in the update mode.
+"""
+
+import json
+import os
+from typing import Dict, NamedTuple, Optional
+
+# Allowed growth of gas used, in percents of the baseline
+DEFAULT_TOLERANCE = 1.0
+
+
+class GasRegression(NamedTuple):
+    name: str
+    # None when the benchmark is missing in the baseline
+    baseline: Optional[int]
+    gas_used: int
+
+    def __str__(self):
+        if self.baseline is None:
+            return f"{self.name}: {self.gas_used} gas used, missing in the baseline"
+        growth = 100 * (self.gas_used - self.baseline) / self.baseline
+        return f"{self.name}: {self.gas_used} gas used, baseline {self.baseline} (+{growth:.2f}%)"
+
+
+class GasBaseline:
+    def __init__(self, path: str, tolerance: float = DEFAULT_TOLERANCE, update: bool = False):
+        self.path = path
+        self.tolerance = tolerance
+        self.update = update
+        self.baseline: Dict[str, int] = {}
+        self.results: Dict[str, int] = {}
+        self.exists = os.path.exists(path)
+        if self.exists:
+            with open(path) as file:
+                self.baseline = json.load(file)
+
+    def record(self, name: str, gas_used: int) -> Optional[GasRegression]:
+        """Saves the result and returns the regression if it exceeds the tolerance
+        or the benchmark is missing in the baseline"""
+        self.results[name] = gas_used
+        baseline = self.baseline.get(name)
+        if self.update:
+            return None
+        if baseline is None or gas_used > baseline * (1 + self.tolerance / 100):
+            return GasRegression(name, baseline, gas_used)
+        return None
+
+    def save(self) -> bool:
+        """Writes the baseline with the current results in the update mode.
+        Returns True if the file was written"""
+        baseline = {**self.baseline, **self.results}
+        if not self.update or baseline == self.baseline:
+            return False
+        with open(self.path, "w") as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+            file.write("\n")
+        self.baseline = baseline
+        return True
@@ -1,4 +1,7 @@
+import sys
+
 color_hl = "\x1b[38;5;141m"
+color_red = "\033[91m"
 color_green = "\033[92m"
 color_yellow = "\033[93m"
 color_magenta = "\033[0;35m"
@@ -27,3 +30,11 @@ def nb(text, value=None, color_hl=color_hl):
         result += ": " + highlight(value, color_hl)
 
     print(result)
+
+def error(text, value=None):
+    result = highlight("[error] ", color_red) + text
+
+    if value is not None:
+        result += ": " + highlight(value, color_hl)
+
+    print(result, file=sys.stderr)
@@ -0,0 +1,113 @@
+import time
+from typing import Dict, List, NamedTuple
+
+from brownie import chain, CompactEasyTrack
+from brownie.exceptions import VirtualMachineError
+
+from utils import log
+from utils.events import get_logs, web3_contract
+
+
+class EnactmentResult(NamedTuple):
+    motion_id: int
+    tx: object
+    error: str
+
+
+class MotionEnactor:
+    """Enacts passed motions of EasyTrack as soon as they become enactable.
+
+    Keeps the _evmScriptCallData of every active motion from MotionCreated
+    (or MotionCreatedCompact) logs,
+    pre-simulates enactments with eth_call and sends enactments of all ready motions
+    in one batch with locally managed nonces.
+    """
+
+    def __init__(self, easy_track, sender, start_block=0, max_block_range=1000, tx_params=None):
+        self.easy_track = easy_track
+        self.sender = sender
+        self.tx_params = tx_params or {}
+        self.max_block_range = max_block_range
+        self.evm_script_call_data: Dict[int, str] = {}
+        self._next_block = start_block
+        events = web3_contract(easy_track, abi=CompactEasyTrack.abi).events
+        self._motion_created_events = [events.MotionCreated, events.MotionCreatedCompact]
+
+    def sync(self, to_block=None):
+        """Collects calldata of motions created up to to_block and forgets motions which aren't active"""
+        to_block = chain.height if to_block is None else to_block
+        logs = []
+        for event in self._motion_created_events:
+            logs += get_logs(event, self._next_block, to_block, self.max_block_range)
+        for log in logs:
+            self.evm_script_call_data[log.args._motionId] = (
+                "0x" + bytes(log.args._evmScriptCallData).hex()
+            )
+        self._next_block = max(self._next_block, to_block + 1)
+
+        active_motion_ids = {motion[0] for motion in self.easy_track.getMotions()}
+        for motion_id in list(self.evm_script_call_data):
+            if motion_id not in active_motion_ids:
+                del self.evm_script_call_data[motion_id]
+
+    def get_enactable_motion_ids(self, timestamp=None) -> List[int]:
+        """Returns ids of active motions which passed at the given timestamp (latest block by default)"""
+        timestamp = chain[-1].timestamp if timestamp is None else timestamp
+        return [
+            motion[0]
+            for motion in self.easy_track.getMotions()
+            if motion[4] + motion[3] <= timestamp and motion[0] in self.evm_script_call_data
+        ]
+
+    def simulate(self, motion_id):
+        """Simulates enactment of the motion via eth_call. Returns revert message or None on success"""
+        try:
+            self.easy_track.enactMotion.call(
+                motion_id,
+                self.evm_script_call_data[motion_id],
+                {"from": self.sender},
+            )
+        except VirtualMachineError as error:
+            return error.revert_msg or str(error)
+        return None
+
+    def enact_ready_motions(self) -> List[EnactmentResult]:
+        """Sends enactments of all enactable motions which pass the simulation in a single batch"""
+        self.sync()
+        results = []
+        nonce = self.sender.nonce
+        for motion_id in self.get_enactable_motion_ids():
+            error = self.simulate(motion_id)
+            if error is not None:
+                results.append(EnactmentResult(motion_id, None, error))
+                continue
+            tx = self.easy_track.enactMotion(
+                motion_id,
+                self.evm_script_call_data[motion_id],
+                {
+                    **self.tx_params,
+                    "from": self.sender,
+                    "nonce": nonce,
+                    "required_confs": 0,
+                },
+            )
+            nonce += 1
+            results.append(EnactmentResult(motion_id, tx, None))
+        return results
+
+    def run(self, poll_interval=1, confirmations=1):
+        """Enacts motions on every new block until interrupted"""
+        last_block = None
+        while True:
+            if chain.height != last_block:
+                last_block = chain.height
+                results = self.enact_ready_motions()
+                for result in results:
+                    if result.error is not None:
+                        log.error(f"Motion #{result.motion_id} simulation failed", result.error)
+                        continue
+                    log.ok(f"Motion #{result.motion_id} enactment sent", result.tx.txid)
+                for result in results:
+                    if result.tx is not None:
+                        result.tx.wait(confirmations)
+            time.sleep(poll_interval)
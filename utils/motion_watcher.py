@@ -0,0 +1,342 @@
+import sys
+import json
+import time
+import asyncio
+from collections import deque
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from brownie import CompactEasyTrack
+from web3 import Web3
+
+from utils import log
+from utils.evm_script import decode_evm_script
+from utils.evm_script_factories import (
+    FACTORY_IMMUTABLES,
+    decode_evm_script_call_data,
+    get_factory_immutables,
+    reconstruct_evm_script,
+)
+
+
+class MotionAlert(NamedTuple):
+    network: str
+    motion_id: int
+    creator: str
+    evm_script_factory: str
+    evm_script_factory_name: Optional[str]
+    evm_script_call_data: str
+    decoded_evm_script_call_data: Optional[list]
+    # None when the motion was logged with MotionCreatedCompact event
+    # and EVMScript can't be reconstructed off-chain
+    evm_script: Optional[str]
+    evm_script_hash: str
+    actions: List[Dict[str, str]]
+    block_number: int
+    block_timestamp: int
+    transaction_hash: str
+
+    def to_dict(self):
+        return {"type": "motion_created", **self._asdict()}
+
+
+class LatencyMetrics:
+    """Keeps the last `window` latency samples to publish bounded-memory statistics"""
+
+    def __init__(self, window=1000):
+        self._samples = deque(maxlen=window)
+        self.count = 0
+
+    def add(self, value):
+        self._samples.append(value)
+        self.count += 1
+
+    def summary(self):
+        if not self._samples:
+            return {"count": self.count}
+        samples = sorted(self._samples)
+        return {
+            "count": self.count,
+            "mean": sum(samples) / len(samples),
+            "p50": samples[len(samples) // 2],
+            "p95": samples[min(len(samples) - 1, (len(samples) * 95) // 100)],
+            "max": samples[-1],
+        }
+
+
+class StdoutSink:
+    def __init__(self, stream=sys.stdout):
+        self._stream = stream
+
+    async def emit(self, record):
+        self._stream.write(json.dumps(record, default=str) + "\n")
+        self._stream.flush()
+
+
+class FileSink:
+    """Appends records to the file in the JSON Lines format"""
+
+    def __init__(self, path):
+        self._path = path
+
+    async def emit(self, record):
+        line = json.dumps(record, default=str) + "\n"
+        await asyncio.get_running_loop().run_in_executor(None, self._append, line)
+
+    def _append(self, line):
+        with open(self._path, "a") as file:
+            file.write(line)
+
+
+class WebhookSink:
+    """Stub of the webhook sink. Builds the webhook payload and passes it to the `post`
+    coroutine. When `post` isn't set, payloads are kept in the bounded `outbox`"""
+
+    def __init__(self, url, post: Optional[Callable] = None, outbox_size=1000):
+        self.url = url
+        self.outbox = deque(maxlen=outbox_size)
+        self._post = post
+
+    async def emit(self, record):
+        payload = json.dumps(record, default=str)
+        if self._post is None:
+            self.outbox.append(payload)
+        else:
+            await self._post(self.url, payload)
+
+
+class NetworkWatcher:
+    """Follows new blocks of one network and converts MotionCreated events into alerts.
+    EVMScripts of motions logged with MotionCreatedCompact event are reconstructed off-chain.
+    Failed polls are retried with exponential backoff up to max_backoff seconds"""
+
+    def __init__(
+        self,
+        network,
+        web3,
+        easy_track_address,
+        start_block=None,
+        confirmations=0,
+        max_block_range=1000,
+        factory_names=None,
+        max_backoff=300,
+    ):
+        self.network = network
+        self.web3 = web3
+        self.easy_track = web3.eth.contract(
+            address=Web3.toChecksumAddress(easy_track_address), abi=CompactEasyTrack.abi
+        )
+        self.next_block = start_block
+        self.confirmations = confirmations
+        self.max_block_range = max_block_range
+        self.factory_names = factory_names or {}
+        self.max_backoff = max_backoff
+        self.failed_polls = 0
+        # (block number, log index) of the last queued alert, so retries of the failed
+        # poll don't repeat alerts queued before the failure
+        self._last_queued = (-1, -1)
+        self._factory_immutables = {}
+        self.poll_latency = LatencyMetrics()
+        self.alert_latency = LatencyMetrics()
+
+    async def poll(self, queue: asyncio.Queue):
+        """Pushes alerts for all motions created since the last poll into the queue"""
+        loop = asyncio.get_running_loop()
+        poll_started_at = time.monotonic()
+        head = await loop.run_in_executor(None, lambda: self.web3.eth.block_number)
+        head -= self.confirmations
+        if self.next_block is None:
+            self.next_block = head + 1
+        while self.next_block <= head:
+            to_block = min(head, self.next_block + self.max_block_range - 1)
+            logs = await loop.run_in_executor(
+                None, self._get_motion_created_logs, self.next_block, to_block
+            )
+            block_timestamps = {}
+            for log in logs:
+                if (log.blockNumber, log.logIndex) <= self._last_queued:
+                    continue
+                if log.blockNumber not in block_timestamps:
+                    block_timestamps[log.blockNumber] = await loop.run_in_executor(
+                        None, self._get_block_timestamp, log.blockNumber
+                    )
+                evm_script = await loop.run_in_executor(None, self._get_evm_script, log)
+                alert = self._create_alert(log, block_timestamps[log.blockNumber], evm_script)
+                # blocks when the queue is full, so slow sinks throttle the polling
+                await queue.put(alert)
+                self._last_queued = (log.blockNumber, log.logIndex)
+                self.alert_latency.add(time.time() - alert.block_timestamp)
+            self.next_block = to_block + 1
+        self.poll_latency.add(time.monotonic() - poll_started_at)
+
+    async def run(self, queue: asyncio.Queue, poll_interval, stop: asyncio.Event):
+        # failures in a row
+        failures = 0
+        while not stop.is_set():
+            try:
+                await self.poll(queue)
+                failures = 0
+            except Exception as error:
+                failures += 1
+                self.failed_polls += 1
+                log.error(f"Poll of {self.network} failed", repr(error))
+            delay = poll_interval
+            if failures > 0:
+                delay = min(poll_interval * 2 ** failures, self.max_backoff)
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+
+    def metrics(self):
+        return {
+            "network": self.network,
+            "next_block": self.next_block,
+            "failed_polls": self.failed_polls,
+            "poll_latency": self.poll_latency.summary(),
+            "alert_latency": self.alert_latency.summary(),
+        }
+
+    def _get_motion_created_logs(self, from_block, to_block):
+        events = self.easy_track.events
+        logs = []
+        for event in [events.MotionCreated, events.MotionCreatedCompact]:
+            logs += event.getLogs(fromBlock=from_block, toBlock=to_block)
+        return sorted(logs, key=lambda log: (log.blockNumber, log.logIndex))
+
+    def _get_evm_script(self, log):
+        args = log.args
+        if log.event == "MotionCreated":
+            return "0x" + bytes(args._evmScript).hex()
+        factory = args._evmScriptFactory
+        factory_name = self.factory_names.get(factory.lower())
+        if factory_name not in FACTORY_IMMUTABLES:
+            return None
+        try:
+            if factory not in self._factory_immutables:
+                self._factory_immutables[factory] = get_factory_immutables(
+                    factory_name, factory, web3=self.web3
+                )
+            return reconstruct_evm_script(
+                factory_name,
+                self._factory_immutables[factory],
+                args._evmScriptCallData,
+                args._evmScriptHash,
+            )
+        except ValueError:
+            return None
+
+    def _get_block_timestamp(self, block_number):
+        return self.web3.eth.get_block(block_number).timestamp
+
+    def _create_alert(self, log, block_timestamp, evm_script):
+        args = log.args
+        evm_script_factory = args._evmScriptFactory
+        factory_name = self.factory_names.get(evm_script_factory.lower())
+        decoded_call_data = decode_evm_script_call_data(
+            factory_name, args._evmScriptCallData
+        )
+        return MotionAlert(
+            network=self.network,
+            motion_id=args._motionId,
+            creator=args._creator,
+            evm_script_factory=evm_script_factory,
+            evm_script_factory_name=factory_name,
+            evm_script_call_data="0x" + bytes(args._evmScriptCallData).hex(),
+            decoded_evm_script_call_data=(
+                list(decoded_call_data) if decoded_call_data is not None else None
+            ),
+            evm_script=evm_script,
+            evm_script_hash=(
+                Web3.keccak(hexstr=evm_script).hex()
+                if log.event == "MotionCreated"
+                else Web3.toHex(args._evmScriptHash)
+            ),
+            actions=[
+                {"to": to, "selector": calldata[:10], "calldata": calldata}
+                for to, calldata in (decode_evm_script(evm_script) if evm_script else [])
+            ],
+            block_number=log.blockNumber,
+            block_timestamp=block_timestamp,
+            transaction_hash=log.transactionHash.hex(),
+        )
+
+
+class MotionWatcher:
+    """Watches EasyTrack motions on multiple networks concurrently and dispatches alerts to sinks.
+
+    All networks share one bounded queue, so memory usage doesn't depend on the number
+    of created motions or on the speed of sinks.
+    """
+
+    def __init__(
+        self,
+        network_watchers: List[NetworkWatcher],
+        sinks,
+        poll_interval=12,
+        metrics_interval=60,
+        max_pending_alerts=1000,
+    ):
+        self.network_watchers = network_watchers
+        self.sinks = sinks
+        self.poll_interval = poll_interval
+        self.metrics_interval = metrics_interval
+        self.max_pending_alerts = max_pending_alerts
+        self.dispatch_latency = LatencyMetrics()
+
+    async def run(self, stop: Optional[asyncio.Event] = None):
+        stop = stop or asyncio.Event()
+        queue = asyncio.Queue(maxsize=self.max_pending_alerts)
+        dispatcher = asyncio.create_task(self._dispatch(queue))
+        tasks = [
+            asyncio.create_task(watcher.run(queue, self.poll_interval, stop))
+            for watcher in self.network_watchers
+        ]
+        tasks.append(asyncio.create_task(self._publish_metrics(stop)))
+        try:
+            await asyncio.gather(*tasks)
+            await queue.join()
+        finally:
+            dispatcher.cancel()
+
+    async def poll_once(self):
+        """Polls every network once and dispatches all found alerts"""
+        queue = asyncio.Queue(maxsize=self.max_pending_alerts)
+        dispatcher = asyncio.create_task(self._dispatch(queue))
+        try:
+            await asyncio.gather(*[watcher.poll(queue) for watcher in self.network_watchers])
+            await queue.join()
+        finally:
+            dispatcher.cancel()
+
+    def metrics(self):
+        return {
+            "type": "metrics",
+            "networks": [watcher.metrics() for watcher in self.network_watchers],
+            "dispatch_latency": self.dispatch_latency.summary(),
+        }
+
+    async def _dispatch(self, queue: asyncio.Queue):
+        while True:
+            alert = await queue.get()
+            try:
+                started_at = time.monotonic()
+                await self._emit(alert.to_dict())
+                self.dispatch_latency.add(time.monotonic() - started_at)
+            finally:
+                queue.task_done()
+
+    async def _publish_metrics(self, stop: asyncio.Event):
+        while not stop.is_set():
+            try:
+                await asyncio.wait_for(stop.wait(), timeout=self.metrics_interval)
+            except asyncio.TimeoutError:
+                pass
+            await self._emit(self.metrics())
+
+    async def _emit(self, record):
+        results = await asyncio.gather(
+            *[sink.emit(record) for sink in self.sinks], return_exceptions=True
+        )
+        for sink, result in zip(self.sinks, results):
+            if isinstance(result, Exception):
+                log.error(f"Sink {type(sink).__name__} failed", repr(result))
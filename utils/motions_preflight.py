@@ -0,0 +1,123 @@
+"""Pre-flight simulation of motions queued for creation.
+
+Candidates are created one by one on the local fork, so each of them sees motions created by
+the previous ones and motionsCountLimit is honored. The chain is reverted to a single snapshot
+taken before the first candidate, so the simulation leaves no changes behind.
+"""
+
+from typing import List, NamedTuple, Optional, Sequence
+
+from brownie import accounts, web3 as default_web3
+from brownie.exceptions import VirtualMachineError
+
+from utils.evm_script_factories import DecodedAction, decode_evm_script_actions
+
+CREATE_EVM_SCRIPT_ABI = [
+    {
+        "name": "createEVMScript",
+        "type": "function",
+        "stateMutability": "nonpayable",
+        "inputs": [
+            {"name": "_creator", "type": "address"},
+            {"name": "_evmScriptCallData", "type": "bytes"},
+        ],
+        "outputs": [{"name": "", "type": "bytes"}],
+    }
+]
+
+
+class CandidateMotion(NamedTuple):
+    factory: str
+    evm_script_call_data: str
+    creator: str
+
+
+class PreflightResult(NamedTuple):
+    candidate: CandidateMotion
+    success: bool
+    revert_msg: Optional[str]
+    # None if the creation has failed
+    gas_used: Optional[int]
+    motion_id: Optional[int]
+    evm_script: Optional[str]
+    actions: List[DecodedAction]
+
+    def as_dict(self) -> dict:
+        return {
+            "factory": self.candidate.factory,
+            "creator": self.candidate.creator,
+            "evm_script_call_data": self.candidate.evm_script_call_data,
+            "success": self.success,
+            "revert_msg": self.revert_msg,
+            "gas_used": self.gas_used,
+            "motion_id": self.motion_id,
+            "evm_script": self.evm_script,
+            "actions": [
+                {
+                    "to": action.to,
+                    "method": action.method,
+                    "args": None if action.args is None else [str(arg) for arg in action.args],
+                    "calldata": action.calldata,
+                }
+                for action in self.actions
+            ],
+        }
+
+
+def preflight_motions(
+    easy_track, candidates: Sequence[CandidateMotion], web3=default_web3
+) -> List[PreflightResult]:
+    """Creates candidate motions in sequence and reverts the chain afterwards.
+    Works only on a fork where the creators can be impersonated"""
+    snapshot_id = _rpc(web3, "evm_snapshot")
+    try:
+        return [_preflight(easy_track, candidate, web3) for candidate in candidates]
+    finally:
+        _rpc(web3, "evm_revert", snapshot_id)
+
+
+def _preflight(easy_track, candidate: CandidateMotion, web3) -> PreflightResult:
+    creator = accounts.at(candidate.creator, force=True)
+    try:
+        # the revert message is read from the call, so failing candidates aren't sent
+        easy_track.createMotion.call(
+            candidate.factory, candidate.evm_script_call_data, {"from": creator}
+        )
+    except VirtualMachineError as error:
+        return PreflightResult(
+            candidate, False, error.revert_msg or str(error), None, None, None, []
+        )
+
+    # the factory creates the same EVMScript in the transaction as in the preceding call
+    evm_script = _create_evm_script(candidate, web3)
+    tx = easy_track.createMotion(
+        candidate.factory, candidate.evm_script_call_data, {"from": creator}
+    )
+    event_name = "MotionCreatedCompact" if "MotionCreatedCompact" in tx.events else "MotionCreated"
+    return PreflightResult(
+        candidate,
+        True,
+        None,
+        tx.gas_used,
+        tx.events[event_name]["_motionId"],
+        evm_script,
+        decode_evm_script_actions(evm_script),
+    )
+
+
+def _create_evm_script(candidate: CandidateMotion, web3) -> str:
+    factory = web3.eth.contract(
+        address=web3.toChecksumAddress(candidate.factory), abi=CREATE_EVM_SCRIPT_ABI
+    )
+    evm_script = factory.functions.createEVMScript(
+        web3.toChecksumAddress(candidate.creator),
+        web3.toBytes(hexstr=candidate.evm_script_call_data),
+    ).call()
+    return "0x" + bytes(evm_script).hex()
+
+
+def _rpc(web3, method, *params):
+    response = web3.provider.make_request(method, list(params))
+    if "error" in response:
+        raise ValueError(response["error"])
+    return response["result"]
@@ -0,0 +1,192 @@
+"""Plans submission of pending operations as EasyTrack motions.
+
+Operations for EVMScript factories accepting arrays are packed into as few motions as possible.
+Motions are submitted as soon as a slot under motionsCountLimit is released by the enactment
+of an active motion, so slots never sit idle while the backlog isn't empty.
+"""
+
+import heapq
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import eth_abi
+from brownie import web3 as default_web3
+
+from utils.evm_script_factories import EVM_SCRIPT_CALL_DATA_TYPES
+
+BATCH_FACTORIES = {
+    "TopUpRewardPrograms",
+    "TopUpLegoProgram",
+    "IncreaseNodeOperatorsStakingLimits",
+    "AddRewardPrograms",
+    "RemoveRewardPrograms",
+}
+
+# Index of the item field which must be unique within the motion of batch EVMScript factory.
+# Items of IncreaseNodeOperatorsStakingLimits must also be sorted by this field.
+# Top ups accept repeated recipients and tokens, so their items are packed in order
+BATCH_FACTORIES_KEYS = {
+    "IncreaseNodeOperatorsStakingLimits": 0,
+    "AddRewardPrograms": 0,
+    "RemoveRewardPrograms": 0,
+}
+
+SORTED_BATCH_FACTORIES = {"IncreaseNodeOperatorsStakingLimits"}
+
+DEFAULT_MAX_BATCH_SIZE = 50
+
+
+class PendingOperation(NamedTuple):
+    factory: str
+    # item of the batch for batch EVMScript factories, e.g. (recipient, amount)
+    # for TopUpRewardPrograms, or all arguments of EVMScript call data for other factories
+    args: tuple
+
+
+class PlannedMotion(NamedTuple):
+    factory: str
+    evm_script_call_data: str
+    operations: List[PendingOperation]
+    submit_at: int
+    enact_at: int
+
+
+class Schedule(NamedTuple):
+    start: int
+    motions: List[PlannedMotion]
+
+    @property
+    def makespan(self) -> int:
+        """Seconds from the start until the last planned motion can be enacted"""
+        return max((motion.enact_at for motion in self.motions), default=self.start) - self.start
+
+    def as_dict(self) -> dict:
+        return {
+            "start": self.start,
+            "makespan": self.makespan,
+            "motions": [
+                {
+                    "factory": motion.factory,
+                    "evm_script_call_data": motion.evm_script_call_data,
+                    "operations": len(motion.operations),
+                    "submit_at": motion.submit_at,
+                    "enact_at": motion.enact_at,
+                }
+                for motion in self.motions
+            ],
+        }
+
+
+class MotionsScheduler:
+    """Packs pending operations into motions and plans their submission times.
+    factory_names maps lowercased addresses of EVMScript factories to their contract names"""
+
+    def __init__(
+        self,
+        factory_names: Dict[str, str],
+        max_batch_sizes: Optional[Dict[str, int]] = None,
+    ):
+        self.factory_names = {address.lower(): name for address, name in factory_names.items()}
+        self.max_batch_sizes = max_batch_sizes or {}
+
+    def pack(self, operations: Sequence[PendingOperation]) -> List[List[PendingOperation]]:
+        """Groups operations into motions. Factories keep the order of their first operation"""
+        by_factory: Dict[str, List[PendingOperation]] = {}
+        for operation in operations:
+            by_factory.setdefault(operation.factory.lower(), []).append(operation)
+
+        motions = []
+        for factory, factory_operations in by_factory.items():
+            name = self._factory_name(factory)
+            if name in BATCH_FACTORIES:
+                motions += self._pack_batches(name, factory_operations)
+            else:
+                motions += [[operation] for operation in factory_operations]
+        return motions
+
+    def plan(
+        self,
+        operations: Sequence[PendingOperation],
+        active_motions: Sequence[tuple],
+        motions_count_limit: int,
+        motion_duration: int,
+        now: int,
+    ) -> Schedule:
+        """Plans submission of operations given the active motions as returned by
+        EasyTrack.getMotions(). Passed motions are expected to be enacted at their end"""
+        if motions_count_limit == 0:
+            raise ValueError("Motions can't be created when motionsCountLimit is 0")
+        # end dates of motions occupying the slots
+        slots = [max(now, motion[4] + motion[3]) for motion in active_motions]
+        heapq.heapify(slots)
+        planned = []
+        for motion_operations in self.pack(operations):
+            submit_at = now
+            while len(slots) >= motions_count_limit:
+                submit_at = max(submit_at, heapq.heappop(slots))
+            enact_at = submit_at + motion_duration
+            heapq.heappush(slots, enact_at)
+            planned.append(
+                PlannedMotion(
+                    factory=motion_operations[0].factory,
+                    evm_script_call_data=self.encode_call_data(motion_operations),
+                    operations=motion_operations,
+                    submit_at=submit_at,
+                    enact_at=enact_at,
+                )
+            )
+        return Schedule(start=now, motions=planned)
+
+    def plan_live(
+        self, easy_track, operations: Sequence[PendingOperation], web3=default_web3
+    ) -> Schedule:
+        """Plans submission of operations using the current state of EasyTrack"""
+        return self.plan(
+            operations,
+            easy_track.getMotions(),
+            easy_track.motionsCountLimit(),
+            easy_track.motionDuration(),
+            web3.eth.get_block("latest").timestamp,
+        )
+
+    def encode_call_data(self, operations: Sequence[PendingOperation]) -> str:
+        name = self._factory_name(operations[0].factory)
+        if name in BATCH_FACTORIES:
+            args = tuple(list(field) for field in zip(*[operation.args for operation in operations]))
+        else:
+            args = operations[0].args
+        return "0x" + eth_abi.encode_single(EVM_SCRIPT_CALL_DATA_TYPES[name], args).hex()
+
+    def _pack_batches(self, name, operations) -> List[List[PendingOperation]]:
+        # Items with the same key can't share the motion. The min number of motions is
+        # max(ceil(items / max batch size), max items with the same key). Items grouped by key
+        # are dealt to motions in turn, so items with the same key get into different motions
+        max_batch_size = self.max_batch_sizes.get(name, DEFAULT_MAX_BATCH_SIZE)
+        if name not in BATCH_FACTORIES_KEYS:
+            batches_count = -(-len(operations) // max_batch_size)
+            batch_size = -(-len(operations) // batches_count)
+            return [
+                list(operations[start : start + batch_size])
+                for start in range(0, len(operations), batch_size)
+            ]
+        key_index = BATCH_FACTORIES_KEYS[name]
+        by_key: Dict[object, List[PendingOperation]] = {}
+        for operation in operations:
+            key = operation.args[key_index]
+            by_key.setdefault(key.lower() if isinstance(key, str) else key, []).append(operation)
+        batches_count = max(
+            -(-len(operations) // max_batch_size), max(len(items) for items in by_key.values())
+        )
+        batches: List[List[PendingOperation]] = [[] for _ in range(batches_count)]
+        grouped = [operation for items in by_key.values() for operation in items]
+        for index, operation in enumerate(grouped):
+            batches[index % batches_count].append(operation)
+        if name in SORTED_BATCH_FACTORIES:
+            for batch in batches:
+                batch.sort(key=lambda operation: operation.args[key_index])
+        return batches
+
+    def _factory_name(self, factory: str) -> str:
+        name = self.factory_names.get(factory.lower())
+        if name is None:
+            raise ValueError(f"Unknown EVMScript factory {factory}")
+        return name
@@ -0,0 +1,154 @@
+from collections import OrderedDict
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from brownie import chain, web3 as default_web3
+
+from utils.rpc import batch_eth_call
+
+
+class NodeOperatorState(NamedTuple):
+    id: int
+    active: bool
+    reward_address: str
+    staking_limit: int
+    stopped_validators: int
+    total_signing_keys: int
+    used_signing_keys: int
+
+
+class NodeOperatorsSnapshot:
+    """State of node operators of NodeOperatorsRegistry at the pinned block.
+    Validates staking limits the same way as IncreaseNodeOperatorStakingLimit factory does"""
+
+    def __init__(self, node_operators: Dict[int, NodeOperatorState], block_number: int):
+        self.node_operators = node_operators
+        self.block_number = block_number
+
+    @classmethod
+    def fetch(
+        cls,
+        node_operators_registry,
+        block_number: Optional[int] = None,
+        node_operator_ids: Optional[Sequence[int]] = None,
+        web3=default_web3,
+    ):
+        """Fetches getNodeOperator(id, false) of all node operators in one batch request"""
+        block_number = chain.height if block_number is None else block_number
+        if node_operator_ids is None:
+            node_operator_ids = range(
+                node_operators_registry.getNodeOperatorsCount(block_identifier=block_number)
+            )
+        get_node_operator = node_operators_registry.getNodeOperator
+        outputs = batch_eth_call(
+            [
+                (node_operators_registry.address, get_node_operator.encode_input(id, False))
+                for id in node_operator_ids
+            ],
+            block_number,
+            web3,
+        )
+        node_operators = {}
+        for id, output in zip(node_operator_ids, outputs):
+            if output is None:
+                raise ValueError(
+                    f"getNodeOperator({id}) of {node_operators_registry.address} "
+                    f"failed at block {block_number}"
+                )
+            (
+                active,
+                _,
+                reward_address,
+                staking_limit,
+                stopped_validators,
+                total_signing_keys,
+                used_signing_keys,
+            ) = get_node_operator.decode_output("0x" + output.hex())
+            node_operators[id] = NodeOperatorState(
+                id=id,
+                active=active,
+                reward_address=str(reward_address),
+                staking_limit=staking_limit,
+                stopped_validators=stopped_validators,
+                total_signing_keys=total_signing_keys,
+                used_signing_keys=used_signing_keys,
+            )
+        return cls(node_operators, block_number)
+
+    def max_staking_limits(self) -> Dict[int, Optional[int]]:
+        """Returns max staking limit allowed to set for each node operator or None
+        when staking limit of the node operator can't be increased"""
+        return {
+            id: (
+                node_operator.total_signing_keys
+                if node_operator.active
+                and node_operator.staking_limit < node_operator.total_signing_keys
+                else None
+            )
+            for id, node_operator in self.node_operators.items()
+        }
+
+    def validate(
+        self,
+        node_operator_ids: Sequence[int],
+        staking_limits: Sequence[int],
+        creators: Optional[Sequence[str]] = None,
+    ) -> List[Optional[str]]:
+        """Validates proposed staking limits. Returns the error IncreaseNodeOperatorStakingLimit
+        would revert with for each proposal or None if proposal is valid. When creators aren't
+        passed, reward address of each node operator is expected to create the motion"""
+        if len(node_operator_ids) != len(staking_limits):
+            raise ValueError("node_operator_ids and staking_limits have different lengths")
+        if creators is None:
+            creators = [None] * len(node_operator_ids)
+        return [
+            self._validate(id, staking_limit, creator)
+            for id, staking_limit, creator in zip(node_operator_ids, staking_limits, creators)
+        ]
+
+    def _validate(self, node_operator_id, staking_limit, creator):
+        node_operator = self.node_operators.get(node_operator_id)
+        if node_operator is None:
+            return "NODE_OPERATOR_NOT_FOUND"
+        if creator is not None and node_operator.reward_address.lower() != str(creator).lower():
+            return "CALLER_IS_NOT_NODE_OPERATOR"
+        if not node_operator.active:
+            return "NODE_OPERATOR_DISABLED"
+        if node_operator.staking_limit >= staking_limit:
+            return "STAKING_LIMIT_TOO_LOW"
+        if node_operator.total_signing_keys < staking_limit:
+            return "NOT_ENOUGH_SIGNING_KEYS"
+        return None
+
+
+class NodeOperatorsSnapshots:
+    """LRU cache of snapshots of node operators of NodeOperatorsRegistry. Snapshots are keyed
+    by the hash of the block, so they aren't reused after the chain was reverted or reorged"""
+
+    def __init__(self, node_operators_registry, max_size=128, web3=default_web3):
+        self.node_operators_registry = node_operators_registry
+        self.max_size = max_size
+        self.web3 = web3
+        self._cache: "OrderedDict[tuple, NodeOperatorsSnapshot]" = OrderedDict()
+
+    def get(
+        self,
+        block_number: Optional[int] = None,
+        node_operator_ids: Optional[Sequence[int]] = None,
+    ) -> NodeOperatorsSnapshot:
+        """Returns the cached snapshot at the block or fetches it"""
+        block_number = chain.height if block_number is None else block_number
+        block_hash = self.web3.eth.get_block(block_number).hash
+        cache_key = (
+            bytes(block_hash),
+            None if node_operator_ids is None else tuple(node_operator_ids),
+        )
+        if cache_key in self._cache:
+            self._cache.move_to_end(cache_key)
+            return self._cache[cache_key]
+        snapshot = NodeOperatorsSnapshot.fetch(
+            self.node_operators_registry, block_number, node_operator_ids, self.web3
+        )
+        self._cache[cache_key] = snapshot
+        if len(self._cache) > self.max_size:
+            self._cache.popitem(last=False)
+        return snapshot
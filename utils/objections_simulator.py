@@ -0,0 +1,147 @@
+"""Monte Carlo simulator of the objections to EasyTrack motions.
+
+Every trial samples the set of holders which object to the motion, sums their balances at the
+snapshot block and checks if the motion is rejected the same way as EasyTrack does it:
+HUNDRED_PERCENT * objectionsAmount / totalSupply >= objectionsThreshold. Sums are calculated
+exactly: balances are split into limbs small enough to be summed in float64 without rounding,
+so the matrix product of objections masks and limbs is done with BLAS.
+"""
+
+from typing import Dict, List, NamedTuple, Optional, Sequence, Union
+
+import numpy as np
+from brownie import web3 as default_web3
+
+from utils.events import get_logs, web3_contract
+from utils.rpc import batch_eth_call
+
+HUNDRED_PERCENT = 10000
+SECONDS_PER_DAY = 24 * 60 * 60
+
+# float64 represents integers up to 2 ** 53 exactly
+FLOAT_EXACT_BITS = 53
+
+# max number of elements in the matrix of objection masks processed at once
+CHUNK_ELEMENTS = 2 ** 22
+
+
+class SimulationResult(NamedTuple):
+    trials: int
+    # mapping of the objections threshold in basis points to the rate of rejected motions
+    rejection_rates: Dict[int, float]
+
+    def standard_error(self, threshold: int) -> float:
+        rate = self.rejection_rates[threshold]
+        return (rate * (1 - rate) / self.trials) ** 0.5
+
+
+def participation_for_duration(daily_probability: float, motion_duration: int) -> float:
+    """Returns probability of the objection during the motion duration for the holder
+    which checks motions with the given probability every day"""
+    return 1 - (1 - daily_probability) ** (motion_duration / SECONDS_PER_DAY)
+
+
+def min_rejecting_amount(objections_threshold: int, total_supply: int) -> int:
+    """Returns the min objections amount which rejects the motion.
+    (HUNDRED_PERCENT * amount) // total_supply >= threshold <=> amount >= this value"""
+    return -(-objections_threshold * total_supply // HUNDRED_PERCENT)
+
+
+def simulate_rejection_rates(
+    balances: Sequence[int],
+    total_supply: int,
+    participation: Union[float, Sequence[float]],
+    thresholds: Sequence[int],
+    trials: int = 10 ** 6,
+    seed: Optional[int] = None,
+) -> SimulationResult:
+    """Returns the rate of rejected motions for each of objections thresholds.
+    participation is the probability of objection, common or per each holder"""
+    balances = [int(balance) for balance in balances]
+    probabilities = np.broadcast_to(
+        np.asarray(participation, dtype=np.float64), (len(balances),)
+    )
+    # holders which never object and holders without tokens don't change the result
+    holders = [
+        (balance, probability)
+        for balance, probability in zip(balances, probabilities)
+        if balance > 0 and probability > 0
+    ]
+    limb_bits = FLOAT_EXACT_BITS - max(1, len(holders)).bit_length()
+    if limb_bits <= 0:
+        raise ValueError(f"Too many holders: {len(holders)}")
+    max_amount = max(sum(balances), max(thresholds) * total_supply // HUNDRED_PERCENT + 1)
+    limbs_count = max(1, -(-max_amount.bit_length() // limb_bits))
+
+    limbs = np.array(
+        [_split(balance, limb_bits, limbs_count) for balance, _ in holders], dtype=np.float64
+    ).reshape(len(holders), limbs_count)
+    probabilities = np.array([probability for _, probability in holders], dtype=np.float32)
+    targets = [
+        _split(min_rejecting_amount(threshold, total_supply), limb_bits, limbs_count)
+        for threshold in thresholds
+    ]
+
+    rng = np.random.default_rng(seed)
+    rejections = np.zeros(len(thresholds), dtype=np.int64)
+    chunk_size = max(1, CHUNK_ELEMENTS // max(1, len(holders)))
+    for start in range(0, trials, chunk_size):
+        size = min(chunk_size, trials - start)
+        objected = rng.random((size, len(holders)), dtype=np.float32) < probabilities
+        amounts = _normalize(
+            (objected.astype(np.float64) @ limbs).astype(np.int64), limb_bits
+        )
+        # motion can be rejected only by an objection
+        has_objections = objected.any(axis=1)
+        for index, target in enumerate(targets):
+            rejections[index] += np.count_nonzero(
+                has_objections & _greater_or_equal(amounts, target)
+            )
+
+    return SimulationResult(
+        trials=trials,
+        rejection_rates={
+            threshold: int(count) / trials for threshold, count in zip(thresholds, rejections)
+        },
+    )
+
+
+def token_holders(token, to_block, from_block=0, max_block_range=10000) -> List[str]:
+    """Returns all recipients of the token transfers up to to_block"""
+    transfers = get_logs(
+        web3_contract(token).events.Transfer, from_block, to_block, max_block_range
+    )
+    return sorted({log.args._to for log in transfers})
+
+
+def holder_balances_at(token, holders: Sequence[str], block, web3=default_web3) -> List[int]:
+    """Fetches balanceOfAt(holder, block) of all holders in one batch request"""
+    outputs = batch_eth_call(
+        [(token.address, token.balanceOfAt.encode_input(holder, block)) for holder in holders],
+        block,
+        web3,
+    )
+    return [int.from_bytes(output, "big") for output in outputs]
+
+
+def _split(value: int, limb_bits: int, limbs_count: int) -> List[int]:
+    mask = (1 << limb_bits) - 1
+    return [(value >> (limb_bits * index)) & mask for index in range(limbs_count)]
+
+
+def _normalize(amounts: np.ndarray, limb_bits: int) -> np.ndarray:
+    # moves carries of sums to higher limbs, the highest limb keeps the rest
+    mask = (1 << limb_bits) - 1
+    for index in range(amounts.shape[1] - 1):
+        amounts[:, index + 1] += amounts[:, index] >> limb_bits
+        amounts[:, index] &= mask
+    return amounts
+
+
+def _greater_or_equal(amounts: np.ndarray, target: List[int]) -> np.ndarray:
+    # compares numbers limb by limb starting from the lowest one
+    result = amounts[:, 0] >= target[0]
+    for index in range(1, len(target)):
+        limb = amounts[:, index]
+        result = (limb > target[index]) | ((limb == target[index]) & result)
+    return result
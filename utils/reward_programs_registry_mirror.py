@@ -0,0 +1,94 @@
+from typing import Dict, List, NamedTuple, Optional
+
+from brownie import chain
+from web3 import Web3
+
+from utils import deployed_easy_track
+from utils.events import get_logs, web3_contract
+
+
+class TopUpValidationError(NamedTuple):
+    index: Optional[int]
+    reason: str
+
+
+class RewardProgramsRegistryMirror:
+    """In-memory copy of the RewardProgramsRegistry built from its
+    RewardProgramAdded and RewardProgramRemoved logs"""
+
+    def __init__(self, reward_programs_registry, start_block=0, max_block_range=10000):
+        self.reward_programs_registry = reward_programs_registry
+        self.max_block_range = max_block_range
+        # checksum address of the reward program -> title
+        self.reward_programs: Dict[str, str] = {}
+        self._next_block = start_block
+        self._events = web3_contract(reward_programs_registry).events
+
+    def sync(self, to_block=None):
+        """Applies registry logs emitted since the previous sync up to to_block (latest by default)"""
+        to_block = chain.height if to_block is None else to_block
+        logs = get_logs(
+            self._events.RewardProgramAdded,
+            self._next_block,
+            to_block,
+            self.max_block_range,
+        ) + get_logs(
+            self._events.RewardProgramRemoved,
+            self._next_block,
+            to_block,
+            self.max_block_range,
+        )
+        for log in sorted(logs, key=lambda log: (log.blockNumber, log.logIndex)):
+            reward_program = Web3.toChecksumAddress(log.args._rewardProgram)
+            if log.event == "RewardProgramAdded":
+                self.reward_programs[reward_program] = log.args._title
+            else:
+                self.reward_programs.pop(reward_program, None)
+        self._next_block = max(self._next_block, to_block + 1)
+        return self
+
+    def is_reward_program(self, address):
+        return Web3.toChecksumAddress(address) in self.reward_programs
+
+    def validate_top_up(self, reward_programs, amounts) -> List[TopUpValidationError]:
+        """Validates payout list the same way as TopUpRewardPrograms does on motion creation.
+        Returns all found errors instead of the first one"""
+        if len(reward_programs) != len(amounts):
+            return [TopUpValidationError(None, "LENGTH_MISMATCH")]
+        if len(reward_programs) == 0:
+            return [TopUpValidationError(None, "EMPTY_DATA")]
+        errors = []
+        for index, (reward_program, amount) in enumerate(zip(reward_programs, amounts)):
+            if amount <= 0:
+                errors.append(TopUpValidationError(index, "ZERO_AMOUNT"))
+            if not self.is_reward_program(reward_program):
+                errors.append(TopUpValidationError(index, "REWARD_PROGRAM_NOT_ALLOWED"))
+        return errors
+
+    def is_in_sync(self):
+        """Compares the mirror with the current list of reward programs in the registry"""
+        return set(self.reward_programs) == {
+            Web3.toChecksumAddress(address)
+            for address in self.reward_programs_registry.getRewardPrograms()
+        }
+
+
+def registry_mirrors(
+    network="mainnet", start_block: Optional[int] = None
+) -> Dict[str, RewardProgramsRegistryMirror]:
+    """Returns synced mirrors of reward_programs and referral_partners registries of deployed
+    EasyTrack. Logs are collected from the deployment of each registry by default"""
+    contracts = deployed_easy_track.contracts(network)
+    mirrors = {}
+    for name, reward_programs in [
+        ("reward_programs", contracts.reward_programs),
+        ("referral_partners", contracts.referral_partners),
+    ]:
+        registry = reward_programs.reward_programs_registry
+        mirrors[name] = RewardProgramsRegistryMirror(
+            registry,
+            deployed_easy_track.deployment_block(registry.address)
+            if start_block is None
+            else start_block,
+        ).sync()
+    return mirrors
@@ -0,0 +1,81 @@
+from typing import List, Optional, Tuple
+
+import requests
+from brownie import web3 as default_web3
+from web3 import HTTPProvider
+
+TX_BASE_GAS = 21000
+ZERO_BYTE_GAS = 4
+NON_ZERO_BYTE_GAS = 16
+
+
+class BatchCallError(Exception):
+    pass
+
+
+def batch_eth_call(
+    calls: List[Tuple[str, str]], block_identifier="latest", web3=default_web3
+) -> List[Optional[bytes]]:
+    """Sends eth_call for each (to, data) pair in a single JSON-RPC batch request.
+    Returns raw output of each call or None if the call has failed.
+    Falls back to sequential calls when provider doesn't support batches."""
+    results = _batch_request("eth_call", calls, block_identifier, web3, _eth_call)
+    return [None if result is None else bytes.fromhex(result[2:]) for result in results]
+
+
+def batch_estimate_gas(
+    calls: List[Tuple[str, str]], block_identifier="latest", web3=default_web3
+) -> List[Optional[int]]:
+    """Sends eth_estimateGas for each (to, data) pair in a single JSON-RPC batch request.
+    Returns gas of each call or None if the call has failed"""
+    results = _batch_request("eth_estimateGas", calls, block_identifier, web3, _estimate_gas)
+    return [None if result is None else int(result, 16) for result in results]
+
+
+def intrinsic_gas(data: str) -> int:
+    """Returns gas paid by the transaction with given data before the execution"""
+    data = bytes.fromhex(data[2:] if data[0:2] == "0x" else data)
+    zero_bytes = data.count(0)
+    return TX_BASE_GAS + ZERO_BYTE_GAS * zero_bytes + NON_ZERO_BYTE_GAS * (len(data) - zero_bytes)
+
+
+def _batch_request(method, calls, block_identifier, web3, fallback) -> List[Optional[str]]:
+    if isinstance(block_identifier, int):
+        block_identifier = hex(block_identifier)
+    params = [
+        [{"to": to, "data": data}, block_identifier] for to, data in calls
+    ]
+    if not isinstance(web3.provider, HTTPProvider):
+        return [fallback(web3, *call_params) for call_params in params]
+
+    response = requests.post(
+        web3.provider.endpoint_uri,
+        json=[
+            {"jsonrpc": "2.0", "id": index, "method": method, "params": call_params}
+            for index, call_params in enumerate(params)
+        ],
+        timeout=120,
+    )
+    response.raise_for_status()
+    results = response.json()
+    if not isinstance(results, list):
+        raise BatchCallError(f"Batch request failed: {results}")
+    outputs = [None] * len(calls)
+    for result in results:
+        if "result" in result:
+            outputs[result["id"]] = result["result"]
+    return outputs
+
+
+def _eth_call(web3, tx, block_identifier):
+    try:
+        return "0x" + bytes(web3.eth.call(tx, block_identifier)).hex()
+    except ValueError:
+        return None
+
+
+def _estimate_gas(web3, tx, block_identifier):
+    try:
+        return hex(web3.eth.estimate_gas(tx, block_identifier))
+    except ValueError:
+        return None
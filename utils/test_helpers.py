@@ -17,3 +17,12 @@ def access_controll_revert_message(sender, role=DEFAULT_ADMIN_ROLE):
 def assert_equals(desc, actual, expected):
     assert actual == expected
     log.ok(desc, actual)
+
+
+def storage_slots_written(tx, address):
+    """Returns set of storage slots written by SSTORE opcodes of the contract at the given address"""
+    return {
+        step["stack"][-1]
+        for step in tx.trace
+        if step["op"] == "SSTORE" and step["address"] == address
+    }
@@ -0,0 +1,151 @@
+"""Splits payouts of top up EVMScript factories into motions under the gas ceiling.
+
+Gas used by createMotion and enactMotion of TopUpRewardPrograms and TopUpLegoProgram grows
+linearly with the number of recipients. The cost model is fitted on gas measured with real
+transactions on a local chain, so the planner doesn't depend on hardcoded opcode prices.
+"""
+
+import csv
+from decimal import Decimal
+from typing import List, NamedTuple, Sequence, Tuple
+
+import eth_abi
+from brownie import chain
+
+from utils.evm_script_factories import EVM_SCRIPT_CALL_DATA_TYPES
+
+# Both top up factories accept the same call data: recipients (or tokens) and amounts
+TOP_UP_CALL_DATA_TYPE = EVM_SCRIPT_CALL_DATA_TYPES["TopUpRewardPrograms"]
+
+DEFAULT_MEASURED_SIZES = (1, 5, 10, 20)
+
+
+class LinearGasModel(NamedTuple):
+    base: int
+    per_item: int
+
+    def predict(self, items_count: int) -> int:
+        return self.base + self.per_item * items_count
+
+    def max_items(self, gas_ceiling: int) -> int:
+        if self.per_item <= 0:
+            raise ValueError("Gas used must grow with the number of items")
+        return max(0, (gas_ceiling - self.base) // self.per_item)
+
+
+class TopUpGasModel(NamedTuple):
+    create_motion: LinearGasModel
+    enact_motion: LinearGasModel
+
+    def max_items(self, gas_ceiling: int) -> int:
+        """Returns max number of recipients in the motion which keeps gas used by both
+        createMotion and enactMotion under the ceiling"""
+        return min(
+            self.create_motion.max_items(gas_ceiling), self.enact_motion.max_items(gas_ceiling)
+        )
+
+
+class PlannedTopUp(NamedTuple):
+    recipients: List[str]
+    amounts: List[int]
+    evm_script_call_data: str
+    create_motion_gas: int
+    enact_motion_gas: int
+
+
+def fit_linear_gas_model(samples: Sequence[Tuple[int, int]]) -> LinearGasModel:
+    """Fits (items_count, gas_used) samples with least squares. The slope is rounded up and
+    the base is raised to the max residual, so the model never underestimates the samples"""
+    if len({items_count for items_count, _ in samples}) < 2:
+        raise ValueError("At least two different numbers of items must be measured")
+    count = len(samples)
+    mean_x = sum(items_count for items_count, _ in samples) / count
+    mean_y = sum(gas_used for _, gas_used in samples) / count
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in samples)
+    variance = sum((x - mean_x) ** 2 for x, _ in samples)
+    per_item = -int(-covariance // variance)
+    base = max(gas_used - per_item * items_count for items_count, gas_used in samples)
+    return LinearGasModel(base=base, per_item=per_item)
+
+
+def measure_top_up_gas(
+    easy_track, top_up_factory, trusted_caller, recipients, sizes=DEFAULT_MEASURED_SIZES, amount=1
+) -> TopUpGasModel:
+    """Creates and enacts top up motions for the first `size` recipients for each of sizes
+    and fits the cost model on gas used. All sent transactions are undone afterwards"""
+    create_samples, enact_samples = [], []
+    motion_duration = easy_track.motionDuration()
+    transactions_count = 0
+    try:
+        for size in sizes:
+            call_data = encode_top_up_call_data(recipients[:size], [amount] * size)
+            create_tx = easy_track.createMotion(
+                top_up_factory, call_data, {"from": trusted_caller}
+            )
+            transactions_count += 1
+            chain.sleep(motion_duration + 1)
+            enact_tx = easy_track.enactMotion(
+                create_tx.events["MotionCreated"]["_motionId"],
+                call_data,
+                {"from": trusted_caller},
+            )
+            transactions_count += 1
+            create_samples.append((size, create_tx.gas_used))
+            enact_samples.append((size, enact_tx.gas_used))
+    finally:
+        if transactions_count > 0:
+            chain.undo(transactions_count)
+    return TopUpGasModel(
+        create_motion=fit_linear_gas_model(create_samples),
+        enact_motion=fit_linear_gas_model(enact_samples),
+    )
+
+
+def read_payouts_csv(path) -> List[Tuple[str, int]]:
+    """Reads (recipient, amount in wei) rows. The header row is optional"""
+    payouts = []
+    with open(path, newline="") as file:
+        for row in csv.reader(file):
+            if not row or not row[0].strip():
+                continue
+            recipient, amount = row[0].strip(), row[1].strip()
+            if not recipient.startswith("0x"):
+                if payouts:
+                    raise ValueError(f"Invalid recipient {recipient}")
+                continue
+            payouts.append((recipient, int(Decimal(amount))))
+    return payouts
+
+
+def encode_top_up_call_data(recipients: Sequence[str], amounts: Sequence[int]) -> str:
+    return (
+        "0x"
+        + eth_abi.encode_single(TOP_UP_CALL_DATA_TYPE, [list(recipients), list(amounts)]).hex()
+    )
+
+
+def plan_top_up_motions(
+    payouts: Sequence[Tuple[str, int]], gas_model: TopUpGasModel, gas_ceiling: int
+) -> List[PlannedTopUp]:
+    """Splits payouts into the min number of motions with gas used under the ceiling.
+    Payouts keep their order and are spread evenly, so motions differ by one item at most"""
+    max_items = gas_model.max_items(gas_ceiling)
+    if max_items == 0:
+        raise ValueError(f"Motion with a single payout doesn't fit into {gas_ceiling} gas")
+    motions_count = -(-len(payouts) // max_items)
+    planned, start = [], 0
+    for index in range(motions_count):
+        size = len(payouts) // motions_count + (index < len(payouts) % motions_count)
+        recipients = [recipient for recipient, _ in payouts[start : start + size]]
+        amounts = [amount for _, amount in payouts[start : start + size]]
+        start += size
+        planned.append(
+            PlannedTopUp(
+                recipients=recipients,
+                amounts=amounts,
+                evm_script_call_data=encode_top_up_call_data(recipients, amounts),
+                create_motion_gas=gas_model.create_motion.predict(size),
+                enact_motion_gas=gas_model.enact_motion.predict(size),
+            )
+        )
+    return planned
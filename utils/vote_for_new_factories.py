@@ -1,9 +1,15 @@
-from typing import NamedTuple, List, Dict
+from typing import NamedTuple, List, Dict, Optional, Sequence
 from utils import lido, log
 from utils.config import prompt_bool
 from utils.evm_script import encode_call_script
+from utils.rpc import intrinsic_gas
 
-from brownie import (Contract, EasyTrack)
+from brownie import (Contract, EasyTrack, accounts, chain, web3)
+
+# Upper bound of gas spent by CallsScript on one action: the cold access to the target,
+# parsing of the action and copying of its calldata into memory
+CALLS_SCRIPT_CALL_GAS = 4000
+CALLS_SCRIPT_WORD_GAS = 6
 
 class FactoryToAdd(NamedTuple):
     factory: Contract
@@ -12,6 +18,75 @@ class FactoryToAdd(NamedTuple):
 class FactoryToRemove(NamedTuple):
     factory: Contract
 
+class OmnibusItem(NamedTuple):
+    description: str
+    target: str
+    calldata: str
+
+def omnibus_items(
+    easy_track: EasyTrack,
+    factories_to_add: List[FactoryToAdd],
+    factories_to_remove: List[FactoryToRemove],
+) -> List[OmnibusItem]:
+    """Returns items of the omnibus vote in the order of execution.
+    Removals go first, so factories can be re-added with new permissions"""
+    return [
+        OmnibusItem(
+            description=f'Remove {elem.factory} factory',
+            target=easy_track.address,
+            calldata=easy_track.removeEVMScriptFactory.encode_input(elem.factory),
+        )
+        for elem in factories_to_remove
+    ] + [
+        OmnibusItem(
+            description=f'Add {elem.factory} factory',
+            target=easy_track.address,
+            calldata=easy_track.addEVMScriptFactory.encode_input(
+                elem.factory,
+                elem.permissions
+            ),
+        )
+        for elem in factories_to_add
+    ]
+
+def estimate_items_gas(items: Sequence[OmnibusItem], network: str = "mainnet") -> List[int]:
+    """Estimates gas of the execution of each item by the vote. Works only on a fork:
+    items are estimated and sent one by one from the Voting, so each of them sees the changes
+    made by the previous ones. All sent transactions are undone afterwards. Refunds for cleared
+    storage are applied once per transaction, so items are estimated before the refund"""
+    voting = accounts.at(lido.contracts(network=network).aragon.voting.address, force=True)
+    estimations = []
+    transactions_count = 0
+    try:
+        for item in items:
+            gas = web3.eth.estimate_gas(
+                {"from": voting.address, "to": item.target, "data": item.calldata}
+            )
+            # the intrinsic gas of the transaction isn't paid when the same call
+            # is made by CallsScript during the vote execution
+            estimations.append(gas - intrinsic_gas(item.calldata) + _call_gas(item.calldata))
+            transactions_count += 1
+            voting.transfer(item.target, 0, data=item.calldata)
+    finally:
+        if transactions_count > 0:
+            chain.undo(transactions_count)
+    return estimations
+
+def split_items(items_gas: Sequence[int], gas_budget: int) -> List[List[int]]:
+    """Splits indices of items into the fewest votes with the sum of items gas under
+    the budget. Items keep the order: each vote holds the next items after the previous one"""
+    votes: List[List[int]] = []
+    vote_gas = 0
+    for index, item_gas in enumerate(items_gas):
+        if item_gas > gas_budget:
+            raise ValueError(f'Item {index + 1} requires {item_gas} gas, budget is {gas_budget}')
+        if not votes or vote_gas + item_gas > gas_budget:
+            votes.append([])
+            vote_gas = 0
+        votes[-1].append(index)
+        vote_gas += item_gas
+    return votes
+
 def create_voting_on_new_factories(
     easy_track: EasyTrack,
     factories_to_add: List[FactoryToAdd],
@@ -19,51 +94,68 @@ def create_voting_on_new_factories(
     network: str,
     tx_params: Dict[str, str]
 ) -> int:
-    factories_evm_script: str = encode_call_script(
-        [
-            (
-                easy_track.address,
-                easy_track.removeEVMScriptFactory.encode_input(
-                    elem.factory
-                )
-            )
-            for elem in factories_to_remove
-        ] +
-        [
-            (
-                easy_track.address,
-                easy_track.addEVMScriptFactory.encode_input(
-                    elem.factory,
-                    elem.permissions
-                )
-            )
-            for elem in factories_to_add
-        ]
-    )
+    items = omnibus_items(easy_track, factories_to_add, factories_to_remove)
+    vote_ids = _create_votings(items, [list(range(len(items)))], None, network, tx_params)
+    return vote_ids[0] if vote_ids else -1
 
-    description: str = 'Omnibus vote:'
-    item_id: int = 1
-    for elem in factories_to_remove:
-        description += f'{item_id}) Remove {elem.factory} factory;'
-        item_id = item_id + 1
+def create_votings_on_new_factories(
+    easy_track: EasyTrack,
+    factories_to_add: List[FactoryToAdd],
+    factories_to_remove: List[FactoryToRemove],
+    network: str,
+    tx_params: Dict[str, str],
+    gas_budget: int,
+    items_gas: Optional[List[int]] = None,
+) -> List[int]:
+    """Splits the omnibus vote into the fewest votes with execution gas under the budget.
+    Gas of items is estimated on the fork if not passed. Votes must be executed in order"""
+    items = omnibus_items(easy_track, factories_to_add, factories_to_remove)
+    if items_gas is None:
+        items_gas = estimate_items_gas(items, network)
+    votes = split_items(items_gas, gas_budget)
+    return _create_votings(items, votes, items_gas, network, tx_params)
 
-    for elem in factories_to_add:
-        description += f'{item_id}) Add {elem.factory} factory;'
-        item_id = item_id + 1
-    description = description[:-1] + '.'
+def _create_votings(
+    items: List[OmnibusItem],
+    votes: List[List[int]],
+    items_gas: Optional[List[int]],
+    network: str,
+    tx_params: Dict[str, str]
+) -> List[int]:
+    descriptions = [_description(items, vote) for vote in votes]
 
-    print(description.replace(';', '\n'))
+    for vote_number, (vote, description) in enumerate(zip(votes, descriptions), start=1):
+        if len(votes) > 1:
+            log.nb(f'Vote {vote_number} of {len(votes)}')
+        print(description.replace(';', '\n'))
+        if items_gas is not None:
+            log.ok('Estimated execution gas', sum(items_gas[index] for index in vote))
 
     print("Proceed to create vote? [yes/no]: ")
 
     if not prompt_bool():
         log.nb("Aborting")
-        return -1
-
-    vote_id, _ = lido.create_voting(
-        evm_script=factories_evm_script,
-        description=description,
-        network=network,
-        tx_params=tx_params,
-    )
-    return vote_id
+        return []
+
+    vote_ids = []
+    for vote, description in zip(votes, descriptions):
+        vote_id, _ = lido.create_voting(
+            evm_script=encode_call_script(
+                [(items[index].target, items[index].calldata) for index in vote]
+            ),
+            description=description,
+            network=network,
+            tx_params=tx_params,
+        )
+        vote_ids.append(vote_id)
+    return vote_ids
+
+def _description(items: List[OmnibusItem], vote: List[int]) -> str:
+    description: str = 'Omnibus vote:'
+    for item_id, index in enumerate(vote, start=1):
+        description += f'{item_id}) {items[index].description};'
+    return description[:-1] + '.'
+
+def _call_gas(calldata: str) -> int:
+    words = -(-(len(calldata) - 2) // 64)
+    return CALLS_SCRIPT_CALL_GAS + CALLS_SCRIPT_WORD_GAS * words